@@ -0,0 +1 @@
+"""Benchmarks for the snake game's hot paths (run with ``python -m``)."""
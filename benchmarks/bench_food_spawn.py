@@ -0,0 +1,68 @@
+"""Food spawn latency against board occupancy.
+
+Compares the original rejection sampling (random cell, then a linear scan of
+the body) with the FreeCells index used by SnakeEngine.
+
+    python -m benchmarks.bench_food_spawn
+"""
+import random
+import time
+
+from snake_game.config import GRID_COLS, GRID_ROWS
+from snake_game.freecells import FreeCells
+
+OCCUPANCIES = [0.0, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99]
+SAMPLES = 2000
+
+
+def build_board(occupancy, rng):
+    size = GRID_COLS * GRID_ROWS
+    taken = rng.sample(range(size), int(size * occupancy))
+    free_cells = FreeCells(size)
+    for cell in taken:
+        free_cells.remove(cell)
+    body = [(cell % GRID_COLS, cell // GRID_COLS) for cell in taken]
+    return body, free_cells
+
+
+def spawn_rejection(body, rng):
+    while True:
+        food = (rng.randrange(GRID_COLS), rng.randrange(GRID_ROWS))
+        if food not in body:
+            return food
+
+
+def spawn_free_cells(free_cells, rng):
+    cell = free_cells.sample(rng)
+    return (cell % GRID_COLS, cell // GRID_COLS)
+
+
+def time_per_call(fn, arg, rng, samples=SAMPLES):
+    start = time.perf_counter()
+    for _ in range(samples):
+        fn(arg, rng)
+    return (time.perf_counter() - start) / samples
+
+
+def run(samples=SAMPLES, seed=0):
+    rng = random.Random(seed)
+    results = []
+    for occupancy in OCCUPANCIES:
+        body, free_cells = build_board(occupancy, rng)
+        results.append({
+            "occupancy": occupancy,
+            "rejection_us": time_per_call(spawn_rejection, body, rng, samples) * 1e6,
+            "free_cells_us": time_per_call(spawn_free_cells, free_cells, rng, samples) * 1e6,
+        })
+    return results
+
+
+def main():
+    print(f"Board {GRID_COLS}x{GRID_ROWS}, {SAMPLES} spawns per point")
+    print(f"{'occupancy':>10} {'rejection (us)':>16} {'free cells (us)':>16}")
+    for row in run():
+        print(f"{row['occupancy']:>10.0%} {row['rejection_us']:>16.2f} {row['free_cells_us']:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
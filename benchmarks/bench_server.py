@@ -0,0 +1,102 @@
+"""Load test for the room server with simulated clients on localhost.
+
+    python -m benchmarks.bench_server --rooms 200 --spectators 2 --seconds 10
+
+Runs a GameServer in this process, connects one player and some spectators
+per room, and has players turn at random and restart after dying.  Reports
+the server's scheduler cost and lateness, message throughput, and how far
+the gaps between tick messages seen by clients stray from the room speed.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from snake_game.engine import DIED, LEVEL_UP, WON, speed_for_level
+from snake_game.profiler import RollingStats
+from snake_game.server import GameServer
+
+DIRECTIONS = ["Up", "Down", "Left", "Right"]
+
+
+async def simulated_client(port, room, player, stop, jitter, rng):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write((json.dumps({"type": "join", "room": room}) + "\n").encode())
+    speed = None
+    last = None
+    try:
+        while not stop.is_set():
+            line = await reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            now = time.perf_counter()
+            if message["type"] == "state":
+                speed = message["speed"]
+                last = None
+            elif message["type"] == "tick":
+                if last is not None:
+                    jitter.add(abs((now - last) * 1000 - speed))
+                last = now
+                for name, value in message["events"]:
+                    if name == LEVEL_UP:
+                        speed = speed_for_level(value)
+                    elif name in (DIED, WON) and player:
+                        writer.write(b'{"type": "restart"}\n')
+                if player and rng.random() < 0.2:
+                    writer.write((json.dumps({"type": "turn", "direction": rng.choice(DIRECTIONS)}) + "\n").encode())
+    finally:
+        writer.close()
+
+
+async def load_test(rooms, spectators, seconds, port):
+    server = GameServer()
+    listener = await asyncio.start_server(server.handle_client, "127.0.0.1", port)
+    port = listener.sockets[0].getsockname()[1]
+    scheduler = asyncio.create_task(server.run())
+
+    stop = asyncio.Event()
+    jitter = RollingStats(10000)
+    rng = random.Random(0)
+    clients = []
+    for room in range(rooms):
+        # Players connect first so they get control of their room
+        clients.append(asyncio.create_task(simulated_client(port, f"room{room}", True, stop, jitter, rng)))
+        await asyncio.sleep(0)
+        for _ in range(spectators):
+            clients.append(asyncio.create_task(simulated_client(port, f"room{room}", False, stop, jitter, rng)))
+
+    await asyncio.sleep(1.0)  # Let everyone join before measuring
+    start_steps, start_bytes = server.steps, server.bytes_sent
+    await asyncio.sleep(seconds)
+    stats = server.stats()
+    stats["steps_per_s"] = (server.steps - start_steps) / seconds
+    stats["mbytes_per_s"] = (server.bytes_sent - start_bytes) / seconds / 1e6
+    stats["client_jitter_p50"] = jitter.percentile(50)
+    stats["client_jitter_p99"] = jitter.percentile(99)
+
+    stop.set()
+    scheduler.cancel()
+    listener.close()
+    for client in clients:
+        client.cancel()
+    await asyncio.gather(*clients, scheduler, return_exceptions=True)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Room server load test")
+    parser.add_argument("--rooms", type=int, default=100)
+    parser.add_argument("--spectators", type=int, default=2, help="spectators per room")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--port", type=int, default=0, help="0 picks a free port")
+    args = parser.parse_args()
+
+    stats = asyncio.run(load_test(args.rooms, args.spectators, args.seconds, args.port))
+    for name, value in stats.items():
+        print(f"{name:20} {value:12.3f}" if isinstance(value, float) else f"{name:20} {value:12}")
+
+
+if __name__ == "__main__":
+    main()
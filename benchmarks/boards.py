@@ -0,0 +1,40 @@
+"""Board setups shared by the benchmarks."""
+from snake_game.autopilot import hamiltonian_cycle
+
+
+def cycle_cells(cols, rows):
+    # The autopilot's Hamiltonian cycle as (col, row) cells in order from (0, 0)
+    successor = hamiltonian_cycle(cols, rows)
+    if successor is None:
+        raise ValueError(f"a {cols}x{rows} board has no Hamiltonian cycle")
+    cells = [0]
+    for _ in range(cols * rows - 1):
+        cells.append(successor[cells[-1]])
+    return [(cell % cols, cell // cols) for cell in cells]
+
+
+def place_snake(engine, cells, food=None):
+    engine.set_body(cells)
+    if food is None:
+        engine.create_food()
+    else:
+        engine.food = food
+
+
+def snake_on_cycle(engine, length):
+    # Lay a snake of the given length along the Hamiltonian cycle and return
+    # the cycle with a lookup of the direction to take from each cell
+    cycle = cycle_cells(engine.cols, engine.rows)
+    body = [cycle[i] for i in range(length - 1, -1, -1)]
+    place_snake(engine, body)
+    engine.direction = direction_between(cycle[length - 2], cycle[length - 1]) if length > 1 else "Right"
+    next_direction = {
+        cell: direction_between(cell, cycle[(i + 1) % len(cycle)])
+        for i, cell in enumerate(cycle)
+    }
+    return next_direction
+
+
+def direction_between(a, b):
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    return {(0, -1): "Up", (0, 1): "Down", (-1, 0): "Left", (1, 0): "Right"}[(dx, dy)]
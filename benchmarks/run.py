@@ -0,0 +1,383 @@
+"""Benchmark suite for the game's hot paths.
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --compare baseline.json results.json
+
+Covers engine tick throughput against snake length, create_food() latency
+against board occupancy, snapshot save/load and clone() cost against snake
+length, autopilot planning time per move on each board size, headless
+rasterizer frames per second (drawing and PNG encoding), frame cost
+against snake length (both the incremental per-frame path and the
+draw_objects() full repaint), frame cost on each board size (boards larger
+than the window scroll), screen-switch latency of the menus, timer wakeups
+per second in each idle state and cold start up to the first frame of the
+main menu.  The Tk benchmarks need a display (run under ``xvfb-run`` on
+headless machines) and are skipped without one.
+
+Every metric is stored as ``{"value", "unit", "better"}`` so that compare
+mode knows which direction is a regression.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from snake_game import snapshot
+from snake_game.autopilot import Planner, hamiltonian_cycle
+from snake_game.config import BOARD_SIZES, BOX_SIZE, MIN_SPEED
+from snake_game.engine import SnakeEngine
+from snake_game.raster import Rasterizer
+
+from .boards import place_snake, snake_on_cycle
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SNAKE_LENGTHS = [3, 50, 200, 800]
+OCCUPANCIES = [0.0, 0.5, 0.9, 0.99]
+NO_FOOD = (-1, -1)  # Keeps the snake length fixed while timing movement
+FRAMES_PER_TICK = 3  # Interpolated frames rendered per move in the frame benchmarks
+
+
+def metric(value, unit, better):
+    return {"value": value, "unit": unit, "better": better}
+
+
+def best_of(repeats, fn):
+    # Minimum of several runs is the most stable estimate of the true cost
+    return min(fn() for _ in range(repeats))
+
+
+# ---------------- ENGINE BENCHMARKS ----------------
+def bench_tick_throughput(ticks=20000, repeats=3):
+    results = {}
+    for length in SNAKE_LENGTHS:
+        def run():
+            engine = SnakeEngine(seed=0)
+            next_direction = snake_on_cycle(engine, length)
+            engine.food = NO_FOOD
+            start = time.perf_counter()
+            for _ in range(ticks):
+                engine.step(next_direction[engine.snake[0]])
+            return time.perf_counter() - start
+        results[f"tick_throughput[len={length}]"] = metric(ticks / best_of(repeats, run), "ticks/s", "higher")
+    return results
+
+
+def bench_create_food(samples=2000, repeats=3):
+    results = {}
+    rng = random.Random(0)
+    for occupancy in OCCUPANCIES:
+        engine = SnakeEngine(seed=0)
+        size = engine.cols * engine.rows
+        cells = rng.sample(range(size), max(3, int(size * occupancy)))
+        place_snake(engine, [(cell % engine.cols, cell // engine.cols) for cell in cells])
+
+        def run():
+            start = time.perf_counter()
+            for _ in range(samples):
+                engine.create_food()
+            return time.perf_counter() - start
+        results[f"create_food[occupancy={occupancy:.0%}]"] = metric(best_of(repeats, run) / samples * 1e6, "us", "lower")
+    return results
+
+
+def bench_snapshots(repeats=3, samples=200):
+    results = {}
+    for length in SNAKE_LENGTHS:
+        engine = SnakeEngine(seed=0)
+        snake_on_cycle(engine, length)
+        data = snapshot.dumps(engine)
+        for name, fn in [
+            ("snapshot_save", lambda: snapshot.dumps(engine)),
+            ("snapshot_load", lambda: snapshot.loads(data)),
+            ("clone", engine.clone),
+        ]:
+            def run():
+                start = time.perf_counter()
+                for _ in range(samples):
+                    fn()
+                return time.perf_counter() - start
+            results[f"{name}[len={length}]"] = metric(best_of(repeats, run) / samples * 1e6, "us", "lower")
+    return results
+
+
+def bench_autopilot(ticks=2000):
+    # One seeded game per board; the plan must fit in a share of the fastest tick
+    results = {}
+    for cols, rows in BOARD_SIZES:
+        engine = SnakeEngine(cols, rows, seed=0)
+        planner = Planner()
+        hamiltonian_cycle(cols, rows)  # Built once per board size, not per move
+        times = []
+        while engine.alive and engine.ticks < ticks:
+            start = time.perf_counter()
+            direction = planner.plan(engine, start + MIN_SPEED / 2000)
+            times.append(time.perf_counter() - start)
+            engine.step(direction)
+        times.sort()
+        for p in (50, 99):
+            results[f"autopilot_plan[board={cols}x{rows},p{p}]"] = metric(
+                times[min(len(times) - 1, len(times) * p // 100)] * 1e3, "ms", "lower")
+    return results
+
+
+def bench_raster(frames=200, repeats=3, length=200):
+    # Frames per second of the headless rasterizer while the snake moves
+    results = {}
+    for box in (BOX_SIZE, 4):
+        engine = SnakeEngine(seed=0)
+        next_direction = snake_on_cycle(engine, length)
+        engine.food = None  # Keeps the length fixed; NO_FOOD would be drawn off the board
+        raster = Rasterizer(engine.cols, engine.rows, box)
+
+        def draw():
+            start = time.perf_counter()
+            for _ in range(frames):
+                engine.step(next_direction[engine.snake[0]])
+                raster.draw(engine)
+            return time.perf_counter() - start
+
+        pixels = raster.draw(engine)
+
+        def encode():
+            start = time.perf_counter()
+            for _ in range(frames):
+                raster.to_png(pixels)
+            return time.perf_counter() - start
+
+        results[f"raster_draw[box={box}]"] = metric(frames / best_of(repeats, draw), "frames/s", "higher")
+        results[f"raster_png[box={box}]"] = metric(frames / best_of(repeats, encode), "frames/s", "higher")
+    return results
+
+
+# ---------------- TK BENCHMARKS ----------------
+def load_game():
+    # Builds the Tk front end; raises tkinter.TclError without a display.
+    # Scores go to a scratch database, not the player's.
+    os.environ["SNAKE_SCORES"] = os.path.join(tempfile.mkdtemp(), "scores.db")
+    from snake_game import app
+    app.create_window()
+    return app
+
+
+def run_frames(game, length, frames, full_repaint=False):
+    engine = game.engine
+    next_direction = snake_on_cycle(engine, length)
+    engine.food = NO_FOOD
+    game.draw_objects()
+    game.root.update_idletasks()
+    start = time.perf_counter()
+    for frame in range(frames):
+        if frame % FRAMES_PER_TICK == 0:
+            engine.change_direction(next_direction[engine.snake[0]])
+            game.game_tick()
+        if full_repaint:
+            game.draw_objects()
+        else:
+            game.render_frame((frame % FRAMES_PER_TICK + 1) / FRAMES_PER_TICK)
+        game.root.update_idletasks()
+    return time.perf_counter() - start
+
+
+def bench_frames(game, frames=300, repeats=3):
+    results = {}
+    game.start_game()
+    game.game_loop.stop()
+    for length in SNAKE_LENGTHS:
+        results[f"render_frame[len={length}]"] = metric(
+            best_of(repeats, lambda: run_frames(game, length, frames)) / frames * 1e3, "ms/frame", "lower")
+        results[f"draw_objects[len={length}]"] = metric(
+            best_of(repeats, lambda: run_frames(game, length, frames, True)) / frames * 1e3, "ms/frame", "lower")
+    return results
+
+
+def bench_board_sizes(game, length=800, frames=300, repeats=3):
+    # Frame cost should not grow with the board area
+    results = {}
+    for cols, rows in BOARD_SIZES:
+        game.BOARD_SIZE = (cols, rows)
+        game.start_game()
+        game.game_loop.stop()
+        results[f"render_frame[board={cols}x{rows},len={length}]"] = metric(
+            best_of(repeats, lambda: run_frames(game, length, frames)) / frames * 1e3, "ms/frame", "lower")
+    game.BOARD_SIZE = BOARD_SIZES[0]
+    return results
+
+
+def bench_screen_switch(game, switches=50, repeats=3, round_trips=200):
+    results = {}
+    for name in ["show_main_menu", "show_achievements", "show_settings"]:
+        show = getattr(game, name)
+
+        def run():
+            start = time.perf_counter()
+            for _ in range(switches):
+                show()
+                game.root.update_idletasks()
+            return time.perf_counter() - start
+        results[f"screen_switch[{name}]"] = metric(best_of(repeats, run) / switches * 1e3, "ms", "lower")
+
+    # Menu round trips must not leak widgets
+    before = game.count_widgets()
+    for _ in range(round_trips):
+        game.show_achievements()
+        game.show_settings()
+        game.show_main_menu()
+    game.root.update_idletasks()
+    results[f"widget_growth[{round_trips} round trips]"] = metric(game.count_widgets() - before, "widgets", "lower")
+    return results
+
+
+def bench_idle_wakeups(game, seconds=1.0):
+    # Timer callbacks while nothing moves; every idle state should cost none
+    def measure():
+        before = game.idle.total_wakeups
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            game.root.update()
+            time.sleep(0.005)
+        return (game.idle.total_wakeups - before) / seconds
+
+    results = {}
+    for name in ["show_main_menu", "show_settings", "show_achievements"]:
+        getattr(game, name)()
+        results[f"idle_wakeups[{name}]"] = metric(measure(), "wakeups/s", "lower")
+    game.start_game()
+    game.toggle_pause()
+    results["idle_wakeups[paused]"] = metric(measure(), "wakeups/s", "lower")
+    game.toggle_pause()
+    results["idle_wakeups[playing]"] = metric(measure(), "wakeups/s", "lower")
+    game.show_main_menu()
+    return results
+
+
+def run_all():
+    results = {}
+    results.update(bench_tick_throughput())
+    results.update(bench_create_food())
+    results.update(bench_snapshots())
+    results.update(bench_autopilot())
+    results.update(bench_raster())
+    results.update(bench_startup())
+    try:
+        game = load_game()
+    except Exception as error:  # tkinter.TclError when no display is available
+        print(f"Skipping Tk benchmarks: {error}", file=sys.stderr)
+    else:
+        results.update(bench_frames(game))
+        results.update(bench_board_sizes(game))
+        results.update(bench_screen_switch(game))
+        results.update(bench_idle_wakeups(game))
+        game.store.close()
+        game.root.destroy()
+    return results
+
+
+# ---------------- STARTUP BENCHMARK ----------------
+# Runs in a fresh interpreter each time, so every import is part of the cost
+STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import snake_game.autopilot, snake_game.replay, snake_game.tournament
+if "tkinter" in sys.modules:
+    sys.exit("the headless modules imported tkinter")
+print("import rules", time.perf_counter() - start, flush=True)
+from snake_game import app
+print("import app", time.perf_counter() - start, flush=True)
+app.create_window()
+app.show_main_menu()
+app.root.update()
+print("first frame", time.perf_counter() - start, flush=True)
+app.store.close()
+app.root.destroy()
+"""
+
+
+def bench_startup(repeats=5):
+    # Cold start: imports, then building and drawing the main menu.  "process"
+    # also counts interpreter startup, timed from launching the child.
+    env = dict(os.environ, SNAKE_SCORES=os.path.join(tempfile.mkdtemp(), "scores.db"))
+    timings = {}
+    error = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        child = subprocess.Popen([sys.executable, "-c", STARTUP_SCRIPT], cwd=ROOT, env=env,
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        for line in child.stdout:
+            name, seconds = line.rsplit(" ", 1)
+            timings.setdefault(name, []).append(float(seconds))
+            if name == "first frame":
+                timings.setdefault("process to first frame", []).append(time.perf_counter() - start)
+        status = child.wait()
+        message = child.stderr.read().strip()
+        child.stderr.close()
+        if status:
+            error = message.splitlines()[-1] if message else f"exit status {status}"
+    if error:
+        print(f"Startup benchmark stopped early: {error}", file=sys.stderr)
+    return {f"startup[{name}]": metric(min(values) * 1000, "ms", "lower") for name, values in timings.items()}
+
+
+# ---------------- RESULTS ----------------
+def save_results(results, path):
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "metrics": results,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def compare(baseline_path, current_path, threshold):
+    with open(baseline_path) as f:
+        baseline = json.load(f)["metrics"]
+    with open(current_path) as f:
+        current = json.load(f)["metrics"]
+
+    regressions = []
+    for name, new in current.items():
+        old = baseline.get(name)
+        if old is None:
+            print(f"{name:45} {new['value']:12.3f} {new['unit']:9} (new)")
+            continue
+        change = (new["value"] - old["value"]) / old["value"] if old["value"] else 0.0
+        worse = -change if new["better"] == "higher" else change
+        flag = ""
+        if worse > threshold:
+            flag = "REGRESSION"
+            regressions.append(name)
+        elif worse < -threshold:
+            flag = "improved"
+        print(f"{name:45} {old['value']:12.3f} -> {new['value']:12.3f} {new['unit']:9} {change:+8.1%} {flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake game benchmarks")
+    parser.add_argument("--output", default="bench_results.json", help="where to write the results")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="compare two result files")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change flagged as a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        regressions = compare(*args.compare, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+        return
+
+    results = run_all()
+    for name, result in results.items():
+        print(f"{name:45} {result['value']:12.3f} {result['unit']}")
+    save_results(results, args.output)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
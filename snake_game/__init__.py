@@ -0,0 +1,7 @@
+"""Snake game rules and tools that run without a display.
+
+The Tk front end is snake_game.app, imported only by ``python -m snake_game``.
+"""
+from .engine import SnakeEngine
+
+__all__ = ["SnakeEngine"]
@@ -0,0 +1,4 @@
+"""Start the game: ``python -m snake_game``."""
+from .app import main
+
+main()
@@ -0,0 +1,215 @@
+"""Animation timeline for canvas overlays, ticked from the game loop.
+
+An animation is a list of phases ``(seconds, update, easing)``: while a phase
+runs, ``update`` is called with ``easing(progress)``, and a phase without an
+update just holds.  Animations are keyed, so playing "badge" again replaces
+the running one, and cancel() or clear() stop them at once, running their
+cleanup, so nothing outlives a restart or a screen change the way a pending
+``after()`` callback does.
+
+The timeline advances by the real time between ticks, but by at most
+MAX_STEP per tick: while the game loop is stopped (paused, game over,
+menus) nothing ticks, and animations resume where they were instead of
+jumping to their end.
+
+The overlays below draw with canvas items that are created once and then
+only moved, recoloured or hidden, so an animation frame never triggers a
+widget geometry pass.
+"""
+import math
+import time
+
+from .config import HEIGHT, WIDTH
+
+MAX_STEP = 0.1  # Seconds a single tick may advance the timeline
+BACKGROUND = "#111111"  # Canvas background that overlays fade into
+
+
+# ---------------- EASING ----------------
+def linear(t):
+    return t
+
+
+def ease_in_cubic(t):
+    return t * t * t
+
+
+def ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+
+def ease_out_back(t):
+    # Overshoots slightly before settling, for pop-in effects
+    c = 1.70158
+    return 1 + (c + 1) * (t - 1) ** 3 + c * (t - 1) ** 2
+
+
+def ease_in_out_sine(t):
+    return 0.5 - math.cos(math.pi * t) / 2
+
+
+def mix_color(start, end, t):
+    # Interpolate two "#rrggbb" colours
+    a = int(start[1:], 16)
+    b = int(end[1:], 16)
+    channels = [
+        round((a >> shift & 0xFF) + ((b >> shift & 0xFF) - (a >> shift & 0xFF)) * t)
+        for shift in (16, 8, 0)
+    ]
+    return "#{:02x}{:02x}{:02x}".format(*channels)
+
+
+# ---------------- TIMELINE ----------------
+class Animation:
+    def __init__(self, phases, loop=False, cleanup=None):
+        self.phases = phases
+        self.loop = loop
+        self.cleanup = cleanup
+        self.duration = sum(seconds for seconds, _, _ in phases)
+        self.elapsed = 0.0
+
+    def advance(self, dt):
+        # Apply the frame at the new time; returns False once finished
+        self.elapsed += dt
+        if self.loop:
+            self.elapsed %= self.duration
+        t = self.elapsed
+        for seconds, update, easing in self.phases:
+            if t < seconds:
+                if update:
+                    update(easing(t / seconds))
+                return True
+            t -= seconds
+        # Finished: settle on the end of the last animated phase
+        for seconds, update, easing in reversed(self.phases):
+            if update:
+                update(easing(1.0))
+                break
+        return False
+
+
+class Timeline:
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.animations = {}
+        self.last_time = None
+
+    def play(self, key, phases, loop=False, cleanup=None):
+        self.cancel(key)
+        animation = self.animations[key] = Animation(phases, loop, cleanup)
+        animation.advance(0.0)  # Show the first frame now, not on the next tick
+
+    def cancel(self, key):
+        animation = self.animations.pop(key, None)
+        if animation and animation.cleanup:
+            animation.cleanup()
+
+    def clear(self):
+        for key in list(self.animations):
+            self.cancel(key)
+        self.last_time = None
+
+    def tick(self):
+        now = self.clock()
+        dt = 0.0 if self.last_time is None else min(now - self.last_time, MAX_STEP)
+        self.last_time = now
+        for key, animation in list(self.animations.items()):
+            if not animation.advance(dt):
+                del self.animations[key]
+                if animation.cleanup:
+                    animation.cleanup()
+
+    def __contains__(self, key):
+        return key in self.animations
+
+
+# ---------------- OVERLAYS ----------------
+class BadgeToast:
+    """Badge notification: a coloured panel with the emoji and a message."""
+
+    def __init__(self, canvas, width=WIDTH, height=HEIGHT, panel_width=300):
+        self.canvas = canvas
+        self.center_x = width / 2
+        self.center_y = height / 2
+        self.panel_width = panel_width
+        self.panel_height = 0
+        self.offset = 0  # Vertical offset of every item from its resting place
+        tags = ("toast", "overlay")
+        self.panel = canvas.create_rectangle(0, 0, 0, 0, outline="white", width=3, state="hidden", tags=tags)
+        self.emoji = canvas.create_text(0, 0, anchor="n", state="hidden", tags=tags)
+        self.congrats = canvas.create_text(0, 0, anchor="n", text="CONGRATS!", fill="white",
+                                           font=("Arial", 16, "bold"), state="hidden", tags=tags)
+        self.message = canvas.create_text(0, 0, anchor="n", fill="white", font=("Arial", 12),
+                                          width=panel_width - 50, justify="center", state="hidden", tags=tags)
+
+    def show(self, badge):
+        canvas = self.canvas
+        emoji_size = 24 + (badge["level"] // 4) * 4  # Larger emoji for higher level badges
+        self.panel_height = emoji_size * 2 + 90
+        top = self.center_y - self.panel_height / 2
+        self.offset = 0
+        canvas.coords(self.panel, self.center_x - self.panel_width / 2, top,
+                      self.center_x + self.panel_width / 2, top + self.panel_height)
+        canvas.coords(self.emoji, self.center_x, top + 8)
+        canvas.coords(self.congrats, self.center_x, top + emoji_size * 2)
+        canvas.coords(self.message, self.center_x, top + emoji_size * 2 + 30)
+        canvas.itemconfig(self.panel, fill=badge["color"])
+        canvas.itemconfig(self.emoji, text=badge["emoji"], font=("Arial", emoji_size))
+        canvas.itemconfig(self.message, text=f"You have achieved {badge['name']} badge for level {badge['level']}!")
+        canvas.itemconfig("toast", state="normal")
+        canvas.tag_raise("toast")
+
+    def slide(self, offset):
+        offset = round(offset)
+        if offset != self.offset:
+            self.canvas.move("toast", 0, offset - self.offset)
+            self.offset = offset
+
+    def hidden_offset(self):
+        # Far enough up that the whole panel is above the canvas
+        return -(self.center_y + self.panel_height / 2)
+
+    def hide(self):
+        self.canvas.itemconfig("toast", state="hidden")
+
+    def phases(self, seconds):
+        # Drop in, hold, then slide back out over the top edge
+        away = self.hidden_offset()
+        return [
+            (0.4, lambda t: self.slide(away * (1 - t)), ease_out_back),
+            (seconds, None, linear),
+            (0.3, lambda t: self.slide(away * t), ease_in_cubic),
+        ]
+
+
+class LevelBanner:
+    """Level-up text that pops in, holds, then rises and fades out."""
+
+    def __init__(self, canvas, width=WIDTH, height=HEIGHT, color="#FFC107"):
+        self.canvas = canvas
+        self.x = width / 2
+        self.y = height / 2
+        self.color = color
+        self.text = canvas.create_text(self.x, self.y, fill=color, font=("Arial", 24, "bold"),
+                                       state="hidden", tags=("levelup", "overlay"))
+
+    def show(self, level):
+        self.canvas.itemconfig(self.text, text=f"LEVEL {level}!", fill=self.color, state="normal")
+        self.canvas.tag_raise(self.text)
+
+    def place(self, rise):
+        self.canvas.coords(self.text, self.x, self.y - rise)
+
+    def fade(self, t):
+        self.place(20 * t)
+        self.canvas.itemconfig(self.text, fill=mix_color(self.color, BACKGROUND, t))
+
+    def hide(self):
+        self.canvas.itemconfig(self.text, state="hidden")
+
+    def phases(self):
+        return [
+            (0.3, lambda t: self.place(20 * (t - 1)), ease_out_back),
+            (0.8, None, linear),
+            (0.4, self.fade, ease_in_out_sine),
+        ]
@@ -0,0 +1,1208 @@
+"""Tk front end: menus, the game screen and dialogs around a SnakeEngine.
+
+Importing this module builds nothing.  create_window() makes the Tk root,
+the screen frames, the score store and the game loop on first use, and every
+screen and dialog is built the first time it is shown.  Modules only needed
+by some games (online play, the autopilot, the scrolling viewport) are
+imported when first used, so the main menu appears as early as possible.
+
+    python -m snake_game
+"""
+import tkinter as tk
+from tkinter import messagebox
+import os
+import random
+import time
+
+from .config import (
+    WIDTH,
+    HEIGHT,
+    BOX_SIZE,
+    INITIAL_SPEED,
+    BADGE_LEVELS,
+    BOARD_SIZES
+)
+from .engine import SnakeEngine, ATE, LEVEL_UP, BADGE, DIED, WON, TURNED
+from .loop import GameLoop
+from .render import BoardRenderer
+from .profiler import FrameProfiler, PerformanceHud
+from .store import ScoreStore, DEFAULT_PATH
+from .replay import Recorder, Replay, ReplayPlayer
+from .idle import IdleManager
+from .levels import PACK_NAMES
+from .animation import Timeline, BadgeToast, LevelBanner, linear
+from .palette import FOOD_PULSE_FRAMES, FOOD_PULSE_PERIOD, EYE_FRAMES, EYE_PERIOD
+from . import snapshot
+
+# ---------------- GAME WINDOW ----------------
+root = None  # Created by create_window()
+
+# Global variables
+engine = None  # Headless game state and rules (see snake_game.engine)
+store = None  # High scores, badge unlocks and game history, saved in the background
+# Every game is recorded; the last one is kept for the WATCH REPLAY button
+replay_path = None
+recorder = None  # Records the current game (None while watching a replay)
+replay_player = None  # Drives the engine while watching a replay
+last_replay = None
+save_path = None  # Pause menu save slot
+# Online games mirror a room on a snake_game.server (SNAKE_SERVER=host:port)
+server_address = os.environ.get("SNAKE_SERVER", "localhost:8765")
+server_room = os.environ.get("SNAKE_ROOM", "lobby")
+online_client = None
+pending_join = None  # Connection to the server still being set up
+autopilot = None  # Plans moves on a worker thread while on (A key)
+assisted = False  # Autopilot games are recorded but do not count for scores or badges
+running = False
+paused = False
+game_started = False
+eye_frame = 0  # Phase of the eye animation, advanced by the timeline
+last_render = None  # What the last drawn frame showed, to skip identical frames
+MAX_FPS = int(os.environ.get("SNAKE_FPS", 60))  # Display refresh rate to target (60, 120 or 144)
+IDLE_LOG = bool(os.environ.get("SNAKE_IDLE_LOG"))  # Print the wakeups of every idle period
+JOIN_POLL_MS = 50  # How often the menu checks on a server connection being set up
+timeline = Timeline()  # Overlay animations, ticked once per rendered frame
+profiler = FrameProfiler()  # Opt-in frame timing, toggled with F3
+BOARD_SIZE = BOARD_SIZES[0]  # (cols, rows), chosen in the settings
+LEVEL_PACK = None  # Obstacle layouts by level (see snake_game.levels), None for an open board
+
+# Frames for the different screens
+main_frame = None
+game_frame = None
+settings_frame = None
+achievements_frame = None
+idle = None  # Every timer goes through the idle manager (see create_window)
+game_loop = None
+
+# ---------------- BADGE FUNCTIONS ----------------
+def unlocked_badge_levels():
+    # Badges saved for the profile plus any earned in the current game
+    levels = store.badge_levels()
+    if engine:
+        levels.update(b["level"] for b in engine.achieved_badges)
+    return levels
+
+def on_badge_achieved(badge):
+    # Higher priority badges (higher levels) have longer display time
+    priority = badge["level"] // 2  # Priority increases with level
+    display_time = 3.0 + priority * 0.5  # Base 3 seconds + 0.5 seconds per priority level
+    
+    toast = game_frame.toast
+    toast.show(badge)
+    timeline.play("badge", toast.phases(display_time), cleanup=toast.hide)
+
+# ---------------- SCREENS ----------------
+# Every screen and dialog is built once on first use and then only updated in
+# place, so navigating never creates or destroys widgets.
+def show_screen(frame):
+    if frame is not game_frame:
+        idle.go_idle("menu")
+    for other in (main_frame, game_frame, settings_frame, achievements_frame):
+        if other is not frame:
+            other.pack_forget()
+    frame.pack(fill=tk.BOTH, expand=True)
+
+def set_label(label, **options):
+    # Skip the Tk configure call when nothing changed
+    if any(label.cget(key) != value for key, value in options.items()):
+        label.config(**options)
+
+def count_widgets(widget=None):
+    widget = widget or root
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+# ---------------- MAIN MENU ----------------
+def build_main_menu():
+    # Title
+    title = tk.Label(
+        main_frame, 
+        text="SNAKE GAME", 
+        font=("Arial", 36, "bold"),
+        fg="#4CAF50",
+        bg="#1a1a1a"
+    )
+    title.pack(pady=50)
+    
+    # High score
+    main_frame.high_score_label = tk.Label(
+        main_frame, 
+        text=f"High Score: {store.high_score()}", 
+        font=("Arial", 16),
+        fg="white",
+        bg="#1a1a1a"
+    )
+    main_frame.high_score_label.pack(pady=10)
+    
+    # Buttons
+    start_btn = tk.Button(
+        main_frame, 
+        text="START GAME", 
+        font=("Arial", 16),
+        bg="#4CAF50",
+        fg="white",
+        width=15,
+        height=2,
+        command=start_game
+    )
+    start_btn.pack(pady=10)
+    
+    main_frame.online_btn = tk.Button(
+        main_frame, 
+        text="PLAY ONLINE", 
+        font=("Arial", 16),
+        bg="#00897B",
+        fg="white",
+        width=15,
+        height=2,
+        command=start_online
+    )
+    main_frame.online_btn.pack(pady=10)
+    
+    achievements_btn = tk.Button(
+        main_frame, 
+        text="ACHIEVEMENTS", 
+        font=("Arial", 16),
+        bg="#9C27B0",
+        fg="white",
+        width=15,
+        height=2,
+        command=show_achievements
+    )
+    achievements_btn.pack(pady=10)
+    
+    settings_btn = tk.Button(
+        main_frame, 
+        text="SETTINGS", 
+        font=("Arial", 16),
+        bg="#2196F3",
+        fg="white",
+        width=15,
+        height=2,
+        command=show_settings
+    )
+    settings_btn.pack(pady=10)
+    
+    exit_btn = tk.Button(
+        main_frame, 
+        text="EXIT", 
+        font=("Arial", 16),
+        bg="#F44336",
+        fg="white",
+        width=15,
+        height=2,
+        command=root.quit
+    )
+    exit_btn.pack(pady=10)
+
+def show_main_menu():
+    global game_started, running, paused, engine
+    
+    game_loop.stop()
+    close_online()
+    stop_autopilot()
+    timeline.clear()
+    game_started = False
+    running = False
+    paused = False
+    engine = None
+    
+    if not hasattr(main_frame, "high_score_label"):
+        build_main_menu()
+    set_label(main_frame.high_score_label, text=f"High Score: {store.high_score()}")
+    
+    show_screen(main_frame)
+
+# ---------------- ACHIEVEMENTS SCREEN ----------------
+def build_achievements():
+    # Title
+    title = tk.Label(
+        achievements_frame, 
+        text="ACHIEVEMENTS", 
+        font=("Arial", 30, "bold"),
+        fg="#9C27B0",
+        bg="#1a1a1a"
+    )
+    title.pack(pady=20)
+    
+    # Create scrollable frame for badges
+    canvas = tk.Canvas(achievements_frame, bg="#1a1a1a", highlightthickness=0)
+    scrollbar = tk.Scrollbar(achievements_frame, orient="vertical", command=canvas.yview)
+    scrollable_frame = tk.Frame(canvas, bg="#1a1a1a")
+    
+    scrollable_frame.bind(
+        "<Configure>",
+        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+    )
+    
+    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+    canvas.configure(yscrollcommand=scrollbar.set)
+    
+    # One row per badge, styled as locked until update_achievements() runs
+    achievements_frame.badge_rows = {}
+    for level_num, badge_info in BADGE_LEVELS.items():
+        # Badge frame
+        badge_frame = tk.Frame(
+            scrollable_frame, 
+            bg="#333333",
+            relief=tk.SUNKEN,
+            borderwidth=2
+        )
+        badge_frame.pack(pady=10, padx=20, fill=tk.X)
+        
+        # Badge emoji
+        emoji_label = tk.Label(
+            badge_frame, 
+            text=badge_info["emoji"], 
+            font=("Arial", 24),
+            bg="#333333",
+            fg="#666666"
+        )
+        emoji_label.pack(side=tk.LEFT, padx=10, pady=10)
+        
+        # Badge info
+        info_frame = tk.Frame(badge_frame, bg="#333333")
+        info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        # Badge name
+        name_label = tk.Label(
+            info_frame, 
+            text=badge_info["name"], 
+            font=("Arial", 16, "bold"),
+            bg="#333333",
+            fg="#666666",
+            anchor="w"
+        )
+        name_label.pack(fill=tk.X)
+        
+        # Badge requirement
+        req_label = tk.Label(
+            info_frame, 
+            text=f"Reach Level {level_num}", 
+            font=("Arial", 12),
+            bg="#333333",
+            fg="#666666",
+            anchor="w"
+        )
+        req_label.pack(fill=tk.X)
+        
+        # Status
+        status_label = tk.Label(
+            info_frame, 
+            text="LOCKED", 
+            font=("Arial", 12, "bold"),
+            bg="#333333",
+            fg="#666666",
+            anchor="e"
+        )
+        status_label.pack(fill=tk.X, pady=5)
+        
+        achievements_frame.badge_rows[level_num] = {
+            "achieved": False,
+            "frame": badge_frame,
+            "backgrounds": [badge_frame, info_frame],
+            "labels": [emoji_label, name_label, req_label, status_label],
+            "status": status_label
+        }
+    
+    canvas.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+    
+    # Back button
+    back_btn = tk.Button(
+        achievements_frame, 
+        text="BACK", 
+        font=("Arial", 14),
+        bg="#9E9E9E",
+        fg="white",
+        width=10,
+        command=show_main_menu
+    )
+    back_btn.pack(pady=20)
+
+def update_achievements():
+    # Restyle only the badges whose locked/achieved state changed
+    achieved_levels = unlocked_badge_levels()
+    for level_num, row in achievements_frame.badge_rows.items():
+        is_achieved = level_num in achieved_levels
+        if is_achieved == row["achieved"]:
+            continue
+        row["achieved"] = is_achieved
+        
+        bg = BADGE_LEVELS[level_num]["color"] if is_achieved else "#333333"
+        fg = "white" if is_achieved else "#666666"
+        row["frame"].config(relief=tk.RAISED if is_achieved else tk.SUNKEN)
+        for widget in row["backgrounds"]:
+            widget.config(bg=bg)
+        for label in row["labels"]:
+            label.config(bg=bg, fg=fg)
+        row["status"].config(text="✓ ACHIEVED" if is_achieved else "LOCKED")
+
+def show_achievements():
+    if not hasattr(achievements_frame, "badge_rows"):
+        build_achievements()
+    update_achievements()
+    
+    show_screen(achievements_frame)
+
+# ---------------- SETTINGS MENU ----------------
+def update_initial_speed(val):
+    global INITIAL_SPEED
+    INITIAL_SPEED = int(val)
+
+def update_board_size():
+    global BOARD_SIZE
+    BOARD_SIZE = BOARD_SIZES[settings_frame.board_var.get()]
+
+def update_level_pack():
+    global LEVEL_PACK
+    LEVEL_PACK = PACK_NAMES[settings_frame.pack_var.get()]
+
+def build_settings():
+    # Title
+    title = tk.Label(
+        settings_frame, 
+        text="SETTINGS", 
+        font=("Arial", 30, "bold"),
+        fg="#2196F3",
+        bg="#1a1a1a"
+    )
+    title.pack(pady=30)
+    
+    # Speed setting
+    speed_frame = tk.Frame(settings_frame, bg="#1a1a1a")
+    speed_frame.pack(pady=20)
+    
+    tk.Label(
+        speed_frame, 
+        text="Initial Game Speed:", 
+        font=("Arial", 14),
+        fg="white",
+        bg="#1a1a1a"
+    ).pack(side=tk.LEFT, padx=10)
+    
+    settings_frame.speed_var = tk.IntVar(value=INITIAL_SPEED)
+    
+    speed_scale = tk.Scale(
+        speed_frame,
+        from_=80,
+        to=160,
+        orient=tk.HORIZONTAL,
+        variable=settings_frame.speed_var,
+        command=update_initial_speed,
+        bg="#1a1a1a",
+        fg="white",
+        highlightthickness=0,
+        length=200
+    )
+    speed_scale.pack(side=tk.LEFT)
+    
+    # Labels for speed
+    speed_labels = tk.Frame(settings_frame, bg="#1a1a1a")
+    speed_labels.pack()
+    
+    tk.Label(
+        speed_labels, 
+        text="Fast", 
+        font=("Arial", 10),
+        fg="white",
+        bg="#1a1a1a"
+    ).pack(side=tk.LEFT, padx=30)
+    
+    tk.Label(
+        speed_labels, 
+        text="Slow", 
+        font=("Arial", 10),
+        fg="white",
+        bg="#1a1a1a"
+    ).pack(side=tk.LEFT, padx=30)
+    
+    # Board size setting
+    board_frame = tk.Frame(settings_frame, bg="#1a1a1a")
+    board_frame.pack(pady=20)
+    
+    tk.Label(
+        board_frame, 
+        text="Board Size:", 
+        font=("Arial", 14),
+        fg="white",
+        bg="#1a1a1a"
+    ).pack(side=tk.LEFT, padx=10)
+    
+    settings_frame.board_var = tk.IntVar(value=BOARD_SIZES.index(BOARD_SIZE))
+    
+    for index, (cols, rows) in enumerate(BOARD_SIZES):
+        tk.Radiobutton(
+            board_frame,
+            text=f"{cols}x{rows}",
+            font=("Arial", 12),
+            variable=settings_frame.board_var,
+            value=index,
+            command=update_board_size,
+            bg="#1a1a1a",
+            fg="white",
+            selectcolor="#333333",
+            activebackground="#1a1a1a",
+            activeforeground="white"
+        ).pack(side=tk.LEFT, padx=5)
+    
+    # Level pack setting
+    pack_frame = tk.Frame(settings_frame, bg="#1a1a1a")
+    pack_frame.pack(pady=10)
+    
+    tk.Label(
+        pack_frame, 
+        text="Levels:", 
+        font=("Arial", 14),
+        fg="white",
+        bg="#1a1a1a"
+    ).pack(side=tk.LEFT, padx=10)
+    
+    settings_frame.pack_var = tk.IntVar(value=PACK_NAMES.index(LEVEL_PACK))
+    
+    for index, name in enumerate(PACK_NAMES):
+        tk.Radiobutton(
+            pack_frame,
+            text=name.title() if name else "Open",
+            font=("Arial", 12),
+            variable=settings_frame.pack_var,
+            value=index,
+            command=update_level_pack,
+            bg="#1a1a1a",
+            fg="white",
+            selectcolor="#333333",
+            activebackground="#1a1a1a",
+            activeforeground="white"
+        ).pack(side=tk.LEFT, padx=5)
+    
+    # Back button
+    back_btn = tk.Button(
+        settings_frame, 
+        text="BACK", 
+        font=("Arial", 14),
+        bg="#9E9E9E",
+        fg="white",
+        width=10,
+        command=show_main_menu
+    )
+    back_btn.pack(pady=30)
+
+def show_settings():
+    if not hasattr(settings_frame, "speed_var"):
+        build_settings()
+    settings_frame.speed_var.set(INITIAL_SPEED)
+    settings_frame.board_var.set(BOARD_SIZES.index(BOARD_SIZE))
+    settings_frame.pack_var.set(PACK_NAMES.index(LEVEL_PACK))
+    
+    show_screen(settings_frame)
+
+# ---------------- GAME SCREEN ----------------
+def start_game(replay=None, client=None, saved=None):
+    global engine, recorder, replay_player, online_client, running, paused, game_started, eye_frame, assisted
+    
+    # Reset game state; each game gets its own seed so it can be replayed
+    close_online()
+    stop_autopilot()
+    assisted = False
+    online_client = client
+    eye_frame = 0
+    if saved is not None:
+        # Resumed from a snapshot; the recording starts from its state
+        engine, eye_frame = saved
+        recorder = Recorder(engine)
+        replay_player = None
+    elif client is not None:
+        # The server runs the rules; the engine only mirrors its moves
+        engine = client.engine
+        recorder = None
+        replay_player = None
+    elif replay is not None:
+        replay_player = ReplayPlayer(replay)
+        engine = replay_player.engine
+        recorder = None
+    else:
+        seed = random.getrandbits(64)
+        engine = SnakeEngine(*BOARD_SIZE, seed=seed, initial_speed=INITIAL_SPEED, pack=LEVEL_PACK)
+        recorder = Recorder(engine, seed)
+        replay_player = None
+    running = True
+    paused = False
+    game_started = True
+    
+    # Show game frame
+    show_screen(game_frame)
+    
+    # Create canvas if it doesn't exist
+    if not hasattr(game_frame, 'canvas'):
+        game_frame.canvas = tk.Canvas(
+            game_frame, 
+            width=WIDTH, 
+            height=HEIGHT, 
+            bg="#111111",
+            highlightthickness=2,
+            highlightbackground="#333333"
+        )
+        game_frame.canvas.pack(pady=10)
+        
+        # Score and level frame
+        score_frame = tk.Frame(game_frame, bg="#1a1a1a")
+        score_frame.pack()
+        
+        # Score label
+        game_frame.score_label = tk.Label(
+            score_frame, 
+            text=f"Score: {engine.score}", 
+            font=("Arial", 14),
+            fg="white",
+            bg="#1a1a1a"
+        )
+        game_frame.score_label.pack(side=tk.LEFT, padx=20)
+        
+        # Level label
+        game_frame.level_label = tk.Label(
+            score_frame, 
+            text=f"Level: {engine.level}", 
+            font=("Arial", 14),
+            fg="#FFC107",
+            bg="#1a1a1a"
+        )
+        game_frame.level_label.pack(side=tk.LEFT, padx=20)
+        
+        # Current badge label (if any)
+        game_frame.badge_label = tk.Label(
+            score_frame, 
+            text="", 
+            font=("Arial", 14),
+            fg="#9C27B0",
+            bg="#1a1a1a"
+        )
+        game_frame.badge_label.pack(side=tk.LEFT, padx=20)
+        
+        # Pause button
+        game_frame.pause_btn = tk.Button(
+            game_frame, 
+            text="PAUSE", 
+            font=("Arial", 12),
+            bg="#FF9800",
+            fg="white",
+            width=10,
+            command=toggle_pause
+        )
+        game_frame.pause_btn.pack(pady=5)
+        
+        # Performance overlay (hidden until F3 is pressed)
+        game_frame.hud = PerformanceHud(game_frame.canvas, profiler, extra=hud_lines)
+        game_frame.toast = BadgeToast(game_frame.canvas)
+        game_frame.level_banner = LevelBanner(game_frame.canvas)
+        game_frame.renderer = None
+        game_frame.board_size = None
+    
+    # Board items are created once per board size and reused for every game
+    if game_frame.board_size != (engine.cols, engine.rows):
+        game_frame.canvas.delete("board")
+        if engine.cols * BOX_SIZE <= WIDTH and engine.rows * BOX_SIZE <= HEIGHT:
+            game_frame.renderer = BoardRenderer(game_frame.canvas)
+        else:
+            # Larger boards scroll with the head and draw only the visible cells
+            from .viewport import ViewportRenderer
+            game_frame.renderer = ViewportRenderer(game_frame.canvas, engine.cols, engine.rows)
+        game_frame.board_size = (engine.cols, engine.rows)
+        game_frame.canvas.tag_raise("overlay")
+    
+    # Stop overlays left over from the previous game; the food pulses until the next one
+    timeline.clear()
+    timeline.play("food", [(FOOD_PULSE_PERIOD, pulse_food, linear)], loop=True)
+    timeline.play("eyes", [(EYE_PERIOD, blink_eyes, linear)], loop=True)
+    game_frame.pause_btn.config(text="PAUSE")
+    
+    # Start game
+    draw_objects()
+    update_labels()
+    wake_up()
+    game_loop.start()
+
+def toggle_pause():
+    global paused
+    paused = not paused
+    if paused:
+        game_loop.stop()
+        idle.go_idle("paused")
+        engine.pending.clear()  # Turns do not carry over a pause
+        game_frame.pause_btn.config(text="RESUME")
+        show_pause_menu()
+    else:
+        game_frame.pause_btn.config(text="PAUSE")
+        if pause_menu is not None:
+            hide_dialog(pause_menu)
+        if running:
+            wake_up()
+            game_loop.start()
+
+def auto_pause():
+    # Minimizing the window or switching to another app pauses a running game
+    if game_started and running and not paused:
+        toggle_pause()
+
+def wake_up():
+    period = idle.wake()
+    if period and IDLE_LOG:
+        print(f"Idle ({period['reason']}) for {period['seconds']:.1f} s: {period['wakeups']} wakeups")
+
+def create_dialog(title, size):
+    dialog = tk.Toplevel(root)
+    dialog.title(title)
+    dialog.geometry(size)
+    dialog.configure(bg="#1a1a1a")
+    dialog.transient(root)
+    dialog.withdraw()
+    # Closing the window only hides it, so it can be shown again
+    dialog.protocol("WM_DELETE_WINDOW", lambda: hide_dialog(dialog))
+    return dialog
+
+def show_dialog(dialog):
+    dialog.deiconify()
+    
+    # Center the window
+    dialog.update_idletasks()
+    x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
+    y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
+    dialog.geometry(f"+{x}+{y}")
+    dialog.grab_set()
+
+def hide_dialog(dialog):
+    dialog.grab_release()
+    dialog.withdraw()
+
+pause_menu = None  # Built on first pause, then hidden and reshown
+
+def build_pause_menu():
+    menu = create_dialog("Game Paused", "300x420")
+    
+    # Title
+    title = tk.Label(
+        menu, 
+        text="GAME PAUSED", 
+        font=("Arial", 20, "bold"),
+        fg="#FF9800",
+        bg="#1a1a1a"
+    )
+    title.pack(pady=20)
+    
+    # Resume button
+    resume_btn = tk.Button(
+        menu, 
+        text="RESUME", 
+        font=("Arial", 14),
+        bg="#4CAF50",
+        fg="white",
+        width=15,
+        command=lambda: [hide_dialog(menu), toggle_pause()]
+    )
+    resume_btn.pack(pady=10)
+    
+    # Save slot
+    save_frame = tk.Frame(menu, bg="#1a1a1a")
+    save_frame.pack(pady=5)
+    
+    save_btn = tk.Button(
+        save_frame, 
+        text="SAVE", 
+        font=("Arial", 14),
+        bg="#607D8B",
+        fg="white",
+        width=7,
+        command=save_game
+    )
+    save_btn.pack(side=tk.LEFT, padx=5)
+    
+    load_btn = tk.Button(
+        save_frame, 
+        text="LOAD", 
+        font=("Arial", 14),
+        bg="#607D8B",
+        fg="white",
+        width=7,
+        command=load_saved_game
+    )
+    load_btn.pack(side=tk.LEFT, padx=5)
+    
+    menu.status_label = tk.Label(
+        menu, 
+        text="", 
+        font=("Arial", 10),
+        fg="#9E9E9E",
+        bg="#1a1a1a"
+    )
+    menu.status_label.pack()
+    
+    # Achievements button
+    achievements_btn = tk.Button(
+        menu, 
+        text="ACHIEVEMENTS", 
+        font=("Arial", 14),
+        bg="#9C27B0",
+        fg="white",
+        width=15,
+        command=lambda: [hide_dialog(menu), show_achievements()]
+    )
+    achievements_btn.pack(pady=10)
+    
+    # Settings button
+    settings_btn = tk.Button(
+        menu, 
+        text="SETTINGS", 
+        font=("Arial", 14),
+        bg="#2196F3",
+        fg="white",
+        width=15,
+        command=lambda: [hide_dialog(menu), show_settings()]
+    )
+    settings_btn.pack(pady=10)
+    
+    # Main menu button
+    menu_btn = tk.Button(
+        menu, 
+        text="MAIN MENU", 
+        font=("Arial", 14),
+        bg="#9E9E9E",
+        fg="white",
+        width=15,
+        command=lambda: [hide_dialog(menu), show_main_menu()]
+    )
+    menu_btn.pack(pady=10)
+    
+    # Exit button
+    exit_btn = tk.Button(
+        menu, 
+        text="EXIT", 
+        font=("Arial", 14),
+        bg="#F44336",
+        fg="white",
+        width=15,
+        command=root.quit
+    )
+    exit_btn.pack(pady=10)
+    return menu
+
+def show_pause_menu():
+    global pause_menu
+    
+    if pause_menu is None:
+        pause_menu = build_pause_menu()
+    set_label(pause_menu.status_label, text="")
+    show_dialog(pause_menu)
+
+def save_game():
+    if online_client:
+        set_label(pause_menu.status_label, text="Online games cannot be saved")
+        return
+    try:
+        os.makedirs(os.path.dirname(save_path) or ".", exist_ok=True)
+        snapshot.save(save_path, engine, eye_frame)
+    except OSError as error:
+        set_label(pause_menu.status_label, text=f"Save failed: {error.strerror}")
+        return
+    set_label(pause_menu.status_label, text=f"Saved at score {engine.score}")
+
+def load_saved_game():
+    try:
+        saved = snapshot.load(save_path)
+    except FileNotFoundError:
+        set_label(pause_menu.status_label, text="No saved game")
+        return
+    except (OSError, snapshot.SnapshotError) as error:
+        set_label(pause_menu.status_label, text=f"Load failed: {error}")
+        return
+    hide_dialog(pause_menu)
+    start_game(saved=saved)
+
+# ---------------- GAME FUNCTIONS ----------------
+# ---------------- RENDERER ----------------
+def draw_objects():
+    global last_render
+    # Full repaint, used on resets; moves are applied incrementally in game_tick()
+    game_frame.renderer.redraw(engine, eye_frame)
+    last_render = None
+
+def update_labels():
+    # Update score and level
+    set_label(game_frame.score_label, text=f"Score: {engine.score}" + (" (AUTO)" if autopilot else ""))
+    set_label(game_frame.level_label, text=f"Level: {engine.level}")
+    
+    # Update current badge if any
+    if engine.achieved_badges:
+        latest_badge = engine.achieved_badges[-1]
+        set_label(game_frame.badge_label, text=f"{latest_badge['emoji']} {latest_badge['name']}")
+    else:
+        set_label(game_frame.badge_label, text="")
+
+def show_level_up(level):
+    banner = game_frame.level_banner
+    banner.show(level)
+    timeline.play("levelup", banner.phases(), cleanup=banner.hide)
+
+def pulse_food(t):
+    game_frame.renderer.pulse_food(int(t * FOOD_PULSE_FRAMES))
+
+def blink_eyes(t):
+    global eye_frame
+    eye_frame = int(t * EYE_FRAMES)
+
+def game_tick():
+    if online_client:
+        # Apply every move the server sent since the last tick
+        if online_client.closed:
+            messagebox.showerror("Play Online", "Lost connection to the server")
+            show_main_menu()
+            return
+        for events in online_client.poll():
+            if not handle_events(events):
+                return
+        return
+    
+    if replay_player:
+        events = replay_player.step()
+    else:
+        if autopilot:
+            engine.change_direction(autopilot.take(engine))
+        events = engine.step()
+        recorder.record()
+        if autopilot and engine.alive:
+            autopilot.submit(engine)
+    handle_events(events)
+
+def handle_events(events):
+    # Returns False once the game is over; only recorded local games are saved
+    game_frame.renderer.apply(events, engine)
+    
+    for event, value in events:
+        if event == DIED:
+            game_over()
+            return False
+        elif event == TURNED:
+            profiler.key_applied()
+        elif event == ATE:
+            if recorder and not assisted:
+                store.update_high_score(value)
+        elif event == LEVEL_UP:
+            show_level_up(value)
+        elif event == BADGE:
+            if recorder and not assisted:
+                store.unlock_badge(value["level"])
+            on_badge_achieved(value)
+        elif event == WON:
+            draw_objects()
+            update_labels()
+            game_over(won=True)
+            return False
+    return True
+
+def render_frame(alpha):
+    # Runs at the display rate; the snake is interpolated alpha of the way
+    # through the current move, and frames that would look the same are skipped
+    global last_render
+    
+    timeline.tick()
+    state = (engine.ticks, round(alpha * BOX_SIZE), eye_frame, game_frame.renderer.food_frame)
+    if state == last_render:
+        game_frame.hud.update()
+        return False
+    last_render = state
+    game_frame.renderer.animate(engine, eye_frame, alpha)
+    profiler.mark("draw")
+    update_labels()
+    profiler.mark("labels")
+    game_frame.hud.update()
+
+def hud_lines():
+    return [f"target {game_loop.fps}Hz  idle frames {game_loop.idle_frames}  "
+            f"wakeups {idle.wakeups_per_second():.0f}/s"]
+
+def toggle_hud():
+    if hasattr(game_frame, "hud"):
+        game_frame.hud.toggle()
+
+def dump_trace():
+    if profiler.tracing:
+        path = time.strftime("snake_trace_%Y%m%d_%H%M%S.json")
+        profiler.dump_trace(path)
+        print(f"Frame trace written to {path}")
+
+def change_direction(new_dir):
+    # Turns are queued and applied one per tick; keys are ignored while
+    # paused and while a replay drives the snake
+    if online_client and running and not paused:
+        online_client.turn(new_dir)
+    elif engine and running and not paused and not replay_player:
+        stop_autopilot()  # Steering takes back control
+        if engine.change_direction(new_dir):
+            profiler.key_pressed()
+
+def toggle_autopilot():
+    global autopilot, assisted
+    if autopilot:
+        stop_autopilot()
+    elif engine and running and not paused and not replay_player and not online_client:
+        from .autopilot import Autopilot
+        autopilot = Autopilot()
+        autopilot.submit(engine)
+        assisted = True
+
+def stop_autopilot():
+    global autopilot
+    if autopilot:
+        autopilot.close()
+        autopilot = None
+
+def save_replay():
+    global last_replay
+    
+    last_replay = Replay(recorder.to_bytes())
+    try:
+        os.makedirs(os.path.dirname(replay_path) or ".", exist_ok=True)
+        recorder.save(replay_path)
+    except OSError as error:
+        print(f"Could not save replay: {error}")
+
+def watch_replay():
+    if last_replay is not None:
+        start_game(last_replay)
+
+def start_online():
+    # Connects on a background thread; finish_online() picks up the result
+    global pending_join
+    from .client import PendingJoin, parse_address
+    if pending_join is not None:
+        return
+    try:
+        host, port = parse_address(server_address)
+    except ValueError as error:
+        messagebox.showerror("Play Online", f"Could not join {server_address}: {error}")
+        return
+    pending_join = PendingJoin(host, port, server_room)
+    set_label(main_frame.online_btn, text="CONNECTING...")
+    # Polled with root.after(), not the idle manager, whose timers stop while the menu is shown
+    root.after(JOIN_POLL_MS, finish_online)
+
+def finish_online():
+    global pending_join
+    if not pending_join.done:
+        root.after(JOIN_POLL_MS, finish_online)
+        return
+    join, pending_join = pending_join, None
+    set_label(main_frame.online_btn, text="PLAY ONLINE")
+    if game_started:
+        # Another game was started while connecting
+        if join.client:
+            join.client.close()
+    elif join.error:
+        messagebox.showerror("Play Online", f"Could not join {server_address}: {join.error}")
+    else:
+        start_game(client=join.client)
+
+def close_online():
+    global online_client
+    if online_client:
+        online_client.close()
+        online_client = None
+
+game_over_dialog = None  # Built on the first game over, then updated in place
+
+def build_game_over_dialog():
+    dialog = create_dialog("Game Over", "350x400")
+    
+    # Title
+    dialog.title_label = tk.Label(
+        dialog, 
+        text="GAME OVER", 
+        font=("Arial", 20, "bold"),
+        fg="#F44336",
+        bg="#1a1a1a"
+    )
+    dialog.title_label.pack(pady=20)
+    
+    # Score
+    dialog.score_label = tk.Label(
+        dialog, 
+        text="", 
+        font=("Arial", 14),
+        fg="white",
+        bg="#1a1a1a"
+    )
+    dialog.score_label.pack(pady=5)
+    
+    # Level
+    dialog.level_label = tk.Label(
+        dialog, 
+        text="", 
+        font=("Arial", 14),
+        fg="#FFC107",
+        bg="#1a1a1a"
+    )
+    dialog.level_label.pack(pady=5)
+    
+    # Highest badge achieved (only shown when there is one)
+    dialog.badge_label = tk.Label(
+        dialog, 
+        text="", 
+        font=("Arial", 14),
+        bg="#1a1a1a"
+    )
+    
+    # High score
+    dialog.high_score_label = tk.Label(
+        dialog, 
+        text="", 
+        font=("Arial", 14),
+        fg="#4CAF50",
+        bg="#1a1a1a"
+    )
+    dialog.high_score_label.pack(pady=5)
+    
+    # Buttons
+    button_frame = tk.Frame(dialog, bg="#1a1a1a")
+    button_frame.pack(pady=20)
+    
+    play_again_btn = tk.Button(
+        button_frame, 
+        text="PLAY AGAIN", 
+        font=("Arial", 12),
+        bg="#4CAF50",
+        fg="white",
+        command=lambda: [hide_dialog(dialog), start_game()]
+    )
+    play_again_btn.pack(side=tk.LEFT, padx=10)
+    
+    achievements_btn = tk.Button(
+        button_frame, 
+        text="ACHIEVEMENTS", 
+        font=("Arial", 12),
+        bg="#9C27B0",
+        fg="white",
+        command=lambda: [hide_dialog(dialog), show_achievements()]
+    )
+    achievements_btn.pack(side=tk.LEFT, padx=10)
+    
+    menu_btn = tk.Button(
+        button_frame, 
+        text="MAIN MENU", 
+        font=("Arial", 12),
+        bg="#9E9E9E",
+        fg="white",
+        command=lambda: [hide_dialog(dialog), show_main_menu()]
+    )
+    menu_btn.pack(side=tk.LEFT, padx=10)
+    
+    replay_btn = tk.Button(
+        dialog, 
+        text="WATCH REPLAY", 
+        font=("Arial", 12),
+        bg="#2196F3",
+        fg="white",
+        command=lambda: [hide_dialog(dialog), watch_replay()]
+    )
+    replay_btn.pack()
+    return dialog
+
+def game_over(won=False):
+    global running, game_over_dialog
+    
+    running = False
+    game_loop.stop()
+    idle.go_idle("game over")
+    
+    # Queued for the background writer, so this never waits on disk
+    highest_badge = engine.achieved_badges[-1] if engine.achieved_badges else None
+    close_online()
+    stop_autopilot()
+    timeline.clear()
+    if recorder and not assisted:
+        store.record_game(
+            engine.score,
+            engine.level,
+            engine.ticks,
+            highest_badge["level"] if highest_badge else 0
+        )
+    if recorder:
+        save_replay()
+    
+    if game_over_dialog is None:
+        game_over_dialog = build_game_over_dialog()
+    dialog = game_over_dialog
+    
+    dialog.title("You Win" if won else "Game Over")
+    set_label(
+        dialog.title_label,
+        text="YOU WIN!" if won else "GAME OVER",
+        fg="#4CAF50" if won else "#F44336"
+    )
+    set_label(dialog.score_label, text=f"Score: {engine.score}")
+    set_label(dialog.level_label, text=f"Level Reached: {engine.level}")
+    set_label(dialog.high_score_label, text=f"High Score: {store.high_score()}")
+    
+    # Highest badge achieved
+    if highest_badge:
+        set_label(
+            dialog.badge_label,
+            text=f"Highest Badge: {highest_badge['emoji']} {highest_badge['name']}",
+            fg=highest_badge["color"]
+        )
+        dialog.badge_label.pack(pady=5, before=dialog.high_score_label)
+    else:
+        dialog.badge_label.pack_forget()
+    
+    show_dialog(dialog)
+
+# ---------------- GAME WINDOW ----------------
+def create_window():
+    # Builds the window and everything the screens share, once; raises
+    # tkinter.TclError without a display
+    global root, store, replay_path, save_path, idle, game_loop
+    global main_frame, game_frame, settings_frame, achievements_frame
+    if root is not None:
+        return root
+    root = tk.Tk()
+    root.title("Snake Game - Professional Edition")
+    root.resizable(False, False)
+    root.configure(bg="#1a1a1a")
+
+    store = ScoreStore(
+        path=os.environ.get("SNAKE_SCORES", DEFAULT_PATH),
+        profile=os.environ.get("SNAKE_PROFILE", "default")
+    )
+    replay_path = os.path.join(os.path.dirname(store.path), "last_game.snkr")
+    save_path = os.path.join(os.path.dirname(store.path), "saved_game.snks")
+
+    main_frame = tk.Frame(root, bg="#1a1a1a")
+    game_frame = tk.Frame(root, bg="#1a1a1a")
+    settings_frame = tk.Frame(root, bg="#1a1a1a")
+    achievements_frame = tk.Frame(root, bg="#1a1a1a")
+
+    # Every timer goes through the idle manager, which cancels them all whenever nothing moves
+    idle = IdleManager(root, on_hidden=auto_pause)
+    # Logic runs once per engine.speed ms; frames run at up to MAX_FPS and slow down when they cannot keep up
+    game_loop = GameLoop(
+        idle,
+        game_tick,
+        render_frame,
+        tick_ms=lambda: engine.speed,
+        max_fps=MAX_FPS,
+        profiler=profiler
+    )
+
+    # Controls
+    root.bind("<Up>", lambda e: change_direction("Up"))
+    root.bind("<Down>", lambda e: change_direction("Down"))
+    root.bind("<Left>", lambda e: change_direction("Left"))
+    root.bind("<Right>", lambda e: change_direction("Right"))
+    root.bind("<Escape>", lambda e: toggle_pause() if game_started else None)
+    root.bind("<a>", lambda e: toggle_autopilot())
+    root.bind("<F3>", lambda e: toggle_hud())
+    root.bind("<F4>", lambda e: dump_trace())
+    return root
+
+# ---------------- START APP ----------------
+def main():
+    create_window()
+    show_main_menu()
+    root.mainloop()
+    store.close()
@@ -0,0 +1,369 @@
+"""Pathfinding autopilot that plans off the UI thread.
+
+Planner works on flat cell indexes over the engine's occupancy grid.  Each
+move it heads for the food along an A* path, but only if the snake could
+still reach its own tail after eating there (checked on a simulated body).
+If the shortest path fails that check, the shortest paths arriving at the
+food from its other sides are tried; if all fail, it chases its tail, and
+failing that takes the move that keeps the most room, preferring the
+board's Hamiltonian cycle.  Once the body lies along that cycle the planner
+follows it, which is safe until the board is full.  A snake that has circled
+for STALL_FACTOR times its length without a food path settles for one that
+leaves room to move until the body has cleared, so games in mazes keep
+scoring.  A path that passed its check stays valid until the food is eaten,
+so it is reused move by move without searching again.
+
+Autopilot runs a Planner on a worker thread, one tick ahead of the game:
+after each step the front end hands it a clone() of the engine, and before
+the next step it takes the planned move without waiting.  Searches stop at a
+deadline of BUDGET of the current tick length; a plan that is not ready in
+time is replaced by a quick safe move, so the Tk loop never blocks on it.
+
+``pathfinder`` is the same planner as a policy for headless games::
+
+    python -m snake_game.tournament snake_game.autopilot:pathfinder
+"""
+import heapq
+import threading
+import time
+import weakref
+from array import array
+from functools import lru_cache
+from itertools import islice
+
+from .policies import greedy
+from .profiler import RollingStats
+
+BUDGET = 0.5  # Share of the tick length a plan may take
+CHECK_EVERY = 256  # Search expansions between deadline checks
+STALL_FACTOR = 2  # Snake lengths of moves without a food path before the looser check
+
+
+class OutOfTime(Exception):
+    pass
+
+
+# ---------------- GRID SEARCH ----------------
+def neighbours(cell, cols, size):
+    x = cell % cols
+    if cell >= cols:
+        yield cell - cols
+    if cell + cols < size:
+        yield cell + cols
+    if x:
+        yield cell - 1
+    if x + 1 < cols:
+        yield cell + 1
+
+
+def direction_to(cell, target, cols):
+    delta = target - cell
+    if delta == -cols:
+        return "Up"
+    if delta == cols:
+        return "Down"
+    return "Left" if delta == -1 else "Right"
+
+
+def find_path(blocked, cols, start, goal, deadline=None):
+    """Shortest path from start to goal (a list of cells, start excluded), or None.
+
+    The goal may be a blocked cell, such as the tail.  Raises OutOfTime when
+    the deadline (a perf_counter() value) passes.
+    """
+    size = len(blocked)
+    goal_x, goal_y = goal % cols, goal // cols
+    came_from = {start: start}
+    cost = {start: 0}
+    heap = [(0, 0, 0, start)]
+    expansions = 0
+    while heap:
+        _, _, distance, cell = heapq.heappop(heap)
+        if cell == goal:
+            path = []
+            while cell != start:
+                path.append(cell)
+                cell = came_from[cell]
+            path.reverse()
+            return path
+        if distance > cost[cell]:
+            continue  # Stale heap entry
+        expansions += 1
+        if deadline is not None and expansions % CHECK_EVERY == 0 and time.perf_counter() > deadline:
+            raise OutOfTime
+        distance += 1
+        for other in neighbours(cell, cols, size):
+            if (blocked[other] and other != goal) or cost.get(other, distance + 1) <= distance:
+                continue
+            cost[other] = distance
+            came_from[other] = cell
+            # Ties go to the entry nearer the goal, so open boards expand ~one cell per step
+            remaining = abs(other % cols - goal_x) + abs(other // cols - goal_y)
+            heapq.heappush(heap, (distance + remaining, remaining, distance, other))
+    return None
+
+
+def free_area(blocked, cols, start, limit, deadline=None):
+    # Cells reachable from start, counting no further than limit
+    size = len(blocked)
+    seen = {start}
+    frontier = [start]
+    while frontier and len(seen) < limit:
+        if deadline is not None and time.perf_counter() > deadline:
+            break  # Partial count: the move is at least this roomy
+        next_frontier = []
+        for cell in frontier:
+            for other in neighbours(cell, cols, size):
+                if not blocked[other] and other not in seen:
+                    seen.add(other)
+                    next_frontier.append(other)
+        frontier = next_frontier
+    return min(len(seen), limit)
+
+
+@lru_cache(maxsize=4)
+def hamiltonian_cycle(cols, rows):
+    # Successor of every cell on a closed path through the whole board, or
+    # None when both sides are odd and no such cycle exists.  The path runs
+    # along the top row, zigzags down through columns 1.., then back up
+    # column 0 (transposed when only cols is even).
+    if rows % 2 and cols % 2 or cols < 2 or rows < 2:
+        return None
+    transpose = rows % 2 == 1
+    width, height = (rows, cols) if transpose else (cols, rows)
+    order = [(x, 0) for x in range(width)]
+    for y in range(1, height):
+        xs = range(width - 1, 0, -1) if y % 2 else range(1, width)
+        order += [(x, y) for x in xs]
+    order += [(0, y) for y in range(height - 1, 0, -1)]
+    if transpose:
+        order = [(y, x) for x, y in order]
+    cells = [y * cols + x for x, y in order]
+    successor = array("i", bytes(4 * len(cells)))
+    for cell, following in zip(cells, cells[1:] + cells[:1]):
+        successor[cell] = following
+    return successor
+
+
+# ---------------- PLANNER ----------------
+class Planner:
+    """Chooses moves for one game at a time; see the module docstring."""
+
+    def __init__(self):
+        self.path = []  # Checked cells still to walk to the food
+        self.path_food = None
+        self.expected_head = None  # Where the head should be on the next call
+        self.on_cycle = False
+        self.stalled = 0  # Moves since the last one toward a checked food path
+
+    def plan(self, engine, deadline=None):
+        if not engine.alive or engine.food is None:
+            return None
+        cols = engine.cols
+        head_x, head_y = engine.snake[0]
+        head = head_y * cols + head_x
+        food = engine.food[1] * cols + engine.food[0]
+        if head != self.expected_head:
+            # New game, or a move this planner did not choose
+            self.path = []
+            self.on_cycle = False
+            self.stalled = 0
+
+        cell = self.choose(engine, head, food, deadline)
+        self.expected_head = cell
+        return None if cell is None else direction_to(head, cell, cols)
+
+    def choose(self, engine, head, food, deadline):
+        blocked = engine.occupied
+        cols = engine.cols
+        # Walls break the cycle, so level packs never use it
+        cycle = hamiltonian_cycle(cols, engine.rows) if engine.maps is None else None
+        if self.on_cycle:
+            return cycle[head]
+
+        # Reuse: nothing on a checked path changes until its food is eaten
+        if self.path and self.path_food == food and not blocked[self.path[0]]:
+            return self.path.pop(0)
+
+        try:
+            # After circling for a while, settle for a path that only escapes
+            # the body in time rather than one that keeps the tail in reach
+            check = self.escapes_after if self.stalled > STALL_FACTOR * len(engine.snake) else self.safe_after
+            for path in self.food_paths(engine, head, food, deadline):
+                if check(engine, path, deadline):
+                    self.path, self.path_food = path, food
+                    self.stalled = 0
+                    return self.path.pop(0)
+            self.path = []
+            self.stalled += 1
+
+            if cycle is not None and self.body_on_cycle(engine, cycle):
+                self.on_cycle = True
+                return cycle[head]
+
+            tail_x, tail_y = engine.snake[-1]
+            path = find_path(blocked, cols, head, tail_y * cols + tail_x, deadline)
+            # The tail cell itself only frees up after the move, so never step onto it
+            if path and len(path) > 1 and path[0] != food:
+                return path[0]
+        except OutOfTime:
+            pass
+        return self.roomiest(engine, head, cycle, deadline)
+
+    def food_paths(self, engine, head, food, deadline):
+        # The shortest path to the food, then the shortest one through each other
+        # open neighbour of the food: arriving from another side leaves the body
+        # lying elsewhere, which can keep the tail reachable
+        blocked = engine.occupied
+        cols = engine.cols
+        path = find_path(blocked, cols, head, food, deadline)
+        if path is None:
+            return
+        yield path
+        for cell in neighbours(food, cols, len(blocked)):
+            if cell == (path[-2] if len(path) > 1 else head) or blocked[cell]:
+                continue
+            blocked[food] = 1  # The way to the neighbour must not pass through the food
+            try:
+                approach = find_path(blocked, cols, head, cell, deadline)
+            finally:
+                blocked[food] = 0
+            if approach is not None:
+                yield approach + [food]
+
+    def safe_after(self, engine, path, deadline):
+        # After eating at the end of path, can the head still reach the tail?
+        cols = engine.cols
+        snake = engine.snake
+        blocked = engine.occupied[:]
+        keep = len(snake) + 1 - len(path)  # Body cells left behind the path
+        for x, y in islice(snake, max(keep, 0), None):
+            blocked[y * cols + x] = engine.is_wall(y * cols + x)
+        # The body after eating covers the end of the path; earlier path cells are left behind
+        for cell in path[-(len(snake) + 1):]:
+            blocked[cell] = 1
+        if keep > 0:
+            tail_x, tail_y = snake[keep - 1]
+            tail = tail_y * cols + tail_x
+        else:
+            tail = path[-keep]
+        if blocked.count(0) == 0:
+            return True  # Eating fills the board
+        return find_path(blocked, cols, path[-1], tail, deadline) is not None
+
+    def escapes_after(self, engine, path, deadline):
+        # After eating at the end of path, is there room to keep moving until
+        # the whole body has moved on?  Looser than safe_after(): a body cell
+        # counts as open once the tail has passed it, and any region at least
+        # as big as the snake is enough.
+        cols = engine.cols
+        length = len(engine.snake) + 1
+        body = path[::-1][:length]
+        body += [y * cols + x for x, y in islice(engine.snake, 0, length - len(body))]
+        free_after = {cell: length - i for i, cell in enumerate(body)}  # Moves until each body cell is open
+        blocked = engine.occupied
+        size = len(blocked)
+        seen = {body[0]}
+        frontier = [body[0]]
+        for moves in range(1, length + 1):
+            if deadline is not None and time.perf_counter() > deadline:
+                raise OutOfTime
+            next_frontier = []
+            for cell in frontier:
+                for other in neighbours(cell, cols, size):
+                    if other in seen or (blocked[other] and engine.is_wall(other)):
+                        continue
+                    # The tail still counts during the move that leaves its cell
+                    if free_after.get(other, 0) < moves:
+                        seen.add(other)
+                        next_frontier.append(other)
+            if len(seen) >= length:
+                return True
+            if not next_frontier:
+                return False
+            frontier = next_frontier
+        return True
+
+    def body_on_cycle(self, engine, cycle):
+        cols = engine.cols
+        cells = [y * cols + x for x, y in engine.snake]
+        return all(cycle[behind] == ahead for ahead, behind in zip(cells, cells[1:]))
+
+    def roomiest(self, engine, head, cycle, deadline):
+        # Last resort: the open neighbour with the most reachable room
+        blocked = engine.occupied
+        cols = engine.cols
+        limit = len(engine.snake) + 1
+        best = None
+        best_area = -1
+        for cell in neighbours(head, cols, len(blocked)):
+            if blocked[cell]:
+                continue
+            area = free_area(blocked, cols, cell, limit, deadline)
+            if area > best_area or (area == best_area and cycle is not None and cell == cycle[head]):
+                best, best_area = cell, area
+        return best
+
+
+_planners = weakref.WeakKeyDictionary()  # engine -> its planner
+
+
+def pathfinder(engine):
+    # Policy form for tournaments; one planner per game, dropped with its engine
+    planner = _planners.get(engine)
+    if planner is None:
+        planner = _planners[engine] = Planner()
+    return planner.plan(engine)
+
+
+# ---------------- WORKER THREAD ----------------
+class Autopilot:
+    """Plans each move on a worker thread while the current tick runs."""
+
+    def __init__(self, budget=BUDGET):
+        self.planner = Planner()
+        self.budget = budget
+        self.condition = threading.Condition()
+        self.request = None  # (engine clone, deadline), only the newest is kept
+        self.result = None  # (tick, direction)
+        self.closed = False
+        self.plan_times = RollingStats()  # ms per plan
+        self.late = 0  # Moves where the plan was not ready in time
+        self.thread = threading.Thread(target=self.run, name="autopilot", daemon=True)
+        self.thread.start()
+
+    def submit(self, engine):
+        # Call after each step: plans the next move from this state
+        deadline = time.perf_counter() + engine.speed * self.budget / 1000
+        with self.condition:
+            self.request = (engine.clone(), deadline)
+            self.condition.notify()
+
+    def take(self, engine):
+        # Call before each step: the planned move, or a quick safe one if it is late
+        with self.condition:
+            result, self.result = self.result, None
+        if result is not None and result[0] == engine.ticks:
+            return result[1]
+        self.late += 1
+        return greedy(engine)
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.request is None and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+                engine, deadline = self.request
+                self.request = None
+            start = time.perf_counter()
+            direction = self.planner.plan(engine, deadline)
+            self.plan_times.add((time.perf_counter() - start) * 1000)
+            with self.condition:
+                self.result = (engine.ticks, direction)
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
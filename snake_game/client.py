@@ -0,0 +1,182 @@
+"""Client for the room server (see snake_game.server), usable from Tk.
+
+A background thread reads server messages into a queue, so the Tk loop never
+blocks on the socket.  Connecting and the join handshake block until the room
+state arrives, so the Tk front end runs them on a thread with PendingJoin.  poll() drains the queue and mirrors each tick's
+events into a local SnakeEngine, which the renderers draw like a local game;
+the mirror never steps on its own.
+"""
+import json
+import queue
+import socket
+import threading
+
+from .engine import (
+    ATE,
+    BADGE,
+    DIED,
+    FOOD_MOVED,
+    HEAD_ADDED,
+    LEVEL_UP,
+    TAIL_REMOVED,
+    TURNED,
+    WON,
+    SnakeEngine,
+    make_badge,
+    speed_for_level,
+)
+
+DEFAULT_PORT = 8765
+
+
+def parse_address(address):
+    host, _, port = address.rpartition(":")
+    return (host or "localhost"), int(port or DEFAULT_PORT)
+
+
+class RoomClient:
+    def __init__(self, host, port, room="lobby", timeout=5.0):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.settimeout(None)  # The reader thread blocks; poll() never does
+        self.reader = self.sock.makefile("rb")
+        self.messages = queue.Queue()
+        self.closed = False
+        self.role = None
+        self.engine = None
+        self.thread = threading.Thread(target=self.run, name="room-client", daemon=True)
+        self.thread.start()
+        self.send({"type": "join", "room": room})
+
+        # The game screen needs the room state before it can draw anything
+        while self.engine is None:
+            try:
+                message = self.messages.get(timeout=timeout)
+            except queue.Empty:
+                self.close()
+                raise ConnectionError("no state received from the server") from None
+            self.handle(message)
+            if self.closed:
+                raise ConnectionError("server closed the connection")
+
+    def run(self):
+        try:
+            for line in self.reader:
+                self.messages.put(json.loads(line))
+        except (OSError, ValueError):
+            pass
+        self.messages.put({"type": "closed"})
+
+    def send(self, message):
+        try:
+            self.sock.sendall((json.dumps(message) + "\n").encode())
+        except OSError:
+            self.closed = True
+
+    def turn(self, direction):
+        if self.role == "player":
+            self.send({"type": "turn", "direction": direction})
+
+    def restart(self):
+        self.send({"type": "restart"})
+
+    def close(self):
+        self.closed = True
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+    # ---------------- MIRROR ----------------
+    def poll(self):
+        """Apply every message received so far; returns one event list per server tick."""
+        ticks = []
+        while True:
+            try:
+                message = self.messages.get_nowait()
+            except queue.Empty:
+                return ticks
+            events = self.handle(message)
+            if events is not None:
+                ticks.append(events)
+
+    def handle(self, message):
+        kind = message["type"]
+        if kind == "tick":
+            return self.apply(message["tick"], message["events"])
+        if kind == "joined":
+            self.role = message["role"]
+        elif kind == "state":
+            self.load_state(message)
+        elif kind == "closed":
+            self.closed = True
+        return None
+
+    def load_state(self, state):
+        engine = SnakeEngine(state["cols"], state["rows"], initial_speed=state["initial_speed"])
+        engine.set_body([tuple(cell) for cell in state["snake"]])
+        engine.food = tuple(state["food"]) if state["food"] else None
+        engine.direction = state["direction"]
+        engine.score = state["score"]
+        engine.level = state["level"]
+        engine.speed = state["speed"]
+        engine.achieved_badges = [make_badge(level) for level in state["badges"]]
+        engine.alive = state["alive"]
+        engine.ticks = state["tick"]
+        self.engine = engine
+
+    def apply(self, tick, encoded):
+        # Mirror one server move; returns the events in SnakeEngine.step() form
+        engine = self.engine
+        cols = engine.cols
+        engine.ticks = tick
+        events = []
+        for name, value in encoded:
+            if name == HEAD_ADDED:
+                value = tuple(value)
+                engine.snake.appendleft(value)
+                engine.occupied[value[1] * cols + value[0]] = 1
+                engine.free_cells.remove(value[1] * cols + value[0])
+            elif name == TAIL_REMOVED:
+                value = tuple(value)
+                engine.snake.pop()
+                engine.occupied[value[1] * cols + value[0]] = 0
+                engine.free_cells.add(value[1] * cols + value[0])
+            elif name == FOOD_MOVED:
+                value = tuple(value) if value else None
+                engine.food = value
+            elif name == TURNED:
+                engine.direction = value
+            elif name == ATE:
+                engine.score = value
+            elif name == LEVEL_UP:
+                engine.level = value
+                engine.speed = speed_for_level(value, engine.initial_speed)
+            elif name == BADGE:
+                value = make_badge(value)
+                engine.achieved_badges.append(value)
+            elif name in (DIED, WON):
+                engine.alive = False
+            events.append((name, value))
+        return events
+
+
+class PendingJoin:
+    """Joins a room on a background thread; poll done from the Tk loop."""
+
+    def __init__(self, host, port, room="lobby", timeout=5.0):
+        self.client = None
+        self.error = None
+        self.thread = threading.Thread(target=self.run, args=(host, port, room, timeout),
+                                       name="room-join", daemon=True)
+        self.thread.start()
+
+    @property
+    def done(self):
+        return not self.thread.is_alive()
+
+    def run(self, host, port, room, timeout):
+        try:
+            self.client = RoomClient(host, port, room, timeout)
+        except (OSError, ValueError) as error:
+            self.error = error
@@ -0,0 +1,31 @@
+"""Game configuration shared by the Tk front end and the headless engine."""
+
+# ---------------- CONFIG ----------------
+WIDTH = 600
+HEIGHT = 600
+BOX_SIZE = 20
+GRID_COLS = WIDTH // BOX_SIZE
+GRID_ROWS = HEIGHT // BOX_SIZE
+INITIAL_SPEED = 120  # Moderate starting speed (higher value = slower)
+MIN_SPEED = 40  # Maximum speed (lower value = faster)
+SPEED_STEP = 15  # Delay removed per level
+LEVEL_THRESHOLD = 5  # Points needed to advance to next level
+LEVELS_PER_STAGE = 2  # Levels between layout changes in a level pack (see snake_game.levels)
+
+# Board sizes offered in the settings (cols, rows); boards larger than the
+# window scroll to follow the head
+BOARD_SIZES = [(GRID_COLS, GRID_ROWS), (100, 100), (500, 500)]
+
+# Badge system configuration
+BADGE_LEVELS = {
+    2: {"name": "Bronze", "color": "#CD7F32", "emoji": "🥉"},
+    4: {"name": "Silver", "color": "#C0C0C0", "emoji": "🥈"},
+    6: {"name": "Gold", "color": "#FFD700", "emoji": "🥇"},
+    8: {"name": "Platinum", "color": "#E5E4E2", "emoji": "💎"},
+    10: {"name": "Diamond", "color": "#B9F2FF", "emoji": "💠"},
+    12: {"name": "Master", "color": "#9C27B0", "emoji": "🏆"},
+    14: {"name": "Legendary", "color": "#FF5722", "emoji": "🔥"},
+    16: {"name": "Mythic", "color": "#673AB7", "emoji": "⚡"},
+    18: {"name": "Eternal", "color": "#3F51B5", "emoji": "🌟"},
+    20: {"name": "Divine", "color": "#F44336", "emoji": "👑"}
+}
@@ -0,0 +1,278 @@
+"""Pure-Python snake rules.
+
+The engine holds the whole game state and advances it one logical move per
+``step()`` call, so games can be simulated without tkinter or a clock.
+Coordinates are grid cells ``(col, row)``; the front end scales them by
+``BOX_SIZE`` when drawing.
+
+The body is a deque (head at index 0) mirrored by a bytearray occupancy grid
+that is updated on every head push and tail pop, so movement, collision and
+food placement checks cost O(1) whatever the snake length.  Food is drawn
+uniformly from a FreeCells index, which stays O(1) on a nearly full board.
+
+With a level pack (see snake_game.levels) the grid also holds OBSTACLE on
+wall cells, so walls are checked by the same index.  A wall that appears
+under the body goes up when the tail leaves its cell.
+
+Key presses are queued by change_direction() and consumed one per tick, so
+two quick turns inside one tick both happen, on consecutive moves.  Each
+press is checked against the direction it will follow (the last queued or
+committed one), so no sequence of presses can turn the snake back into
+itself.
+"""
+import random
+from collections import deque
+
+from .config import (
+    BADGE_LEVELS,
+    GRID_COLS,
+    GRID_ROWS,
+    INITIAL_SPEED,
+    LEVEL_THRESHOLD,
+    MIN_SPEED,
+    SPEED_STEP,
+)
+from .levels import OBSTACLE, level_maps, no_walls
+
+DIRECTIONS = {"Up": (0, -1), "Down": (0, 1), "Left": (-1, 0), "Right": (1, 0)}
+OPPOSITE = {"Up": "Down", "Down": "Up", "Left": "Right", "Right": "Left"}
+INPUT_QUEUE_SIZE = 3  # Turns buffered ahead of the ticks that apply them
+
+# Event names returned by SnakeEngine.step() as (name, value) pairs
+ATE = "ate"  # value: new score
+LEVEL_UP = "level_up"  # value: new level
+BADGE = "badge"  # value: badge dict
+DIED = "died"  # value: None
+WON = "won"  # value: None, the snake filled the whole board
+TURNED = "turn"  # value: direction committed for this move
+# Board changes of a move, for incremental rendering
+HEAD_ADDED = "head"  # value: new head cell
+TAIL_REMOVED = "tail"  # value: vacated tail cell
+FOOD_MOVED = "food"  # value: new food cell, or None when the board is full
+WALLS_MOVED = "walls"  # value: (cells that stopped being walls, cells that became walls)
+
+
+def speed_for_level(level, initial_speed=INITIAL_SPEED):
+    # Increase speed (decrease the delay) with each level
+    return max(MIN_SPEED, initial_speed - (level - 1) * SPEED_STEP)
+
+
+def make_badge(level):
+    badge_info = BADGE_LEVELS[level]
+    return {"level": level, "name": badge_info["name"], "color": badge_info["color"], "emoji": badge_info["emoji"]}
+
+
+class SnakeEngine:
+    """State and rules of a single snake game."""
+
+    def __init__(self, cols=GRID_COLS, rows=GRID_ROWS, seed=None, initial_speed=INITIAL_SPEED, pack=None):
+        self.cols = cols
+        self.rows = rows
+        self.initial_speed = initial_speed
+        self.pack = pack  # Level pack name, None for an open board
+        self.maps = level_maps(pack, cols, rows) if pack else None
+        self.rng = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        self.stage = self.phase = 0
+        self.load_walls()
+        head_x, head_y = self.cols // 2, self.rows // 2
+        self.set_body([(head_x, head_y), (head_x - 1, head_y), (head_x - 2, head_y)])
+        self.direction = "Right"
+        self.pending = deque()  # Queued turns, applied one per tick
+        self.food = None
+        self.score = 0
+        self.level = 1
+        self.speed = speed_for_level(1, self.initial_speed)
+        self.achieved_badges = []
+        self.alive = True
+        self.ticks = 0
+        self.create_food()
+
+    def set_body(self, cells):
+        # Replace the body (head first), rebuilding the occupancy grid and free-cell index
+        self.snake = deque(cells)
+        self.occupied = bytearray(self.walls.mask)
+        self.free_cells = self.walls.free_cells.copy()
+        for index in self.moving:
+            self.occupied[index] = OBSTACLE
+            self.free_cells.remove(index)
+        for x, y in self.snake:
+            self.occupied[y * self.cols + x] = 1
+            self.free_cells.remove(y * self.cols + x)
+
+    def clone(self):
+        # Independent copy for lookahead; every container is copied at C speed
+        other = SnakeEngine.__new__(SnakeEngine)
+        other.__dict__.update(self.__dict__)
+        other.snake = self.snake.copy()
+        other.occupied = self.occupied[:]
+        other.free_cells = self.free_cells.copy()
+        other.pending = self.pending.copy()
+        other.achieved_badges = list(self.achieved_badges)
+        other.rng = random.Random(0)  # Seed is replaced by setstate()
+        other.rng.setstate(self.rng.getstate())
+        return other
+
+    def load_walls(self):
+        # Static walls and moving wall cells of the current stage and phase
+        if self.maps is None:
+            self.walls = no_walls(self.cols, self.rows)
+            self.moving = frozenset()
+        else:
+            stage = self.maps.stage(self.stage)
+            self.walls = stage.walls
+            self.moving = stage.moving_indexes[self.phase]
+
+    def wall_cells(self):
+        if self.maps is None:
+            return ()
+        return self.maps.stage(self.stage).cells(self.phase)
+
+    def is_wall(self, index):
+        return self.walls.mask[index] or index in self.moving
+
+    def is_occupied(self, cell):
+        # Body or wall
+        x, y = cell
+        return self.occupied[y * self.cols + x] != 0
+
+    def create_food(self):
+        # Only free cells are candidates, so food never spawns on the snake
+        cell = self.free_cells.sample(self.rng)
+        if cell is None:
+            self.food = None
+        else:
+            self.food = (cell % self.cols, cell // self.cols)
+
+    def change_direction(self, new_dir):
+        # Queue a turn for a later tick; returns whether it was accepted
+        last = self.pending[-1] if self.pending else self.direction
+        if (
+            new_dir not in DIRECTIONS or
+            new_dir == last or
+            new_dir == OPPOSITE[last] or
+            len(self.pending) >= INPUT_QUEUE_SIZE
+        ):
+            return False
+        self.pending.append(new_dir)
+        return True
+
+    def turn(self, new_dir, events):
+        # Commit the direction of this move; reversal is checked against the last committed move
+        if new_dir in DIRECTIONS and new_dir != self.direction and new_dir != OPPOSITE[self.direction]:
+            self.direction = new_dir
+            events.append((TURNED, new_dir))
+
+    def step(self, action=None):
+        # An explicit action (bots, replays) bypasses the key queue
+        events = []
+        if not self.alive:
+            return events
+        if action is not None:
+            self.turn(action, events)
+        elif self.pending:
+            self.turn(self.pending.popleft(), events)
+        self.ticks += 1
+
+        dx, dy = DIRECTIONS[self.direction]
+        head_x, head_y = self.snake[0]
+        new_x, new_y = head_x + dx, head_y + dy
+        occupied = self.occupied
+
+        # Edge, wall and self collision (the tail still counts, as it has not moved yet)
+        if (
+            not 0 <= new_x < self.cols or
+            not 0 <= new_y < self.rows or
+            occupied[new_y * self.cols + new_x]
+        ):
+            self.alive = False
+            events.append((DIED, None))
+            return events
+
+        new_head = (new_x, new_y)
+        self.snake.appendleft(new_head)
+        occupied[new_y * self.cols + new_x] = 1
+        self.free_cells.remove(new_y * self.cols + new_x)
+        events.append((HEAD_ADDED, new_head))
+
+        # Food collision
+        if new_head == self.food:
+            self.score += 1
+            events.append((ATE, self.score))
+            self.update_level(events)
+            self.create_food()
+            events.append((FOOD_MOVED, self.food))
+            if self.food is None:  # Board full
+                self.alive = False
+                events.append((WON, None))
+        else:
+            tail_x, tail_y = self.snake.pop()
+            tail = tail_y * self.cols + tail_x
+            if self.walls.mask[tail] or tail in self.moving:
+                occupied[tail] = OBSTACLE  # A wall went up under the body
+            else:
+                occupied[tail] = 0
+                self.free_cells.add(tail)
+            events.append((TAIL_REMOVED, (tail_x, tail_y)))
+
+        if self.maps is not None and self.alive:
+            period = self.maps.stage(self.stage).period
+            if period and self.ticks % period == 0:
+                self.move_walls(events)
+        return events
+
+    # ---------------- WALLS ----------------
+    def move_walls(self, events):
+        stage = self.maps.stage(self.stage)
+        leaving, entering = stage.changes[self.phase]
+        self.phase = (self.phase + 1) % len(stage.moving)
+        self.moving = stage.moving_indexes[self.phase]
+        self.replace_walls(leaving, entering, events)
+
+    def change_stage(self, events):
+        stage = self.maps.stage_for_level(self.level)
+        if stage == self.stage:
+            return
+        leaving = self.wall_cells()
+        self.stage, self.phase = stage, 0
+        self.load_walls()
+        self.replace_walls(leaving, self.wall_cells(), events)
+
+    def replace_walls(self, leaving, entering, events):
+        # Take down the walls that went and put up the new ones (self.walls and
+        # self.moving already describe the new layout); food under a new wall moves
+        cols = self.cols
+        occupied = self.occupied
+        for x, y in leaving:
+            index = y * cols + x
+            if occupied[index] == OBSTACLE:
+                occupied[index] = 0
+                self.free_cells.add(index)
+        for x, y in entering:
+            index = y * cols + x
+            if not occupied[index]:
+                occupied[index] = OBSTACLE
+                self.free_cells.remove(index)
+        events.append((WALLS_MOVED, (leaving, entering)))
+        if self.food is not None and occupied[self.food[1] * cols + self.food[0]] == OBSTACLE:
+            self.create_food()
+            events.append((FOOD_MOVED, self.food))
+
+    def update_level(self, events):
+        new_level = (self.score // LEVEL_THRESHOLD) + 1
+        if new_level > self.level:
+            self.level = new_level
+            self.speed = speed_for_level(self.level, self.initial_speed)
+            events.append((LEVEL_UP, self.level))
+            if self.maps is not None:
+                self.change_stage(events)
+            self.check_badge_achievement(events)
+
+    def check_badge_achievement(self, events):
+        achieved_levels = [b["level"] for b in self.achieved_badges]
+        if self.level in BADGE_LEVELS and self.level not in achieved_levels:
+            badge = make_badge(self.level)
+            self.achieved_badges.append(badge)
+            events.append((BADGE, badge))
@@ -0,0 +1,55 @@
+"""Index of empty board cells with O(1) add, remove and uniform sampling.
+
+Cells are stored as flat indexes (``row * cols + col``).  The first ``count``
+entries of ``cells`` are the free cells; ``positions`` maps every cell to its
+slot in ``cells``, so removing a cell is a swap with the last free slot.
+"""
+from array import array
+
+
+class FreeCells:
+    def __init__(self, size):
+        self.cells = array("i", range(size))
+        self.positions = array("i", range(size))
+        self.count = size
+
+    def copy(self):
+        other = FreeCells.__new__(FreeCells)
+        other.cells = self.cells[:]
+        other.positions = self.positions[:]
+        other.count = self.count
+        return other
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, cell):
+        return self.positions[cell] < self.count
+
+    def remove(self, cell):
+        cells, positions = self.cells, self.positions
+        slot = positions[cell]
+        last = self.count - 1
+        if slot > last:  # Already taken
+            return
+        moved = cells[last]
+        cells[slot], cells[last] = moved, cell
+        positions[moved], positions[cell] = slot, last
+        self.count = last
+
+    def add(self, cell):
+        cells, positions = self.cells, self.positions
+        slot = positions[cell]
+        first_taken = self.count
+        if slot < first_taken:  # Already free
+            return
+        moved = cells[first_taken]
+        cells[slot], cells[first_taken] = moved, cell
+        positions[moved], positions[cell] = slot, first_taken
+        self.count = first_taken + 1
+
+    def sample(self, rng):
+        # Uniform over the free cells; None when the board is full
+        if not self.count:
+            return None
+        return self.cells[rng.randrange(self.count)]
@@ -0,0 +1,111 @@
+"""Idle-state manager: no timer wakeups while nothing on screen moves.
+
+The front end schedules every ``after()`` timer through an IdleManager (the
+game loop takes it as its widget), so go_idle() can cancel all of them at
+once when the game is paused or over, a menu is shown, or the window is
+minimized or loses focus.  Nothing is rescheduled until wake().
+
+Losing focus or being unmapped calls ``on_hidden``, which the front end uses
+to auto-pause.  Focus moving between the app's own windows (such as the
+pause dialog) does not count: after a FocusOut the manager checks whether any
+window of the app still has focus.
+
+Every timer callback is counted, so wakeups_per_second() and the summary of
+each idle period returned by wake() show whether idle really costs nothing.
+"""
+import time
+from collections import deque
+
+WAKEUP_HISTORY = 4096  # Timestamps kept for wakeups_per_second()
+
+
+class IdleManager:
+    def __init__(self, widget, on_hidden=None, clock=time.monotonic):
+        self.widget = widget
+        self.on_hidden = on_hidden
+        self.clock = clock
+        self.timers = set()  # Pending after() handles
+        self.wakeups = deque(maxlen=WAKEUP_HISTORY)  # Times of recent timer callbacks
+        self.total_wakeups = 0
+        self.reason = None  # Why the app is idle, None while active
+        self.idle_since = None
+        self.idle_wakeups = 0
+        self.focus_check = None
+        widget.bind("<Unmap>", self.on_unmap, add="+")
+        widget.bind("<FocusOut>", self.on_focus_out, add="+")
+
+    @property
+    def idle(self):
+        return self.reason is not None
+
+    # ---------------- TIMERS ----------------
+    def after(self, ms, func):
+        # Same contract as Tk's after(), so GameLoop can use the manager as its widget
+        def fire():
+            self.timers.discard(handle)
+            self.count_wakeup()
+            func()
+        handle = self.widget.after(ms, fire)
+        self.timers.add(handle)
+        return handle
+
+    def after_cancel(self, handle):
+        self.timers.discard(handle)
+        self.widget.after_cancel(handle)
+
+    def suspend(self):
+        for handle in list(self.timers):
+            self.after_cancel(handle)
+
+    def count_wakeup(self):
+        self.wakeups.append(self.clock())
+        self.total_wakeups += 1
+        if self.reason is not None:
+            self.idle_wakeups += 1
+
+    # ---------------- STATE ----------------
+    def go_idle(self, reason):
+        self.suspend()
+        if self.reason is None:
+            self.idle_since = self.clock()
+            self.idle_wakeups = 0
+        self.reason = reason
+
+    def wake(self):
+        # Returns a summary of the idle period that just ended, or None
+        if self.reason is None:
+            return None
+        period = {
+            "reason": self.reason,
+            "seconds": self.clock() - self.idle_since,
+            "wakeups": self.idle_wakeups,
+        }
+        self.reason = None
+        return period
+
+    def wakeups_per_second(self, window=1.0):
+        since = self.clock() - window
+        return sum(1 for moment in self.wakeups if moment >= since) / window
+
+    # ---------------- VISIBILITY ----------------
+    def on_unmap(self, event):
+        if event.widget is self.widget:
+            self.hidden()
+
+    def on_focus_out(self, event):
+        # Focus may only be moving to another window of the app; check once it settles
+        if self.focus_check is None:
+            self.focus_check = self.widget.after_idle(self.check_focus)
+
+    def check_focus(self):
+        self.focus_check = None
+        try:
+            focused = self.widget.focus_get()
+        except KeyError:  # Tk cannot name some transient windows, such as open menus
+            focused = None
+        if focused is None:
+            self.hidden()
+
+    def hidden(self):
+        if self.on_hidden:
+            self.on_hidden()
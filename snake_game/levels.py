@@ -0,0 +1,204 @@
+"""Level packs: obstacle and maze layouts that change as the level rises.
+
+A pack is a list of stages, each ``(layouts, period)``.  A layout builds the
+wall cells of a board size as a list of phases: static layouts have one,
+moving obstacles have several and advance one phase every ``period`` ticks,
+looping.  The stage changes every LEVELS_PER_STAGE levels, and the last one
+is kept once the pack runs out.
+
+Stages are built once per pack and board size (level_maps() is cached, and
+each stage is built on first use).  The static walls of a stage become a
+Walls object: a collision mask laid out like the engine's occupancy grid,
+with OBSTACLE on wall cells, and a FreeCells index with those cells already
+taken out.  The engine starts from copies of both, so hitting a wall costs
+the movement step the same single index as hitting the body, and food is
+only ever drawn from open cells.  Moving walls are kept per phase as small
+sets of cells, with the cells that change on the way to the next phase, so
+a phase change touches only the cells that move.
+
+The spawn row is always kept clear.
+"""
+import random
+from functools import lru_cache, partial
+
+from .config import LEVELS_PER_STAGE
+from .freecells import FreeCells
+
+OBSTACLE = 2  # Occupancy value of a wall cell (the body is 1)
+SPAWN_CLEARANCE = 6  # Open cells kept ahead of the starting head
+
+
+class Walls:
+    """Static wall cells, in the forms the engine and renderers use."""
+
+    def __init__(self, cells, cols, rows):
+        size = cols * rows
+        indexes = sorted(y * cols + x for x, y in cells)
+        self.cells = tuple((index % cols, index // cols) for index in indexes)
+        mask = bytearray(size)
+        self.free_cells = FreeCells(size)
+        for index in indexes:
+            mask[index] = OBSTACLE
+            self.free_cells.remove(index)
+        self.mask = bytes(mask)
+
+
+@lru_cache(maxsize=4)
+def no_walls(cols, rows):
+    return Walls((), cols, rows)
+
+
+class Stage:
+    """Static walls plus the phases of the moving ones."""
+
+    def __init__(self, layouts, period, cols, rows):
+        head_x, head_y = cols // 2, rows // 2
+        clear = {(x, head_y) for x in range(head_x - 2, head_x + SPAWN_CLEARANCE + 1)}
+        static = set()
+        moving_parts = []
+        for layout in layouts:
+            phases = [{(x, y) for x, y in cells if 0 <= x < cols and 0 <= y < rows} - clear
+                      for cells in layout(cols, rows)]
+            if len(phases) == 1:
+                static |= phases[0]
+            else:
+                moving_parts.append(phases)
+        self.walls = Walls(static, cols, rows)
+
+        count = max([len(phases) for phases in moving_parts], default=1)
+        moving = [set().union(*(phases[i % len(phases)] for phases in moving_parts)) - static
+                  for i in range(count)]
+        self.period = period if count > 1 else 0
+        self.moving = [tuple(sorted(cells)) for cells in moving]  # Moving wall cells of each phase
+        self.moving_indexes = [frozenset(y * cols + x for x, y in cells) for cells in moving]
+        # (cells that stop, cells that start being walls) on the way to the next phase
+        self.changes = [
+            (tuple(sorted(cells - following)), tuple(sorted(following - cells)))
+            for cells, following in zip(moving, moving[1:] + moving[:1])
+        ]
+
+    def cells(self, phase):
+        # Every wall cell of a phase
+        return self.walls.cells + self.moving[phase]
+
+
+class CollisionMaps:
+    """The stages of a pack for one board size, each built on first use."""
+
+    def __init__(self, stages, cols, rows):
+        self.definitions = stages
+        self.cols = cols
+        self.rows = rows
+        self.stages = {}
+
+    def stage(self, index):
+        stage = self.stages.get(index)
+        if stage is None:
+            layouts, period = self.definitions[index]
+            stage = self.stages[index] = Stage(layouts, period, self.cols, self.rows)
+        return stage
+
+    def stage_for_level(self, level):
+        return min((level - 1) // LEVELS_PER_STAGE, len(self.definitions) - 1)
+
+
+# ---------------- LAYOUTS ----------------
+def border(cols, rows):
+    cells = {(x, y) for x in range(cols) for y in (0, rows - 1)}
+    cells |= {(x, y) for x in (0, cols - 1) for y in range(rows)}
+    return [cells]
+
+
+def pillars(cols, rows, spacing=7):
+    # 2x2 blocks on a grid, clear of the border
+    return [{
+        (x + dx, y + dy)
+        for x in range(spacing // 2 + 1, cols - 2, spacing)
+        for y in range(spacing // 2 + 1, rows - 2, spacing)
+        for dx in (0, 1) for dy in (0, 1)
+    }]
+
+
+def sweepers(cols, rows, length=5):
+    # Two bars sliding back and forth along the upper and lower quarter rows,
+    # in opposite directions
+    positions = list(range(1, cols - length))
+    positions += positions[-2:0:-1]
+    phases = []
+    for x in positions:
+        mirrored = cols - length - x
+        phases.append({(x + i, rows // 4) for i in range(length)} |
+                      {(mirrored + i, rows - 1 - rows // 4) for i in range(length)})
+    return phases
+
+
+def maze(cols, rows, seed=0, corridor=3, loops=0.3):
+    # Rooms ``corridor`` cells wide separated by one-cell walls, joined into a
+    # maze by a depth-first search; ``loops`` of the remaining walls between
+    # rooms are opened too, so there are few dead ends
+    rng = random.Random(seed)
+    step = corridor + 1
+    rooms_x = max(1, (cols + 1) // step)
+    rooms_y = max(1, (rows + 1) // step)
+
+    def span(index, rooms, size):
+        # Cells of a room along one axis; the last room takes up the remainder
+        return range(index * step, size if index == rooms - 1 else index * step + corridor)
+
+    cells = {(i * step + corridor, y) for i in range(rooms_x - 1) for y in range(rows)}
+    cells |= {(x, j * step + corridor) for j in range(rooms_y - 1) for x in range(cols)}
+
+    def opening(room, other):
+        # Wall cells between two neighbouring rooms
+        (i, j), (k, l) = room, other
+        if j == l:
+            x = min(i, k) * step + corridor
+            return {(x, y) for y in span(j, rooms_y, rows)}
+        y = min(j, l) * step + corridor
+        return {(x, y) for x in span(i, rooms_x, cols)}
+
+    seen = {(0, 0)}
+    stack = [(0, 0)]
+    closed = []  # Walls between rooms that the search did not open
+    while stack:
+        i, j = stack[-1]
+        unseen = [(i + dx, j + dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                  if 0 <= i + dx < rooms_x and 0 <= j + dy < rooms_y and (i + dx, j + dy) not in seen]
+        if not unseen:
+            stack.pop()
+            continue
+        other = rng.choice(unseen)
+        closed += [(stack[-1], room) for room in unseen if room != other]
+        cells -= opening(stack[-1], other)
+        seen.add(other)
+        stack.append(other)
+    for room, other in closed:
+        if rng.random() < loops:
+            cells -= opening(room, other)
+    return [cells]
+
+
+# ---------------- PACKS ----------------
+PACKS = {
+    "arena": [
+        ((), 0),
+        ((border,), 0),
+        ((border, pillars), 0),
+        ((border, sweepers), 2),
+        ((border, pillars, sweepers), 1),
+    ],
+    "maze": [
+        ((partial(maze, seed=1, loops=0.6),), 0),
+        ((partial(maze, seed=2, loops=0.4),), 0),
+        ((partial(maze, seed=3, loops=0.25),), 0),
+        ((partial(maze, seed=4, corridor=5, loops=0.4), sweepers), 2),
+    ],
+}
+PACK_NAMES = [None] + list(PACKS)  # Position is the pack's code in snapshots and replays
+
+
+@lru_cache(maxsize=8)
+def level_maps(pack, cols, rows):
+    if pack not in PACKS:
+        raise ValueError(f"unknown level pack {pack!r}")
+    return CollisionMaps(PACKS[pack], cols, rows)
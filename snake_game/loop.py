@@ -0,0 +1,161 @@
+"""Fixed-timestep game loop for Tk's ``after()`` scheduler.
+
+Logic runs at a fixed rate measured on a monotonic clock, independent of how
+long rendering takes.  When the loop falls behind it runs several logic
+updates in one wakeup (up to ``max_updates``) and renders only once, and it
+drops the backlog beyond that instead of spiralling.  The loop owns a single
+pending ``after`` handle, so start() can never leave two loops running.
+
+Frames run at a display rate of their own, the highest of FRAME_RATES up to
+``max_fps``, and render() gets the fraction of the tick elapsed so it can
+interpolate.  The loop measures each frame's cost (its work plus how late it
+woke up) and steps down to the next lower rate when the average over
+RATE_WINDOW frames exceeds FRAME_BUDGET of the frame period, and back up
+when it would fit comfortably in the faster one.  A render callback that
+returns False drew nothing and is counted in ``idle_frames``.
+
+The widget only needs ``after(ms, func)`` and ``after_cancel(handle)``.
+An optional FrameProfiler is told where each frame starts and ends and gets
+a "logic" mark after the updates; the render callback adds its own marks.
+"""
+import time
+from collections import deque
+
+# after() only has millisecond resolution, so a tick this close to due counts as due
+TOLERANCE = 0.001
+FRAME_RATES = (144, 120, 60, 30)  # Display rates to try, fastest first
+FRAME_BUDGET = 0.75  # Share of the frame period a frame may cost before the rate drops
+RATE_WINDOW = 30  # Frames averaged before changing rate
+
+
+class GameLoop:
+    def __init__(self, widget, update, render, tick_ms, max_fps=60, max_updates=5,
+                 clock=time.monotonic, history=256, profiler=None):
+        self.widget = widget
+        self.update = update  # Called once per logical tick
+        self.render = render  # Called with the fraction of the next tick elapsed
+        self.tick_ms = tick_ms  # Callable, as the tick length changes with the level
+        self.frame_rates = [rate for rate in FRAME_RATES if rate <= max_fps] or [FRAME_RATES[-1]]
+        self.rate_index = 0
+        self.frame_costs = deque(maxlen=RATE_WINDOW)
+        self.max_updates = max_updates
+        self.clock = clock
+        self.profiler = profiler
+        self.handle = None
+        self.active = False
+        self.accumulator = 0.0
+        self.last_time = 0.0
+        self.next_frame = 0.0
+        self.last_tick_time = None
+        self.tick_errors = deque(maxlen=history)  # Measured tick period minus target, in ms
+        self.dropped_ticks = 0
+        self.skipped_frames = 0
+        self.idle_frames = 0
+        self.rate_changes = 0
+
+    def start(self):
+        self.stop()
+        self.active = True
+        now = self.clock()
+        self.accumulator = 0.0
+        self.last_time = now
+        self.last_tick_time = None
+        self.next_frame = now + self.frame_seconds()
+        self.handle = self.widget.after(int(self.frame_seconds() * 1000), self.run_frame)
+
+    def stop(self):
+        self.active = False
+        if self.handle is not None:
+            self.widget.after_cancel(self.handle)
+            self.handle = None
+        if self.profiler:
+            self.profiler.skip_idle()
+
+    def tick_seconds(self):
+        return self.tick_ms() / 1000
+
+    @property
+    def fps(self):
+        return self.frame_rates[self.rate_index]
+
+    def frame_seconds(self):
+        return 1 / self.fps
+
+    def adapt_rate(self, cost):
+        self.frame_costs.append(cost)
+        if len(self.frame_costs) < RATE_WINDOW:
+            return
+        average = sum(self.frame_costs) / RATE_WINDOW
+        if average > FRAME_BUDGET * self.frame_seconds() and self.rate_index + 1 < len(self.frame_rates):
+            self.rate_index += 1
+        elif self.rate_index and average < FRAME_BUDGET / 2 / self.frame_rates[self.rate_index - 1]:
+            self.rate_index -= 1
+        else:
+            return
+        self.rate_changes += 1
+        self.frame_costs.clear()
+
+    def run_frame(self):
+        self.handle = None
+        if not self.active:
+            return
+        profiler = self.profiler
+        if profiler:
+            profiler.begin_frame()
+
+        now = self.clock()
+        late = max(0.0, now - self.next_frame)
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        # Catch up on logic, bounded so a long stall cannot freeze the UI
+        tick = self.tick_seconds()
+        updates = 0
+        while self.accumulator >= tick - TOLERANCE:
+            if updates == self.max_updates:
+                self.dropped_ticks += int(self.accumulator // tick)
+                self.accumulator %= tick
+                break
+            self.record_tick(now, tick)
+            self.update()
+            if not self.active:
+                return
+            self.accumulator -= tick
+            updates += 1
+            tick = self.tick_seconds()
+        if profiler:
+            profiler.mark("logic")
+
+        if self.render(min(max(self.accumulator / tick, 0.0), 1.0)) is False:
+            self.idle_frames += 1
+        if not self.active:
+            return
+        self.adapt_rate(self.clock() - now + late)
+
+        # Schedule against absolute deadlines so render time does not cause drift
+        frame = self.frame_seconds()
+        self.next_frame += frame
+        now = self.clock()
+        if self.next_frame < now:
+            missed = int((now - self.next_frame) // frame) + 1
+            self.skipped_frames += missed
+            self.next_frame += missed * frame
+        # Never sleep past the next logic tick
+        tick_due = self.last_time + self.tick_seconds() - self.accumulator
+        wake = min(self.next_frame, tick_due)
+        delay = max(0, round((wake - now) * 1000))
+        if profiler:
+            profiler.end_frame(delay)
+        self.handle = self.widget.after(delay, self.run_frame)
+
+    def record_tick(self, now, tick):
+        if self.last_tick_time is not None:
+            self.tick_errors.append((now - self.last_tick_time - tick) * 1000)
+        self.last_tick_time = now
+
+    def jitter(self):
+        # (mean absolute, worst absolute) tick period error in ms
+        if not self.tick_errors:
+            return 0.0, 0.0
+        errors = [abs(error) for error in self.tick_errors]
+        return sum(errors) / len(errors), max(errors)
@@ -0,0 +1,64 @@
+"""Precomputed colours and sprite geometry for the snake renderer.
+
+The render path only indexes these tables: body gradients are built once per
+snake length, and eye/food animations are tables indexed by the frame
+counter modulo their period.
+"""
+import math
+from functools import lru_cache
+
+from .config import BOX_SIZE
+
+HEAD_COLOR = "#4CAF50"
+OUTLINE_COLOR = "#81C784"
+FOOD_COLOR = "#F44336"
+FOOD_OUTLINE = "#FF5252"
+WALL_COLOR = "#546E7A"
+WALL_OUTLINE = "#78909C"
+
+# Animation periods in frames (abs(sin(0.1 * n)) and abs(sin(0.2 * n)) repeat
+# every ~31 and ~16 frames)
+FOOD_PULSE_FRAMES = 31
+EYE_FRAMES = 16
+FOOD_PULSE_PERIOD = 1.2  # Seconds per food pulse when driven by the animation timeline
+EYE_PERIOD = 0.64  # Seconds per eye animation cycle
+
+
+def body_color(intensity):
+    green_value = int(187 * intensity)  # 187 is the green component of #66BB6A
+    return f"#{int(102 * intensity):02x}{green_value:02x}{int(106 * intensity):02x}"
+
+
+@lru_cache(maxsize=8)
+def body_colors(length):
+    # Colour of every segment index for a snake of this length (index 0 is the
+    # head, which has its own colour)
+    return tuple(
+        body_color(max(0.4, 1.0 - (i / length) * 0.5))  # Fade effect
+        for i in range(length)
+    )
+
+
+def food_geometry(frame):
+    pulse = abs(math.sin(math.pi * frame / FOOD_PULSE_FRAMES)) * 2  # Pulsing effect
+    return (2 - pulse, 2 - pulse, BOX_SIZE - 2 + pulse, BOX_SIZE - 2 + pulse)
+
+
+def eye_geometry(direction, frame):
+    eye_size = 3 + abs(math.sin(math.pi * frame / EYE_FRAMES))
+    if direction == "Right":
+        return ((12, 6, 12 + eye_size, 6 + eye_size), (12, 12, 12 + eye_size, 12 + eye_size))
+    elif direction == "Left":
+        return ((4 - eye_size, 6, 4, 6 + eye_size), (4 - eye_size, 12, 4, 12 + eye_size))
+    elif direction == "Up":
+        return ((6, 4 - eye_size, 6 + eye_size, 4), (12, 4 - eye_size, 12 + eye_size, 4))
+    else:  # Down
+        return ((6, 12, 6 + eye_size, 12 + eye_size), (12, 12, 12 + eye_size, 12 + eye_size))
+
+
+# Offsets relative to the top-left corner of the cell
+FOOD_PULSE = [food_geometry(frame) for frame in range(FOOD_PULSE_FRAMES)]
+EYES = {
+    direction: [eye_geometry(direction, frame) for frame in range(EYE_FRAMES)]
+    for direction in ("Up", "Down", "Left", "Right")
+}
@@ -0,0 +1,42 @@
+"""Simple autopilot policies for headless games.
+
+A policy is a callable taking a SnakeEngine and returning the direction to
+steer next (or None to keep going).  Policies must be importable top-level
+functions so they can be named as ``"module:function"`` and sent to worker
+processes.
+"""
+from .engine import DIRECTIONS, OPPOSITE
+
+
+def straight(engine):
+    return None
+
+
+def is_safe(engine, direction):
+    dx, dy = DIRECTIONS[direction]
+    head_x, head_y = engine.snake[0]
+    x, y = head_x + dx, head_y + dy
+    return 0 <= x < engine.cols and 0 <= y < engine.rows and not engine.is_occupied((x, y))
+
+
+def greedy(engine):
+    # Head toward the food, preferring the axis with the larger gap, and never
+    # step into a wall or the body when another move exists
+    preferred = []
+    if engine.food is None:
+        # Nothing left to eat (the board is full): keep going while it is safe
+        preferred.append(engine.direction)
+    else:
+        (head_x, head_y), (food_x, food_y) = engine.snake[0], engine.food
+        if abs(food_x - head_x) >= abs(food_y - head_y):
+            preferred.append("Right" if food_x > head_x else "Left")
+            preferred.append("Down" if food_y > head_y else "Up")
+        else:
+            preferred.append("Down" if food_y > head_y else "Up")
+            preferred.append("Right" if food_x > head_x else "Left")
+    preferred += [d for d in DIRECTIONS if d not in preferred]
+
+    for direction in preferred:
+        if direction != OPPOSITE[engine.direction] and is_safe(engine, direction):
+            return direction
+    return None
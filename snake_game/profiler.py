@@ -0,0 +1,207 @@
+"""Opt-in frame-time instrumentation and an on-canvas performance HUD.
+
+FrameProfiler splits every frame into phases: the loop calls begin_frame(),
+then mark(name) after each phase, then end_frame() with the delay it asked
+``after()`` for.  It also records the idle gap between frames and how late
+the scheduler woke up compared with the requested delay.  Per-phase times go
+into fixed-size ring buffers for rolling percentiles.  While tracing, phases
+are also kept as Chrome trace events (open the dump in chrome://tracing or
+Perfetto).
+
+Input latency is measured from a key press to the end of the frame that
+first shows the turn: key_pressed() when the engine queues the turn,
+key_applied() when a tick commits it and end_frame() closes it.  It appears
+as the ``input`` phase.
+
+Nothing is measured until ``enabled`` is set, and a disabled profiler costs
+one attribute check per call.
+"""
+import json
+import time
+from array import array
+from collections import deque
+
+
+class RollingStats:
+    def __init__(self, size=240):
+        self.values = array("d", bytes(8 * size))
+        self.size = size
+        self.count = 0
+        self.index = 0
+
+    def add(self, value):
+        self.values[self.index] = value
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def percentile(self, p):
+        if not self.count:
+            return 0.0
+        ordered = sorted(self.values[:self.count])
+        return ordered[min(self.count - 1, int(p / 100 * self.count))]
+
+    def mean(self):
+        if not self.count:
+            return 0.0
+        return sum(self.values[:self.count]) / self.count
+
+
+class FrameProfiler:
+    def __init__(self, clock=time.perf_counter, history=240, trace_limit=50000):
+        self.clock = clock
+        self.history = history
+        self.enabled = False
+        self.tracing = False
+        self.phases = {}  # Phase name -> RollingStats of ms
+        self.frame_times = RollingStats(history)
+        self.frame_starts = deque(maxlen=history)
+        self.trace = deque(maxlen=trace_limit)
+        self.frame_start = None
+        self.last_mark = None
+        self.last_frame_end = None
+        self.requested_delay = None
+        self.queued_keys = deque()  # Press times of turns waiting for a tick
+        self.applied_keys = []  # Press times of turns committed this frame
+
+    def stats(self, name):
+        if name not in self.phases:
+            self.phases[name] = RollingStats(self.history)
+        return self.phases[name]
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        now = self.clock()
+        if self.last_frame_end is not None:
+            idle = (now - self.last_frame_end) * 1000
+            self.stats("idle").add(idle)
+            # How much later than requested the after() callback fired
+            self.stats("late").add(idle - self.requested_delay)
+            self.add_trace("idle", self.last_frame_end, now)
+        self.frame_start = self.last_mark = now
+        self.frame_starts.append(now)
+
+    def mark(self, name):
+        # Attribute the time since the previous mark to the named phase
+        if not self.enabled or self.last_mark is None:
+            return
+        now = self.clock()
+        self.stats(name).add((now - self.last_mark) * 1000)
+        self.add_trace(name, self.last_mark, now)
+        self.last_mark = now
+
+    def end_frame(self, requested_delay_ms):
+        if not self.enabled or self.frame_start is None:
+            return
+        now = self.clock()
+        self.frame_times.add((now - self.frame_start) * 1000)
+        for pressed in self.applied_keys:
+            self.stats("input").add((now - pressed) * 1000)
+            self.add_trace("input", pressed, now, tid=2)
+        self.applied_keys.clear()
+        self.last_frame_end = now
+        self.requested_delay = requested_delay_ms
+        self.frame_start = self.last_mark = None
+
+    def skip_idle(self):
+        # Called when the loop stops, so a pause is not counted as an idle gap
+        # or as input latency
+        self.last_frame_end = None
+        self.queued_keys.clear()
+        self.applied_keys.clear()
+
+    def key_pressed(self):
+        if self.enabled:
+            self.queued_keys.append(self.clock())
+
+    def key_applied(self):
+        # A tick committed the oldest queued turn
+        if self.enabled and self.queued_keys:
+            self.applied_keys.append(self.queued_keys.popleft())
+
+    def add_trace(self, name, start, end, tid=1):
+        if self.tracing:
+            self.trace.append({
+                "name": name, "ph": "X", "pid": 1, "tid": tid,
+                "ts": start * 1e6, "dur": (end - start) * 1e6,
+            })
+
+    def fps(self):
+        if len(self.frame_starts) < 2:
+            return 0.0
+        span = self.frame_starts[-1] - self.frame_starts[0]
+        return (len(self.frame_starts) - 1) / span if span else 0.0
+
+    def summary(self):
+        phases = {
+            name: {"mean": stats.mean(), "p50": stats.percentile(50), "p99": stats.percentile(99)}
+            for name, stats in self.phases.items()
+        }
+        return {
+            "fps": self.fps(),
+            "frame_p50": self.frame_times.percentile(50),
+            "frame_p99": self.frame_times.percentile(99),
+            "phases": phases,
+        }
+
+    def dump_trace(self, path):
+        with open(path, "w") as f:
+            json.dump({"traceEvents": list(self.trace), "otherData": self.summary()}, f)
+
+    def reset(self):
+        self.phases.clear()
+        self.frame_times = RollingStats(self.history)
+        self.frame_starts.clear()
+        self.trace.clear()
+        self.queued_keys.clear()
+        self.applied_keys.clear()
+        self.frame_start = self.last_mark = self.last_frame_end = None
+
+
+class PerformanceHud:
+    """Text overlay in the corner of a canvas showing FPS, frame times and item count."""
+
+    def __init__(self, canvas, profiler, refresh_ms=250, clock=time.perf_counter, extra=None):
+        self.canvas = canvas
+        self.profiler = profiler
+        self.extra = extra  # Optional callable returning more lines to show
+        self.refresh = refresh_ms / 1000
+        self.clock = clock
+        self.visible = False
+        self.last_refresh = 0.0
+        self.background = canvas.create_rectangle(4, 4, 4, 4, fill="#000000", outline="#4CAF50",
+                                                  state="hidden", tags=("hud", "overlay"))
+        self.text = canvas.create_text(10, 8, anchor="nw", fill="#4CAF50", font=("Courier", 10),
+                                       state="hidden", tags=("hud", "overlay"))
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.profiler.enabled = self.profiler.tracing = self.visible
+        if not self.visible:
+            self.profiler.reset()
+        state = "normal" if self.visible else "hidden"
+        self.canvas.itemconfig("hud", state=state)
+        self.canvas.tag_raise("hud")
+        self.last_refresh = 0.0
+
+    def update(self):
+        # Throttled so the HUD itself stays out of the measurements
+        if not self.visible:
+            return
+        now = self.clock()
+        if now - self.last_refresh < self.refresh:
+            return
+        self.last_refresh = now
+
+        summary = self.profiler.summary()
+        lines = [
+            f"FPS {summary['fps']:5.1f}  items {len(self.canvas.find_all())}",
+            f"frame p50 {summary['frame_p50']:5.2f}ms  p99 {summary['frame_p99']:5.2f}ms",
+        ]
+        for name, stats in summary["phases"].items():
+            lines.append(f"{name:6} p50 {stats['p50']:5.2f}ms  p99 {stats['p99']:5.2f}ms")
+        if self.extra:
+            lines += self.extra()
+        self.canvas.itemconfig(self.text, text="\n".join(lines))
+        x1, y1, x2, y2 = self.canvas.bbox(self.text)
+        self.canvas.coords(self.background, x1 - 4, y1 - 2, x2 + 4, y2 + 2)
@@ -0,0 +1,571 @@
+"""Display-free rasterizer: board states to PPM, PNG and animated GIF images.
+
+Frames are drawn into an indexed pixel buffer, a bytearray with one palette
+index per pixel, so filling a run of pixels is a single slice assignment and
+no drawing step touches pixels one at a time.  The palette stays small (the
+body gradient has at most ~100 shades), which suits PNG colour type 3 and
+GIF directly; PPM and to_array() expand it to RGB with bytes.translate().
+
+Like the Tk renderers, the static part of the board (background, grid and
+static walls of a level pack) is drawn once per layout and copied for every
+frame; the body, head, food, eyes, moving walls and overlays are stamped on
+top from cached sprites.  The overlays are a score strip above the board,
+drawn with a tiny built-in bitmap font, and a dithered dim with a banner
+once the game is over.
+
+Exporting replays splits the ticks into chunks for a process pool; each
+worker seeks to its chunk through the replay keyframes and renders it on its
+own.  A GIF is a single file, so it is encoded in one process, and each
+frame after the first only stores the rectangle that changed.
+
+    python -m snake_game.raster game.snkr --out frames --format png --box 8
+    python -m snake_game.raster game.snkr --out game.gif --every 2
+    python -m snake_game.raster *.snkr --out thumbnails --thumbnail
+"""
+import argparse
+import math
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from .animation import BACKGROUND
+from .config import BOX_SIZE
+from .palette import (
+    EYE_FRAMES,
+    EYES,
+    FOOD_COLOR,
+    FOOD_OUTLINE,
+    FOOD_PULSE,
+    HEAD_COLOR,
+    OUTLINE_COLOR,
+    WALL_COLOR,
+    WALL_OUTLINE,
+    body_colors,
+)
+from .render import GRID_COLOR
+from .replay import Replay, ReplayPlayer
+
+HUD_COLOR = "#1a1a1a"
+TEXT_COLOR = "#FFFFFF"
+DIM_COLOR = "#000000"
+GAME_OVER_COLOR = "#F44336"
+WIN_COLOR = "#4CAF50"
+MIN_GRID_BOX = 6  # Smaller cells are drawn without grid lines
+CHUNK_FRAMES = 500  # Frames per process pool job
+
+# 3x5 bitmap font, rows top to bottom
+FONT = {
+    " ": "000 000 000 000 000",
+    "0": "111 101 101 101 111", "1": "010 110 010 010 111", "2": "111 001 111 100 111",
+    "3": "111 001 111 001 111", "4": "101 101 111 001 001", "5": "111 100 111 001 111",
+    "6": "111 100 111 101 111", "7": "111 001 001 001 001", "8": "111 101 111 101 111",
+    "9": "111 101 111 001 111", "A": "010 101 111 101 101", "C": "111 100 100 100 111",
+    "E": "111 100 110 100 111", "G": "111 100 101 101 111", "I": "111 010 010 010 111",
+    "L": "100 100 100 100 111", "M": "101 111 111 101 101", "N": "110 101 101 101 101",
+    "O": "111 101 101 101 111", "R": "110 101 110 101 101", "S": "111 100 111 001 111",
+    "U": "101 101 101 101 111", "V": "101 101 101 101 010", "W": "101 101 111 111 101",
+    "Y": "101 101 010 010 010",
+}
+
+
+class RasterError(ValueError):
+    pass
+
+
+def rgb(color):
+    value = int(color[1:], 16)
+    return value >> 16, value >> 8 & 0xFF, value & 0xFF
+
+
+# ---------------- SPRITES ----------------
+# A sprite is a tuple of (dy, dx, run of palette indexes) spans
+def rect_sprite(width, height, fill, outline, border):
+    border = min(border, width // 2, height // 2)
+    edge = bytes([outline]) * width
+    middle = bytes([outline]) * border + bytes([fill]) * (width - 2 * border) + bytes([outline]) * border
+    return tuple((dy, 0, edge if dy < border or dy >= height - border else middle) for dy in range(height))
+
+
+def ellipse_spans(x1, y1, x2, y2, clip):
+    # (dy, x start, x end) rows of an ellipse inside the box (x1, y1, x2, y2), clipped to [0, clip)
+    cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+    rx, ry = (x2 - x1) / 2, (y2 - y1) / 2
+    spans = []
+    if rx <= 0 or ry <= 0:
+        return spans
+    for dy in range(max(0, math.floor(y1)), min(clip, math.ceil(y2))):
+        t = (dy + 0.5 - cy) / ry
+        if abs(t) >= 1:
+            continue
+        half = rx * math.sqrt(1 - t * t)
+        start, end = max(0, round(cx - half)), min(clip, round(cx + half))
+        if end > start:
+            spans.append((dy, start, end))
+    return spans
+
+
+def ellipse_sprite(geometry, scale, box, fill, outline=None, border=0):
+    x1, y1, x2, y2 = (value * scale for value in geometry)
+    rows = {}
+    layers = [(x1, y1, x2, y2, outline)] if outline is not None else []
+    layers.append((x1 + border, y1 + border, x2 - border, y2 - border, fill))
+    for lx1, ly1, lx2, ly2, color in layers:
+        for dy, start, end in ellipse_spans(lx1, ly1, lx2, ly2, box):
+            row = rows.setdefault(dy, {})
+            for x in range(start, end):
+                row[x] = color
+    sprite = []
+    for dy, row in sorted(rows.items()):
+        # Split each row into contiguous runs
+        xs = sorted(row)
+        run_start = xs[0]
+        for a, b in zip(xs, xs[1:] + [None]):
+            if b != a + 1:
+                sprite.append((dy, run_start, bytes(row[x] for x in range(run_start, a + 1))))
+                run_start = b
+    return tuple(sprite)
+
+
+@lru_cache(maxsize=64)
+def glyph_spans(char, scale):
+    # (dy, dx, width) runs of one character at this scale
+    spans = []
+    for row, bits in enumerate(FONT[char].split()):
+        x = 0
+        while x < 3:
+            if bits[x] == "1":
+                start = x
+                while x < 3 and bits[x] == "1":
+                    x += 1
+                for dy in range(scale):
+                    spans.append((row * scale + dy, start * scale, (x - start) * scale))
+            else:
+                x += 1
+    return tuple(spans)
+
+
+# ---------------- RASTERIZER ----------------
+class Palette:
+    """Colours of an indexed image, numbered in order of first use."""
+
+    def __init__(self):
+        self.colors = []
+        self.indexes = {}
+
+    def index(self, color):
+        index = self.indexes.get(color)
+        if index is None:
+            if len(self.colors) == 256:
+                raise RasterError("an indexed frame holds at most 256 colours")
+            index = self.indexes[color] = len(self.colors)
+            self.colors.append(color)
+        return index
+
+    def channels(self):
+        # One 256-entry translate() table per RGB channel
+        values = [rgb(color) for color in self.colors] + [(0, 0, 0)] * (256 - len(self.colors))
+        return [bytes(value[channel] for value in values) for channel in range(3)]
+
+    def to_bytes(self, size=None):
+        # RGB triples, padded with black to size entries
+        size = size or len(self.colors)
+        return b"".join(bytes(rgb(color)) for color in self.colors).ljust(3 * size, b"\0")
+
+
+class Rasterizer:
+    """Draws engine states of one board size into indexed pixel buffers."""
+
+    def __init__(self, cols, rows, box=BOX_SIZE, hud=True):
+        self.cols = cols
+        self.rows = rows
+        self.box = box
+        self.scale = box / BOX_SIZE  # Sprite geometry in the palette is for BOX_SIZE cells
+        self.text_scale = max(1, box // 6)
+        self.hud_height = 7 * self.text_scale if hud else 0
+        self.width = cols * box
+        self.height = rows * box + self.hud_height
+        self.palette = Palette()
+        self.backgrounds = {}  # (pack, stage) -> static pixels
+        self.sprites = {}
+
+    # ---------------- SPRITE CACHE ----------------
+    def cell_sprite(self, fill, outline, border):
+        key = ("cell", fill, outline, border)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            index = self.palette.index
+            width = max(1, round(border * self.scale)) if self.box > 2 else 0
+            sprite = self.sprites[key] = rect_sprite(self.box, self.box, index(fill), index(outline), width)
+        return sprite
+
+    def body_sprites(self, length):
+        # Sprite of every segment, head first; the head is drawn over its entry
+        key = ("body", length)
+        sprites = self.sprites.get(key)
+        if sprites is None:
+            sprites = self.sprites[key] = [self.cell_sprite(color, OUTLINE_COLOR, 1)
+                                           for color in body_colors(length)]
+        return sprites
+
+    def food_sprite(self, frame):
+        key = ("food", frame)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            index = self.palette.index
+            sprite = self.sprites[key] = ellipse_sprite(
+                FOOD_PULSE[frame], self.scale, self.box, index(FOOD_COLOR), index(FOOD_OUTLINE),
+                2 * self.scale)
+        return sprite
+
+    def eye_sprites(self, direction, frame):
+        key = ("eyes", direction, frame)
+        sprites = self.sprites.get(key)
+        if sprites is None:
+            white = self.palette.index("#FFFFFF")
+            sprites = self.sprites[key] = [ellipse_sprite(eye, self.scale, self.box, white)
+                                           for eye in EYES[direction][frame]]
+        return sprites
+
+    # ---------------- DRAWING ----------------
+    def stamp(self, pixels, sprite, x, y):
+        width = self.width
+        for dy, dx, run in sprite:
+            start = (y + dy) * width + x + dx
+            pixels[start:start + len(run)] = run
+
+    def fill(self, pixels, x, y, width, height, color):
+        run = bytes([self.palette.index(color)]) * width
+        for row in range(y, y + height):
+            start = row * self.width + x
+            pixels[start:start + width] = run
+
+    def stamp_cell(self, pixels, cell, sprite):
+        self.stamp(pixels, sprite, cell[0] * self.box, cell[1] * self.box + self.hud_height)
+
+    def background(self, engine):
+        # Background, grid and static walls, drawn once per layout
+        key = (engine.pack, engine.stage)
+        pixels = self.backgrounds.get(key)
+        if pixels is not None:
+            return pixels
+        index = self.palette.index
+        pixels = bytearray([index(BACKGROUND)]) * (self.width * self.height)
+        self.fill(pixels, 0, 0, self.width, self.hud_height, HUD_COLOR)
+        if self.box >= MIN_GRID_BOX:
+            grid = index(GRID_COLOR)
+            for y in range(self.hud_height, self.height, self.box):
+                pixels[y * self.width:(y + 1) * self.width] = bytes([grid]) * self.width
+            for y in range(self.hud_height, self.height):
+                pixels[y * self.width:(y + 1) * self.width:self.box] = bytes([grid]) * self.cols
+        if engine.maps is not None:
+            wall = self.cell_sprite(WALL_COLOR, WALL_OUTLINE, 1)
+            for cell in engine.maps.stage(engine.stage).walls.cells:
+                self.stamp_cell(pixels, cell, wall)
+        self.backgrounds[key] = pixels
+        return pixels
+
+    def text(self, pixels, text, x, y, color, scale):
+        run = bytes([self.palette.index(color)])
+        width = self.width
+        for char in text:
+            if x + 3 * scale > width:
+                break
+            for dy, dx, length in glyph_spans(char, scale):
+                start = (y + dy) * width + x + dx
+                pixels[start:start + length] = run * length
+            x += 4 * scale
+
+    def dim(self, pixels):
+        # 50% checkerboard over the board: darkens without adding colours
+        black = self.palette.index(DIM_COLOR)
+        width = self.width
+        run = bytes([black]) * (width // 2)
+        for y in range(self.hud_height, self.height):
+            start = y * width + (y & 1)
+            pixels[start:start + 2 * len(run):2] = run
+
+    def draw(self, engine, frame=None):
+        """Pixels of the engine state; frame picks the food/eye animation phase (default: the tick)."""
+        frame = engine.ticks if frame is None else frame
+        pixels = bytearray(self.background(engine))
+
+        if engine.maps is not None:
+            stage = engine.maps.stage(engine.stage)
+            if stage.moving[engine.phase]:
+                wall = self.cell_sprite(WALL_COLOR, WALL_OUTLINE, 1)
+                for cell in stage.moving[engine.phase]:
+                    self.stamp_cell(pixels, cell, wall)
+        if engine.food is not None:
+            self.stamp_cell(pixels, engine.food, self.food_sprite(frame % len(FOOD_PULSE)))
+
+        snake = engine.snake
+        width, box, top = self.width, self.box, self.hud_height
+        for (x, y), sprite in zip(snake, self.body_sprites(len(snake))):
+            offset = (y * box + top) * width + x * box
+            for dy, dx, run in sprite:
+                start = offset + dy * width + dx
+                pixels[start:start + len(run)] = run
+        head = snake[0]
+        self.stamp_cell(pixels, head, self.cell_sprite(HEAD_COLOR, OUTLINE_COLOR, 2))
+        for eye in self.eye_sprites(engine.direction, frame % EYE_FRAMES):
+            self.stamp_cell(pixels, head, eye)
+
+        if self.hud_height:
+            scale = self.text_scale
+            self.text(pixels, f"SCORE {engine.score}  LEVEL {engine.level}", scale, scale, TEXT_COLOR, scale)
+        if not engine.alive:
+            won = engine.food is None
+            banner = "YOU WIN" if won else "GAME OVER"
+            scale = max(1, min(2 * self.text_scale, self.width // (4 * len(banner) + 2)))
+            self.dim(pixels)
+            x = (self.width - (4 * len(banner) - 1) * scale) // 2
+            y = self.hud_height + (self.rows * self.box - 5 * scale) // 2
+            self.text(pixels, banner, x, y, WIN_COLOR if won else GAME_OVER_COLOR, scale)
+        return pixels
+
+    # ---------------- OUTPUT ----------------
+    def to_rgb(self, pixels):
+        red, green, blue = self.palette.channels()
+        out = bytearray(3 * len(pixels))
+        out[0::3] = pixels.translate(red)
+        out[1::3] = pixels.translate(green)
+        out[2::3] = pixels.translate(blue)
+        return out
+
+    def to_array(self, pixels):
+        # (height, width, 3) uint8 NumPy array; NumPy is only needed here
+        import numpy as np
+        return np.frombuffer(self.to_rgb(pixels), np.uint8).reshape(self.height, self.width, 3)
+
+    def to_ppm(self, pixels):
+        return b"P6\n%d %d\n255\n" % (self.width, self.height) + self.to_rgb(pixels)
+
+    def to_png(self, pixels, level=1):
+        width = self.width
+        rows = b"".join(b"\0" + pixels[y * width:(y + 1) * width] for y in range(self.height))
+        return b"".join([
+            b"\x89PNG\r\n\x1a\n",
+            png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, self.height, 8, 3, 0, 0, 0)),
+            png_chunk(b"PLTE", self.palette.to_bytes()),
+            png_chunk(b"IDAT", zlib.compress(rows, level)),
+            png_chunk(b"IEND", b""),
+        ])
+
+    def save(self, path, pixels):
+        # Format from the file extension: .png or .ppm
+        data = self.to_ppm(pixels) if path.endswith(".ppm") else self.to_png(pixels)
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+def png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+# ---------------- GIF ----------------
+def lzw_encode(pixels, min_code_size=8):
+    """GIF LZW code stream of a run of palette indexes, packed into bytes."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    bits = 0
+    count = 0  # Bits waiting in ``bits``
+    width = min_code_size + 1
+    codes = {}
+    next_code = end + 1
+
+    def emit(code):
+        nonlocal bits, count
+        bits |= code << count
+        count += width
+        while count >= 8:
+            out.append(bits & 0xFF)
+            bits >>= 8
+            count -= 8
+
+    emit(clear)
+    prefix = None
+    for value in pixels:
+        if prefix is None:
+            prefix = value
+            continue
+        code = codes.get((prefix, value))
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix)
+        if next_code < 4096:
+            codes[prefix, value] = next_code
+            next_code += 1
+            if next_code > 1 << width and width < 12:
+                width += 1
+        else:
+            emit(clear)
+            codes.clear()
+            next_code = end + 1
+            width = min_code_size + 1
+        prefix = value
+    if prefix is not None:
+        emit(prefix)
+    emit(end)
+    if count:
+        out.append(bits & 0xFF)
+    return bytes(out)
+
+
+def changed_box(previous, pixels, width):
+    # Smallest (x, y, w, h) holding every pixel that differs, or None
+    if previous == pixels:
+        return None
+    diff = int.from_bytes(previous, "big") ^ int.from_bytes(pixels, "big")
+    size = len(pixels)
+    first = size - (diff.bit_length() + 7) // 8
+    last = size - 1 - ((diff & -diff).bit_length() - 1) // 8
+    top, bottom = first // width, last // width
+    left, right = width, 0
+    for y in range(top, bottom + 1):
+        row = slice(y * width, (y + 1) * width)
+        row_diff = int.from_bytes(previous[row], "big") ^ int.from_bytes(pixels[row], "big")
+        if row_diff:
+            left = min(left, width - (row_diff.bit_length() + 7) // 8)
+            right = max(right, width - 1 - ((row_diff & -row_diff).bit_length() - 1) // 8)
+    return left, top, right - left + 1, bottom - top + 1
+
+
+class GifWriter:
+    """Animated GIF built frame by frame; each frame stores only what changed."""
+
+    def __init__(self, path, rasterizer, delay=0.1):
+        self.path = path
+        self.rasterizer = rasterizer
+        self.delay = max(2, round(delay * 100))  # GIF delays are in 1/100 s
+        self.frames = []
+        self.previous = None
+
+    def add(self, pixels):
+        raster = self.rasterizer
+        width = raster.width
+        if self.previous is None:
+            box = (0, 0, width, raster.height)
+        else:
+            box = changed_box(self.previous, pixels, width)
+            if box is None:
+                # Nothing changed: hold the last frame longer
+                self.frames[-1][1] += self.delay
+                return
+        x, y, w, h = box
+        crop = b"".join(pixels[row * width + x:row * width + x + w] for row in range(y, y + h))
+        self.frames.append([(x, y, w, h), self.delay, lzw_encode(crop)])
+        self.previous = bytes(pixels)
+
+    def close(self):
+        raster = self.rasterizer
+        parts = [
+            b"GIF89a",
+            struct.pack("<HHBBB", raster.width, raster.height, 0xF7, 0, 0),  # 256-colour global table
+            raster.palette.to_bytes(256),
+            b"!\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00",  # Loop forever
+        ]
+        for (x, y, w, h), delay, data in self.frames:
+            parts.append(b"!\xf9\x04" + struct.pack("<BHBB", 0x04, delay, 0, 0))  # Keep the previous frame
+            parts.append(b"," + struct.pack("<HHHHB", x, y, w, h, 0) + b"\x08")
+            for start in range(0, len(data), 255):
+                block = data[start:start + 255]
+                parts.append(bytes([len(block)]) + block)
+            parts.append(b"\0")
+        parts.append(b";")
+        with open(self.path, "wb") as f:
+            f.write(b"".join(parts))
+
+
+# ---------------- REPLAY EXPORT ----------------
+def frame_path(out_dir, name, tick, fmt):
+    return os.path.join(out_dir, f"{name}_{tick:06d}.{fmt}")
+
+
+def export_chunk(replay_path, out_dir, fmt, box, ticks):
+    """Render the given ticks (ascending) of a replay to files; returns the count."""
+    replay = Replay.load(replay_path)
+    name = os.path.splitext(os.path.basename(replay_path))[0]
+    player = ReplayPlayer(replay)
+    raster = Rasterizer(replay.cols, replay.rows, box)
+    for tick in ticks:
+        engine = player.seek(tick)
+        raster.save(frame_path(out_dir, name, engine.ticks, fmt), raster.draw(engine))
+    return len(ticks)
+
+
+def export_frames(replay_path, out_dir, fmt="png", box=BOX_SIZE, every=1, workers=None):
+    """Render every ``every``-th tick of a replay to numbered files on a process pool."""
+    replay = Replay.load(replay_path)
+    ticks = list(range(replay.start_tick, replay.ticks + 1, every))
+    os.makedirs(out_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(export_chunk, replay_path, out_dir, fmt, box, ticks[i:i + CHUNK_FRAMES])
+                   for i in range(0, len(ticks), CHUNK_FRAMES)]
+        return sum(future.result() for future in futures)
+
+
+def export_gif(replay_path, out_path, box=BOX_SIZE, every=1):
+    replay = Replay.load(replay_path)
+    player = ReplayPlayer(replay)
+    raster = Rasterizer(replay.cols, replay.rows, box)
+    gif = GifWriter(out_path, raster, delay=replay.initial_speed * every / 1000)
+    count = 0
+    for tick in range(replay.start_tick, replay.ticks + 1, every):
+        gif.add(raster.draw(player.seek(tick)))
+        count += 1
+    gif.close()
+    return count
+
+
+def export_thumbnail(replay_path, out_path, box=BOX_SIZE):
+    # Final position of a recorded game
+    replay = Replay.load(replay_path)
+    engine = ReplayPlayer(replay).run_to_end()
+    raster = Rasterizer(replay.cols, replay.rows, box)
+    raster.save(out_path, raster.draw(engine))
+    return 1
+
+
+def export_thumbnails(replay_paths, out_dir, fmt="png", box=BOX_SIZE, workers=None):
+    os.makedirs(out_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(export_thumbnail, path,
+                        os.path.join(out_dir, os.path.splitext(os.path.basename(path))[0] + "." + fmt), box)
+            for path in replay_paths
+        ]
+        return sum(future.result() for future in futures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render snake replays to images without a display")
+    parser.add_argument("replays", nargs="+")
+    parser.add_argument("--out", required=True, help="output directory, or a .gif file")
+    parser.add_argument("--format", choices=["png", "ppm"], default="png", help="format of frame files")
+    parser.add_argument("--box", type=int, default=BOX_SIZE, help="pixels per cell")
+    parser.add_argument("--every", type=int, default=1, help="render every Nth tick")
+    parser.add_argument("--thumbnail", action="store_true", help="only the final position of each replay")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.thumbnail:
+        count = export_thumbnails(args.replays, args.out, args.format, args.box, args.workers)
+    elif args.out.endswith(".gif"):
+        if len(args.replays) > 1:
+            parser.error("a GIF holds a single replay")
+        count = export_gif(args.replays[0], args.out, args.box, args.every)
+    else:
+        count = sum(export_frames(path, args.out, args.format, args.box, args.every, args.workers)
+                    for path in args.replays)
+    elapsed = time.perf_counter() - start
+    print(f"{count} frames in {elapsed:.2f} s ({count / elapsed:.0f} frames/s) -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
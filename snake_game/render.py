@@ -0,0 +1,291 @@
+"""Retained-mode canvas renderer for the snake board.
+
+Canvas items are created once and then only moved or recoloured.  Two paths
+update them:
+
+* redraw() repaints the whole board from the engine state; it is used on
+  resets and screen switches.
+* apply() consumes the HEAD_ADDED/TAIL_REMOVED/FOOD_MOVED events of one
+  logical move and touches a constant number of items: the head, the
+  recycled tail rectangle, the food and the few segments where the body
+  gradient changes colour.
+
+Between moves, animate() slides the head out of the neck cell and a spare
+tail rectangle out of the cell the tail vacated, ``alpha`` of the way, so
+movement looks continuous at any frame rate.  Positions are rounded to whole
+pixels, and unchanged coordinates are never sent to Tk.
+
+Walls of a level pack are a background layer under the snake: one
+rectangle per wall cell, drawn when the layout first appears and then left
+alone.  Only WALLS_MOVED events touch them, hiding the cells that stopped
+being walls and reusing those rectangles for the cells that became walls.
+
+Body rectangles live in a ring buffer that follows the body order: the item
+for segment ``i`` (1 = neck) is ``ring[(start + i - 1) % len(ring)]``, and
+slots outside the visible range hold hidden spares.  Moving the snake recycles
+the tail rectangle as the new neck, so the middle of the body never moves.
+
+All items carry the "board" tag, so the front end can delete a renderer's
+items when switching board sizes.  The renderer only needs a Tk-compatible
+canvas object, not tkinter itself.
+"""
+from functools import lru_cache
+
+from .config import BOX_SIZE, HEIGHT, WIDTH
+from .engine import FOOD_MOVED, HEAD_ADDED, TAIL_REMOVED, WALLS_MOVED
+from .palette import (
+    EYES,
+    FOOD_COLOR,
+    FOOD_OUTLINE,
+    FOOD_PULSE,
+    HEAD_COLOR,
+    OUTLINE_COLOR,
+    WALL_COLOR,
+    WALL_OUTLINE,
+    body_colors,
+)
+
+GRID_COLOR = "#222222"
+
+
+def slide(cell, previous, alpha, box):
+    # Pixel offset of an item moving from previous to cell, alpha of the way there
+    if previous is None or alpha >= 1.0:
+        return 0, 0
+    return round((previous[0] - cell[0]) * (1 - alpha) * box), round((previous[1] - cell[1]) * (1 - alpha) * box)
+
+
+@lru_cache(maxsize=8)
+def gradient_steps(length):
+    # Segment indexes whose colour differs from the previous index; after a
+    # move every segment shifts one index, so only these need recolouring
+    colors = body_colors(length)
+    return tuple(i for i in range(2, length) if colors[i] != colors[i - 1])
+
+
+class BoardRenderer:
+    def __init__(self, canvas, width=WIDTH, height=HEIGHT, box_size=BOX_SIZE):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.box = box_size
+        self.item_coords = {}  # Last coordinates sent to Tk for each item
+        self.item_fills = {}  # Last fill colour sent to Tk for each item
+        self.ring = []
+        self.start = 0
+        self.count = 0  # Visible body rectangles (snake length - 1)
+        self.food_cell = None
+        self.food_frame = 0  # Phase of the food pulse, set by pulse_food()
+        self.previous_head = None  # Head cell before the last move, for interpolation
+        self.vacated = None  # Cell the tail left on the last move
+        self.wall_items = {}  # Wall cell -> rectangle
+        self.wall_spares = []  # Hidden wall rectangles
+
+        # Draw grid once (optional visual enhancement)
+        for i in range(0, width, box_size):
+            canvas.create_line(i, 0, i, height, fill=GRID_COLOR, width=1, tags=("board", "grid"))
+        for i in range(0, height, box_size):
+            canvas.create_line(0, i, width, i, fill=GRID_COLOR, width=1, tags=("board", "grid"))
+
+        # Drawn under the body: the end of the tail sliding out of the vacated cell
+        self.tail_item = canvas.create_rectangle(0, 0, 0, 0, outline=OUTLINE_COLOR, width=1, tags="board")
+        self.food_item = canvas.create_oval(0, 0, 0, 0, fill=FOOD_COLOR, outline=FOOD_OUTLINE, width=2, tags="board")
+        self.head_item = canvas.create_rectangle(0, 0, 0, 0, fill=HEAD_COLOR, outline=OUTLINE_COLOR, width=2,
+                                                 tags="board")
+        self.eye_items = [
+            canvas.create_oval(0, 0, 0, 0, fill="white", tags="board"),
+            canvas.create_oval(0, 0, 0, 0, fill="white", tags="board")
+        ]
+
+    # ---------------- ITEM HELPERS ----------------
+    def set_coords(self, item, *coords):
+        # Skip the Tk round-trip when the item has not moved
+        if self.item_coords.get(item) != coords:
+            self.item_coords[item] = coords
+            self.canvas.coords(item, *coords)
+
+    def set_fill(self, item, color):
+        if self.item_fills.get(item) != color:
+            self.item_fills[item] = color
+            self.canvas.itemconfig(item, fill=color)
+
+    def place_cell(self, item, cell):
+        x, y = cell[0] * self.box, cell[1] * self.box
+        self.set_coords(item, x, y, x + self.box, y + self.box)
+
+    def show_wall(self, cell):
+        if self.wall_spares:
+            item = self.wall_spares.pop()
+            self.canvas.itemconfig(item, state="normal")
+        else:
+            item = self.canvas.create_rectangle(0, 0, 0, 0, fill=WALL_COLOR, outline=WALL_OUTLINE, width=1,
+                                                tags=("board", "walls"))
+            self.canvas.tag_lower(item, self.tail_item)
+        self.place_cell(item, cell)
+        self.wall_items[cell] = item
+
+    def hide_wall(self, cell):
+        item = self.wall_items.pop(cell, None)
+        if item is not None:
+            self.canvas.itemconfig(item, state="hidden")
+            self.wall_spares.append(item)
+
+    def draw_walls(self, cells):
+        # Rectangles already on the right cells are kept
+        cells = set(cells)
+        for cell in [cell for cell in self.wall_items if cell not in cells]:
+            self.hide_wall(cell)
+        for cell in cells:
+            if cell not in self.wall_items:
+                self.show_wall(cell)
+
+    def segment_item(self, index):
+        return self.ring[(self.start + index - 1) % len(self.ring)]
+
+    def reserve(self, count):
+        # Linearise the ring and add hidden spares so it can hold count items
+        if count <= len(self.ring):
+            return
+        canvas = self.canvas
+        ring = [self.segment_item(i) for i in range(1, self.count + 1)]
+        visible = set(ring)
+        ring += [item for item in self.ring if item not in visible]
+        while len(ring) < max(count, 2 * len(self.ring)):
+            item = canvas.create_rectangle(0, 0, 0, 0, outline=OUTLINE_COLOR, width=1, state="hidden",
+                                             tags="board")
+            ring.append(item)
+        self.ring = ring
+        self.start = 0
+        canvas.tag_raise(self.head_item)
+        for eye in self.eye_items:
+            canvas.tag_raise(eye)
+        canvas.tag_raise("overlay")
+
+    # ---------------- FULL REPAINT ----------------
+    def redraw(self, engine, frame=0):
+        snake = engine.snake
+        length = len(snake)
+        self.reserve(length - 1)
+
+        # Show exactly length - 1 rectangles, starting from slot 0
+        canvas = self.canvas
+        for slot, item in enumerate(self.ring):
+            was_visible = (slot - self.start) % len(self.ring) < self.count
+            visible = slot < length - 1
+            if visible != was_visible:
+                canvas.itemconfig(item, state="normal" if visible else "hidden")
+        self.start = 0
+        self.count = length - 1
+
+        colors = body_colors(length)
+        for i, cell in enumerate(snake):
+            if i == 0:  # Head has its own item
+                continue
+            item = self.ring[i - 1]
+            self.place_cell(item, cell)
+            self.set_fill(item, colors[i])
+
+        self.place_cell(self.head_item, snake[0])
+        self.draw_walls(engine.wall_cells())
+        self.previous_head = self.vacated = None
+        self.move_food(engine.food)
+        self.animate(engine, frame)
+
+    # ---------------- INCREMENTAL UPDATES ----------------
+    def apply(self, events, engine):
+        grew = False
+        moved = False
+        vacated = None
+        for event, value in events:
+            if event == HEAD_ADDED:
+                moved = grew = True
+            elif event == TAIL_REMOVED:
+                grew = False
+                vacated = value
+            elif event == FOOD_MOVED:
+                self.food_cell = value
+            elif event == WALLS_MOVED:
+                leaving, entering = value
+                for cell in leaving:
+                    self.hide_wall(cell)
+                for cell in entering:
+                    self.show_wall(cell)
+        if not moved:
+            return
+
+        snake = engine.snake
+        length = len(snake)
+        self.previous_head = snake[1]
+        self.vacated = vacated
+        if grew:
+            # A spare rectangle becomes the neck
+            self.reserve(self.count + 1)
+            self.start = (self.start - 1) % len(self.ring)
+            neck = self.ring[self.start]
+            self.canvas.itemconfig(neck, state="normal")
+            self.count += 1
+        else:
+            # The tail rectangle is recycled as the neck
+            size = len(self.ring)
+            tail_slot = (self.start + self.count - 1) % size
+            neck_slot = (self.start - 1) % size
+            ring = self.ring
+            ring[neck_slot], ring[tail_slot] = ring[tail_slot], ring[neck_slot]
+            self.start = neck_slot
+            neck = ring[neck_slot]
+
+        self.place_cell(neck, snake[1])
+        self.place_cell(self.head_item, snake[0])
+
+        colors = body_colors(length)
+        self.set_fill(neck, colors[1])
+        if grew:
+            # The whole gradient is stretched; the fill cache skips unchanged items
+            for i in range(2, length):
+                self.set_fill(self.segment_item(i), colors[i])
+        else:
+            for i in gradient_steps(length):
+                self.set_fill(self.segment_item(i), colors[i])
+
+    def move_food(self, cell):
+        self.food_cell = cell
+        self.animate_food()
+
+    # ---------------- PER-FRAME ANIMATION ----------------
+    def pulse_food(self, frame):
+        self.food_frame = frame % len(FOOD_PULSE)
+        self.animate_food()
+
+    def animate_food(self):
+        # Food with pulsing effect (no food left once the board is full)
+        if self.food_cell is None:
+            self.set_coords(self.food_item, 0, 0, 0, 0)
+            return
+        fx, fy = self.food_cell[0] * self.box, self.food_cell[1] * self.box
+        x1, y1, x2, y2 = FOOD_PULSE[self.food_frame]
+        self.set_coords(self.food_item, fx + x1, fy + y1, fx + x2, fy + y2)
+
+    def animate(self, engine, frame, alpha=1.0):
+        # alpha is how far the last move has progressed, 1.0 drawing the logical state
+        self.animate_food()
+        snake = engine.snake
+        box = self.box
+
+        head = snake[0]
+        dx, dy = slide(head, self.previous_head, alpha, box)
+        x, y = head[0] * box + dx, head[1] * box + dy
+        self.set_coords(self.head_item, x, y, x + box, y + box)
+
+        if self.vacated is not None and alpha < 1.0:
+            tail = snake[-1]
+            tail_dx, tail_dy = slide(tail, self.vacated, alpha, box)
+            tail_x, tail_y = tail[0] * box + tail_dx, tail[1] * box + tail_dy
+            self.set_coords(self.tail_item, tail_x, tail_y, tail_x + box, tail_y + box)
+            self.set_fill(self.tail_item, body_colors(len(snake))[-1])
+        else:
+            self.set_coords(self.tail_item, 0, 0, 0, 0)
+
+        # Eyes with animation
+        eye_frames = EYES[engine.direction]
+        for eye, (x1, y1, x2, y2) in zip(self.eye_items, eye_frames[frame % len(eye_frames)]):
+            self.set_coords(eye, x + x1, y + y1, x + x2, y + y2)
@@ -0,0 +1,231 @@
+"""Deterministic game recordings.
+
+A game is fully determined by its engine settings, its RNG seed and the
+direction used on each tick, so a recording stores only the seed and the
+ticks where the direction changed.  Recorder.record() is called after every
+engine.step(); it logs a change as one varint ``(tick delta << 2) | direction``,
+usually a single byte.
+
+Every KEYFRAME_INTERVAL ticks the recorder also stores a keyframe: a
+compressed snapshot of the full engine state (see snake_game.snapshot).
+ReplayPlayer.seek() restores the nearest keyframe at or before the target
+tick and simulates only the rest, so seeking costs at most KEYFRAME_INTERVAL
+steps however long the game was.  A game resumed from a saved snapshot is
+recorded from a keyframe at its start tick instead of from its seed.
+
+File layout (little endian)::
+
+    header     HEADER
+    inputs     input_count varints
+    keyframes  keyframe_count x (KEYFRAME header + snapshot bytes)
+
+    python -m snake_game.replay game.snkr [--seek TICK]
+"""
+import argparse
+import struct
+import time
+
+from . import snapshot
+from .engine import SnakeEngine
+from .levels import PACK_NAMES
+from .snapshot import DIRECTION_CODES, DIRECTION_NAMES
+
+MAGIC = b"SNKR"
+VERSION = 3
+KEYFRAME_INTERVAL = 500  # Ticks between keyframes
+
+# magic, version, cols, rows, initial_speed, level pack code, seed, start tick, ticks,
+# input_count, keyframe_count
+HEADER = struct.Struct("<4sBHHHBQIIII")
+# tick, snapshot size
+KEYFRAME = struct.Struct("<II")
+
+
+class ReplayError(ValueError):
+    pass
+
+
+# ---------------- VARINTS ----------------
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, offset):
+    value = shift = 0
+    while True:
+        if offset >= len(data):
+            raise ReplayError("truncated replay")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+# ---------------- RECORDING ----------------
+class Recorder:
+    """Logs the direction changes of one game from its current tick."""
+
+    def __init__(self, engine, seed=None, keyframe_interval=KEYFRAME_INTERVAL):
+        # seed is None for a game resumed from a snapshot
+        self.engine = engine
+        self.seed = seed
+        self.keyframe_interval = keyframe_interval
+        self.inputs = bytearray()
+        self.input_count = 0
+        self.keyframes = []  # (tick, snapshot bytes)
+        self.start_tick = self.last_tick = engine.ticks
+        self.last_direction = engine.direction
+        if seed is None:
+            # Resumed game: playback starts from this state, not from the seed
+            self.keyframes.append((engine.ticks, snapshot.dumps(engine, compress=True)))
+
+    def record(self):
+        # Call after each engine.step(); engine.direction is what that tick used
+        engine = self.engine
+        if engine.direction != self.last_direction:
+            delta = engine.ticks - self.last_tick
+            write_varint(self.inputs, delta << 2 | DIRECTION_CODES[engine.direction])
+            self.input_count += 1
+            self.last_tick = engine.ticks
+            self.last_direction = engine.direction
+        if engine.alive and engine.ticks % self.keyframe_interval == 0:
+            self.keyframes.append((engine.ticks, snapshot.dumps(engine, compress=True)))
+
+    def to_bytes(self):
+        engine = self.engine
+        parts = [
+            HEADER.pack(MAGIC, VERSION, engine.cols, engine.rows, engine.initial_speed,
+                        PACK_NAMES.index(engine.pack), self.seed or 0, self.start_tick, engine.ticks,
+                        self.input_count, len(self.keyframes)),
+            bytes(self.inputs),
+        ]
+        for tick, state in self.keyframes:
+            parts.append(KEYFRAME.pack(tick, len(state)))
+            parts.append(state)
+        return b"".join(parts)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+# ---------------- PLAYBACK ----------------
+def load_keyframe(state):
+    # The recorded inputs already include every queued turn the game went on to
+    # use, so turns still queued in a keyframe must not be applied again
+    engine = snapshot.loads(state)[0]
+    engine.pending.clear()
+    return engine
+
+
+class Replay:
+    """A parsed recording."""
+
+    def __init__(self, data):
+        if len(data) < HEADER.size:
+            raise ReplayError("truncated replay header")
+        (magic, version, self.cols, self.rows, self.initial_speed, pack, self.seed,
+         self.start_tick, self.ticks, input_count, keyframe_count) = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError("not a snake replay")
+        if version != VERSION:
+            raise ReplayError(f"unsupported replay version {version}")
+        if pack >= len(PACK_NAMES):
+            raise ReplayError(f"unknown level pack {pack}")
+        self.pack = PACK_NAMES[pack]
+
+        # Direction changes as a tick -> direction map
+        self.inputs = {}
+        offset = HEADER.size
+        tick = self.start_tick
+        for _ in range(input_count):
+            value, offset = read_varint(data, offset)
+            tick += value >> 2
+            self.inputs[tick] = DIRECTION_NAMES[value & 3]
+
+        self.keyframes = []  # (tick, state bytes), in tick order
+        for _ in range(keyframe_count):
+            try:
+                tick, size = KEYFRAME.unpack_from(data, offset)
+            except struct.error:
+                raise ReplayError("truncated replay") from None
+            offset += KEYFRAME.size
+            if offset + size > len(data):
+                raise ReplayError("truncated replay")
+            self.keyframes.append((tick, bytes(data[offset:offset + size])))
+            offset += size
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def new_engine(self):
+        if self.keyframes and self.keyframes[0][0] == self.start_tick:
+            return load_keyframe(self.keyframes[0][1])
+        return SnakeEngine(self.cols, self.rows, seed=self.seed, initial_speed=self.initial_speed,
+                           pack=self.pack)
+
+
+class ReplayPlayer:
+    """Drives an engine through a replay, one tick per step()."""
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.engine = replay.new_engine()
+
+    @property
+    def finished(self):
+        return not self.engine.alive or self.engine.ticks >= self.replay.ticks
+
+    def step(self):
+        engine = self.engine
+        return engine.step(self.replay.inputs.get(engine.ticks + 1))
+
+    def seek(self, tick):
+        # Restore the last keyframe at or before tick, then simulate the rest
+        tick = max(self.replay.start_tick, min(tick, self.replay.ticks))
+        start_tick = start = None
+        for keyframe_tick, state in self.replay.keyframes:
+            if keyframe_tick > tick:
+                break
+            start_tick, start = keyframe_tick, state
+        if start is not None and (self.engine.ticks > tick or start_tick > self.engine.ticks):
+            self.engine = load_keyframe(start)
+        elif self.engine.ticks > tick:
+            self.engine = self.replay.new_engine()
+        while self.engine.ticks < tick and self.engine.alive:
+            self.step()
+        return self.engine
+
+    def run_to_end(self):
+        # Headless fast-forward at maximum speed
+        while not self.finished:
+            self.step()
+        return self.engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play back a snake replay headlessly")
+    parser.add_argument("path")
+    parser.add_argument("--seek", type=int, help="show the state at this tick")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path)
+    player = ReplayPlayer(replay)
+    start = time.perf_counter()
+    engine = player.seek(args.seek) if args.seek is not None else player.run_to_end()
+    elapsed = time.perf_counter() - start
+    print(f"{replay.cols}x{replay.rows} {replay.pack or 'open board'} seed {replay.seed}: {replay.ticks} ticks, "
+          f"{len(replay.inputs)} inputs, {len(replay.keyframes)} keyframes")
+    print(f"tick {engine.ticks}: score {engine.score}, level {engine.level}, "
+          f"length {len(engine.snake)}, {'alive' if engine.alive else 'over'} ({elapsed * 1e3:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Authoritative room server: many snake games in one asyncio process.
+
+    python -m snake_game.server --port 8765
+
+Every room runs one SnakeEngine.  The first client in a room controls the
+snake and later ones spectate; when the player leaves, the next client takes
+over.  Rooms are single-player on purpose: the engine, snapshots, replays
+and both renderers model one snake per board, and snakes sharing a board
+would need rules for colliding with each other.  Many players are served
+as many rooms.
+
+A single scheduler task wakes every TICK_MS and steps each room whose
+``engine.speed`` has elapsed, so the level speed curve is the same as in the
+local game.
+
+Messages are JSON objects, one per line, over TCP.
+
+Client to server::
+
+    {"type": "join", "room": "lobby"}
+    {"type": "turn", "direction": "Up"}      (player only, queued per tick)
+    {"type": "restart"}                      (player only, after game over)
+
+Server to client::
+
+    {"type": "joined", "room": ..., "role": "player" | "spectator"}
+    {"type": "state", ...}                   full state on join and restart
+    {"type": "tick", "tick": n, "events": [[name, value], ...]}
+
+Tick messages carry only the engine events of that move (head added, tail
+removed, food moved, score, level, badge level, turns, game over), encoded
+once per room and written to every client in it.  A client whose unsent
+output grows past MAX_BUFFER is disconnected instead of slowing the room.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from .engine import BADGE, SnakeEngine
+from .profiler import RollingStats
+
+TICK_MS = 10  # Scheduler resolution shared by all rooms
+MAX_CATCH_UP = 5  # Steps a late room may run in one scheduler tick
+MAX_BUFFER = 256 * 1024  # Bytes of unsent output before a client is dropped
+MAX_LINE = 4096
+
+
+def encode(message):
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+def encode_events(events):
+    # BADGE values are dicts; clients rebuild them from the level
+    return [[name, value["level"] if name == BADGE else value] for name, value in events]
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.room = None
+
+    def send(self, data):
+        transport = self.writer.transport
+        if transport.is_closing():
+            return
+        if transport.get_write_buffer_size() > MAX_BUFFER:
+            transport.abort()  # Too slow to keep up
+            return
+        self.writer.write(data)
+
+
+class Room:
+    def __init__(self, name, now):
+        self.name = name
+        self.clients = []  # clients[0] is the player
+        self.new_game(now)
+
+    def new_game(self, now, seed=None):
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.engine = SnakeEngine(seed=self.seed)
+        self.due = now + self.engine.speed / 1000
+
+    @property
+    def player(self):
+        return self.clients[0] if self.clients else None
+
+    def state(self):
+        engine = self.engine
+        return {
+            "type": "state",
+            "room": self.name,
+            "cols": engine.cols,
+            "rows": engine.rows,
+            "initial_speed": engine.initial_speed,
+            "seed": self.seed,
+            "tick": engine.ticks,
+            "snake": list(engine.snake),
+            "food": engine.food,
+            "direction": engine.direction,
+            "score": engine.score,
+            "level": engine.level,
+            "speed": engine.speed,
+            "badges": [badge["level"] for badge in engine.achieved_badges],
+            "alive": engine.alive,
+        }
+
+    def broadcast(self, data):
+        for client in self.clients:
+            client.send(data)
+
+
+class GameServer:
+    def __init__(self, tick_ms=TICK_MS, clock=time.monotonic):
+        self.tick_seconds = tick_ms / 1000
+        self.clock = clock
+        self.rooms = {}
+        self.clients = set()
+        self.tick_times = RollingStats()  # ms spent per scheduler tick
+        self.lateness = RollingStats()  # ms the scheduler woke up late
+        self.steps = 0
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self.dropped_ticks = 0
+
+    # ---------------- CONNECTIONS ----------------
+    async def handle_client(self, reader, writer):
+        client = Client(reader, writer)
+        self.clients.add(client)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.handle_message(client, json.loads(line))
+        except (ConnectionError, ValueError, asyncio.LimitOverrunError):
+            pass  # Disconnects, malformed JSON and oversized lines all end the session
+        finally:
+            self.leave(client)
+            self.clients.discard(client)
+            writer.close()
+
+    def handle_message(self, client, message):
+        # ValueError marks the message as malformed, which ends the session
+        if not isinstance(message, dict):
+            raise ValueError("message is not a JSON object")
+        kind = message.get("type")
+        room = client.room
+        if kind == "join" and room is None:
+            self.join(client, str(message.get("room", "lobby")))
+        elif kind == "turn" and room and client is room.player:
+            direction = message.get("direction")
+            if not isinstance(direction, str):
+                raise ValueError("direction is not a string")
+            room.engine.change_direction(direction)
+        elif kind == "restart" and room and client is room.player and not room.engine.alive:
+            room.new_game(self.clock())
+            self.send_all(room, encode(room.state()))
+
+    def join(self, client, name):
+        room = self.rooms.get(name)
+        if room is None:
+            room = self.rooms[name] = Room(name, self.clock())
+        room.clients.append(client)
+        client.room = room
+        role = "player" if client is room.player else "spectator"
+        client.send(encode({"type": "joined", "room": name, "role": role}))
+        client.send(encode(room.state()))
+
+    def leave(self, client):
+        room = client.room
+        if room is None:
+            return
+        was_player = client is room.player
+        room.clients.remove(client)
+        client.room = None
+        if not room.clients:
+            del self.rooms[room.name]
+        elif was_player:
+            room.player.send(encode({"type": "joined", "room": room.name, "role": "player"}))
+
+    def send_all(self, room, data):
+        room.broadcast(data)
+        self.messages_sent += len(room.clients)
+        self.bytes_sent += len(data) * len(room.clients)
+
+    # ---------------- SHARED TICK ----------------
+    def tick(self, now):
+        for room in self.rooms.values():
+            engine = room.engine
+            if not engine.alive:
+                continue
+            steps = 0
+            while engine.alive and now >= room.due and steps < MAX_CATCH_UP:
+                events = engine.step()
+                room.due += engine.speed / 1000
+                steps += 1
+                self.steps += 1
+                self.send_all(room, encode({"type": "tick", "tick": engine.ticks, "events": encode_events(events)}))
+            if now >= room.due and engine.alive:
+                # Too far behind: drop the backlog rather than bursting
+                self.dropped_ticks += 1
+                room.due = now + engine.speed / 1000
+
+    async def run(self):
+        next_tick = self.clock()
+        while True:
+            next_tick += self.tick_seconds
+            start = self.clock()
+            self.tick(start)
+            self.tick_times.add((self.clock() - start) * 1000)
+            delay = next_tick - self.clock()
+            if delay < 0:
+                next_tick = self.clock()  # Overloaded: start the next tick now
+            await asyncio.sleep(max(0.0, delay))
+            self.lateness.add(max(0.0, self.clock() - next_tick) * 1000)
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE)
+        async with server:
+            await asyncio.gather(server.serve_forever(), self.run())
+
+    def stats(self):
+        return {
+            "rooms": len(self.rooms),
+            "clients": len(self.clients),
+            "steps": self.steps,
+            "messages_sent": self.messages_sent,
+            "bytes_sent": self.bytes_sent,
+            "dropped_ticks": self.dropped_ticks,
+            "tick_p50": self.tick_times.percentile(50),
+            "tick_p99": self.tick_times.percentile(99),
+            "late_p99": self.lateness.percentile(99),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake room server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    print(f"Serving snake rooms on {args.host}:{args.port}")
+    try:
+        asyncio.run(GameServer().serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Versioned binary snapshots of a whole SnakeEngine.
+
+A snapshot is a fixed HEADER followed by packed arrays: the body as flat
+cell indexes, the Mersenne Twister state, and the free-cell index and
+occupancy grid.  Every array is loaded with a single ``frombytes()`` copy,
+and the body deque is built by mapping the indexes through a cached table of
+cell tuples, so loading has no per-cell Python loop.
+
+The free-cell order is stored because food placement samples it; a snapshot
+restores a game that continues exactly like the original.  The occupancy
+grid already holds the walls of a level pack, so only the pack, stage and
+phase are stored to find the layout the walls continue from.  With
+FLAG_ZLIB the payload after the header is zlib-compressed, which suits files
+and replay keyframes; in-memory lookahead should use SnakeEngine.clone().
+"""
+import random
+import struct
+import zlib
+from array import array
+from collections import deque
+from functools import lru_cache
+
+from .config import BADGE_LEVELS
+from .engine import DIRECTIONS, SnakeEngine, make_badge
+from .freecells import FreeCells
+from .levels import PACK_NAMES, level_maps
+
+MAGIC = b"SNKS"
+VERSION = 2
+FLAG_ZLIB = 1
+
+DIRECTION_NAMES = list(DIRECTIONS)
+DIRECTION_CODES = {name: code for code, name in enumerate(DIRECTION_NAMES)}
+NO_TURN = 255  # Unused slot of the queued turns
+BADGE_ORDER = sorted(BADGE_LEVELS)
+RNG_WORDS = 625  # Mersenne Twister state plus index
+
+# magic, version, flags, cols, rows, initial_speed, ticks, score, frame, level,
+# speed, direction, alive, food index (-1 for none), badge bits, body length,
+# free cell count, queued turns, RNG version, has gauss_next, gauss_next,
+# level pack code, stage, phase
+HEADER = struct.Struct("<4sBBHHHIIIHHB?iIII3sB?dBHH")
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+@lru_cache(maxsize=4)
+def cell_table(cols, rows):
+    # Shared (col, row) tuple for every flat index of a board
+    return tuple((index % cols, index // cols) for index in range(cols * rows))
+
+
+def dumps(engine, frame=0, compress=False):
+    cols = engine.cols
+    food = -1 if engine.food is None else engine.food[1] * cols + engine.food[0]
+    badges = 0
+    for badge in engine.achieved_badges:
+        badges |= 1 << BADGE_ORDER.index(badge["level"])
+    pending = bytes(DIRECTION_CODES[turn] for turn in engine.pending)
+    rng_version, words, gauss = engine.rng.getstate()
+
+    header = HEADER.pack(
+        MAGIC, VERSION, FLAG_ZLIB if compress else 0, cols, engine.rows, engine.initial_speed,
+        engine.ticks, engine.score, frame, engine.level, engine.speed,
+        DIRECTION_CODES[engine.direction], engine.alive, food, badges, len(engine.snake),
+        engine.free_cells.count, pending.ljust(3, bytes([NO_TURN])), rng_version,
+        gauss is not None, gauss or 0.0, PACK_NAMES.index(engine.pack), engine.stage, engine.phase,
+    )
+    payload = b"".join([
+        array("I", [y * cols + x for x, y in engine.snake]).tobytes(),
+        array("I", words).tobytes(),
+        engine.free_cells.cells.tobytes(),
+        engine.free_cells.positions.tobytes(),
+        bytes(engine.occupied),
+    ])
+    return header + (zlib.compress(payload, 1) if compress else payload)
+
+
+def loads(data):
+    """Return (engine, frame) restored from a snapshot."""
+    if len(data) < HEADER.size:
+        raise SnapshotError("truncated snapshot header")
+    (magic, version, flags, cols, rows, initial_speed, ticks, score, frame, level, speed,
+     direction, alive, food, badges, length, free_count, pending, rng_version,
+     has_gauss, gauss, pack, stage, phase) = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("not a snake snapshot")
+    if version != VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+    if pack >= len(PACK_NAMES):
+        raise SnapshotError(f"unknown level pack {pack}")
+    if direction >= len(DIRECTION_NAMES) or any(
+            code >= len(DIRECTION_NAMES) and code != NO_TURN for code in pending):
+        raise SnapshotError("corrupt snapshot: unknown direction")
+    payload = memoryview(data)[HEADER.size:]
+    if flags & FLAG_ZLIB:
+        try:
+            payload = memoryview(zlib.decompress(payload))
+        except zlib.error as error:
+            raise SnapshotError(f"corrupt snapshot: {error}") from None
+
+    size = cols * rows
+    if len(payload) != 4 * length + 4 * RNG_WORDS + 9 * size:
+        raise SnapshotError("snapshot size does not match its header")
+    if not 0 < length <= size or free_count > size or food >= size:
+        raise SnapshotError("corrupt snapshot: counts do not fit the board")
+    maps = level_maps(PACK_NAMES[pack], cols, rows) if pack else None
+    if maps is None:
+        phases = 1 if stage == 0 else 0
+    else:
+        phases = len(maps.stage(stage).moving) if stage < len(maps.definitions) else 0
+    if phase >= phases:
+        raise SnapshotError(f"corrupt snapshot: no stage {stage} phase {phase} in its level pack")
+
+    def take(typecode, count):
+        nonlocal payload
+        values = array(typecode)
+        values.frombytes(payload[:count * values.itemsize])
+        payload = payload[count * values.itemsize:]
+        return values
+
+    body = take("I", length)
+    words = take("I", RNG_WORDS)
+    free_cells = FreeCells.__new__(FreeCells)
+    free_cells.cells = take("i", size)
+    free_cells.positions = take("i", size)
+    free_cells.count = free_count
+
+    # Skip the constructor's reset(): every field is restored below
+    engine = SnakeEngine.__new__(SnakeEngine)
+    engine.cols = cols
+    engine.rows = rows
+    engine.initial_speed = initial_speed
+    engine.pack = PACK_NAMES[pack]
+    engine.maps = maps
+    engine.stage = stage
+    engine.phase = phase
+    engine.load_walls()
+    try:
+        engine.snake = deque(map(cell_table(cols, rows).__getitem__, body))
+    except IndexError:
+        raise SnapshotError("corrupt snapshot: body cell outside the board") from None
+    engine.occupied = bytearray(payload)
+    engine.free_cells = free_cells
+    engine.direction = DIRECTION_NAMES[direction]
+    engine.pending = deque(DIRECTION_NAMES[code] for code in pending if code != NO_TURN)
+    engine.food = None if food < 0 else (food % cols, food // cols)
+    engine.score = score
+    engine.level = level
+    engine.speed = speed
+    engine.achieved_badges = [make_badge(badge_level) for bit, badge_level in enumerate(BADGE_ORDER)
+                              if badges >> bit & 1]
+    engine.alive = alive
+    engine.ticks = ticks
+    engine.rng = random.Random(0)  # Seed is replaced by setstate()
+    try:
+        engine.rng.setstate((rng_version, tuple(words), gauss if has_gauss else None))
+    except (ValueError, TypeError) as error:
+        raise SnapshotError(f"corrupt snapshot: {error}") from None
+    return engine, frame
+
+
+def save(path, engine, frame=0):
+    with open(path, "wb") as f:
+        f.write(dumps(engine, frame, compress=True))
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return loads(f.read())
@@ -0,0 +1,229 @@
+"""Durable per-profile high scores, badge unlocks and game history.
+
+Data lives in a SQLite database in WAL mode, where every write batch is one
+transaction, so a crash mid-write leaves the last committed state intact.
+All disk access happens on one background thread:
+
+* at startup the thread opens the database and loads the profile, so the
+  UI does not wait for disk unless it asks for data before loading is done;
+* writes are queued (write-behind) and committed in batches, so recording a
+  score at food or level-up time never blocks the Tk loop.
+
+Reads are served from an in-memory copy kept up to date by the writers.
+If the database cannot be opened the store keeps working in memory only.
+Old game history is trimmed and the WAL checkpointed every COMPACT_EVERY
+games and on close().
+"""
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".snake_game", "scores.db")
+MAX_HISTORY = 1000  # Games kept per profile
+COMPACT_EVERY = 200  # Recorded games between compactions
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS high_scores (
+    profile TEXT PRIMARY KEY,
+    score INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS badges (
+    profile TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    unlocked_at REAL NOT NULL,
+    PRIMARY KEY (profile, level)
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    played_at REAL NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    ticks INTEGER NOT NULL,
+    badge_level INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_profile ON games (profile, id);
+"""
+
+# Jobs for the background thread: ("sql", statement, params), ("call", func),
+# ("compact",) and ("close",)
+
+
+class ScoreStore:
+    def __init__(self, path=DEFAULT_PATH, profile="default"):
+        self.path = path
+        self.profile = profile
+        self.queue = queue.Queue()
+        self.loaded = threading.Event()
+        self.load_error = None
+        self.write_error = None  # Last failed write batch, if any
+        self.best = 0
+        self.unlocked = set()
+        self.games_since_compact = 0
+        self.thread = threading.Thread(target=self.run, name="score-store", daemon=True)
+        self.thread.start()
+
+    # ---------------- READS (in-memory) ----------------
+    def wait_loaded(self):
+        self.loaded.wait()
+
+    def high_score(self):
+        self.wait_loaded()
+        return self.best
+
+    def badge_levels(self):
+        self.wait_loaded()
+        return set(self.unlocked)
+
+    # ---------------- WRITES (queued) ----------------
+    def update_high_score(self, score):
+        self.wait_loaded()
+        if score <= self.best:
+            return
+        self.best = score
+        self.put((
+            "sql",
+            "INSERT INTO high_scores (profile, score) VALUES (?, ?) "
+            "ON CONFLICT (profile) DO UPDATE SET score = MAX(score, excluded.score)",
+            (self.profile, score),
+        ))
+
+    def unlock_badge(self, level):
+        self.wait_loaded()
+        if level in self.unlocked:
+            return
+        self.unlocked.add(level)
+        self.put((
+            "sql",
+            "INSERT OR IGNORE INTO badges (profile, level, unlocked_at) VALUES (?, ?, ?)",
+            (self.profile, level, time.time()),
+        ))
+
+    def record_game(self, score, level, ticks, badge_level=0):
+        self.update_high_score(score)
+        self.put((
+            "sql",
+            "INSERT INTO games (profile, played_at, score, level, ticks, badge_level) VALUES (?, ?, ?, ?, ?, ?)",
+            (self.profile, time.time(), score, level, ticks, badge_level),
+        ))
+        self.games_since_compact += 1
+        if self.games_since_compact >= COMPACT_EVERY:
+            self.games_since_compact = 0
+            self.put(("compact",))
+
+    def history(self, limit=20):
+        # Most recent games first; waits for pending writes to land
+        self.wait_loaded()
+        if self.load_error:
+            return []
+        result = []
+        done = threading.Event()
+
+        def read(connection):
+            # The caller is waiting, so signal it even if the query fails
+            try:
+                result.extend(connection.execute(
+                    "SELECT played_at, score, level, ticks, badge_level FROM games "
+                    "WHERE profile = ? ORDER BY id DESC LIMIT ?",
+                    (self.profile, limit),
+                ))
+            finally:
+                done.set()
+        self.queue.put(("call", read))
+        done.wait()
+        return result
+
+    def put(self, job):
+        if not self.load_error:
+            self.queue.put(job)
+
+    def flush(self):
+        self.wait_loaded()
+        if self.load_error:
+            return
+        done = threading.Event()
+        self.queue.put(("call", lambda connection: done.set()))
+        done.wait()
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(("compact",))
+            self.queue.put(("close",))
+            self.thread.join()
+
+    # ---------------- BACKGROUND THREAD ----------------
+    def open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def load(self, connection):
+        row = connection.execute("SELECT score FROM high_scores WHERE profile = ?", (self.profile,)).fetchone()
+        self.best = row[0] if row else 0
+        self.unlocked = {level for level, in connection.execute(
+            "SELECT level FROM badges WHERE profile = ?", (self.profile,)
+        )}
+
+    def compact(self, connection):
+        connection.execute(
+            "DELETE FROM games WHERE profile = ? AND id <= "
+            "(SELECT id FROM games WHERE profile = ? ORDER BY id DESC LIMIT 1 OFFSET ?)",
+            (self.profile, self.profile, MAX_HISTORY),
+        )
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def run(self):
+        try:
+            connection = self.open()
+            self.load(connection)
+        except Exception as error:
+            self.load_error = error
+            self.loaded.set()
+            return
+        self.loaded.set()
+
+        while True:
+            # Take everything queued so far and commit it as one transaction
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            statements = [job[1:] for job in batch if job[0] == "sql"]
+            if statements:
+                try:
+                    connection.execute("BEGIN")
+                    for statement, params in statements:
+                        connection.execute(statement, params)
+                    connection.execute("COMMIT")
+                except sqlite3.Error as error:
+                    # The batch is rolled back as a whole; the in-memory copy stays valid
+                    self.write_error = error
+                    if connection.in_transaction:
+                        connection.execute("ROLLBACK")
+
+            # Reads, flush signals and compaction run after the batch is committed
+            closing = False
+            for job in batch:
+                try:
+                    if job[0] == "call":
+                        job[1](connection)
+                    elif job[0] == "compact":
+                        self.compact(connection)
+                    elif job[0] == "close":
+                        closing = True
+                except sqlite3.Error as error:
+                    # e.g. "database is locked"; the thread must keep serving the jobs behind it
+                    self.write_error = error
+            if closing:
+                connection.close()
+                return
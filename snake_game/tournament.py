@@ -0,0 +1,114 @@
+"""Evaluate autopilot policies over many seeded headless games.
+
+Jobs are (policy, seed) pairs spread over a ``concurrent.futures`` process
+pool.  A game depends only on its policy and seed, so results are identical
+whatever the worker count; they are streamed back as chunks finish and can
+be aggregated in any order.
+
+    python -m snake_game.tournament snake_game.policies:greedy --games 1000
+"""
+import argparse
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .engine import WON, SnakeEngine
+
+MAX_TICKS = 100_000  # Stops policies that circle forever without eating
+
+
+def resolve_policy(name):
+    module_name, _, function_name = name.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def play_game(policy_name, seed, max_ticks=MAX_TICKS):
+    policy = resolve_policy(policy_name)
+    engine = SnakeEngine(seed=seed)
+    won = False
+    while engine.alive and engine.ticks < max_ticks:
+        for event, _ in engine.step(policy(engine)):
+            if event == WON:
+                won = True
+    badge = engine.achieved_badges[-1] if engine.achieved_badges else None
+    return {
+        "policy": policy_name,
+        "seed": seed,
+        "score": engine.score,
+        "level": engine.level,
+        "badge": badge["name"] if badge else None,
+        "badge_level": badge["level"] if badge else 0,
+        "ticks": engine.ticks,
+        "won": won,
+    }
+
+
+def play_games(policy_name, seeds, max_ticks=MAX_TICKS):
+    return [play_game(policy_name, seed, max_ticks) for seed in seeds]
+
+
+def run_tournament(policies, seeds, workers=None, chunk_size=50, max_ticks=MAX_TICKS):
+    """Yield one result dict per (policy, seed) game as chunks complete."""
+    seeds = list(seeds)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(play_games, policy_name, seeds[i:i + chunk_size], max_ticks)
+            for policy_name in policies
+            for i in range(0, len(seeds), chunk_size)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def aggregate(results):
+    summary = {}
+    for result in results:
+        stats = summary.setdefault(result["policy"], {
+            "games": 0, "total_score": 0, "best_score": 0, "total_ticks": 0,
+            "best_level": 0, "wins": 0, "badges": {},
+        })
+        stats["games"] += 1
+        stats["total_score"] += result["score"]
+        stats["best_score"] = max(stats["best_score"], result["score"])
+        stats["total_ticks"] += result["ticks"]
+        stats["best_level"] = max(stats["best_level"], result["level"])
+        stats["wins"] += result["won"]
+        if result["badge"]:
+            stats["badges"][result["badge"]] = stats["badges"].get(result["badge"], 0) + 1
+    for stats in summary.values():
+        stats["mean_score"] = stats["total_score"] / stats["games"]
+        stats["mean_ticks"] = stats["total_ticks"] / stats["games"]
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a snake policy tournament")
+    parser.add_argument("policies", nargs="+", help="policies as module:function")
+    parser.add_argument("--games", type=int, default=1000, help="games per policy")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS)
+    args = parser.parse_args()
+
+    seeds = range(args.first_seed, args.first_seed + args.games)
+    results = []
+    total = len(args.policies) * args.games
+    for result in run_tournament(args.policies, seeds, args.workers, max_ticks=args.max_ticks):
+        results.append(result)
+        if len(results) % 100 == 0 or len(results) == total:
+            print(f"\r{len(results)}/{total} games", end="", flush=True)
+    print()
+
+    summary = aggregate(results)
+    ranking = sorted(summary.items(), key=lambda item: item[1]["mean_score"], reverse=True)
+    for policy_name, stats in ranking:
+        print(
+            f"{policy_name}: mean score {stats['mean_score']:.2f}, best {stats['best_score']}, "
+            f"best level {stats['best_level']}, mean ticks {stats['mean_ticks']:.0f}, wins {stats['wins']}"
+        )
+        for badge_name, count in sorted(stats["badges"].items(), key=lambda item: -item[1]):
+            print(f"    {badge_name}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Batched snake environment advancing many games in lockstep with NumPy.
+
+Each of the ``num_envs`` games follows the same rules as SnakeEngine: wall and
+self collision (the tail still counts), growth on food, a level every
+``LEVEL_THRESHOLD`` points with the same speed curve, and ``BADGE_LEVELS``
+awards.  Finished games are reset automatically at the end of step().
+
+NumPy is only needed by this module; the rest of the package does not use it.
+
+Directions are encoded as integers in ``DIRECTION_NAMES`` order; an action of
+-1 keeps the current direction.
+"""
+import numpy as np
+
+from .config import BADGE_LEVELS, GRID_COLS, GRID_ROWS, INITIAL_SPEED, LEVEL_THRESHOLD, MIN_SPEED, SPEED_STEP
+
+DIRECTION_NAMES = ["Up", "Down", "Left", "Right"]
+UP, DOWN, LEFT, RIGHT = range(4)
+DELTA_X = np.array([0, 0, -1, 1])
+DELTA_Y = np.array([-1, 1, 0, 0])
+OPPOSITE = np.array([DOWN, UP, RIGHT, LEFT])
+
+# Cell values returned by observation()
+EMPTY, BODY, HEAD, FOOD = range(4)
+
+
+class VectorSnakeEnv:
+    def __init__(self, num_envs, cols=GRID_COLS, rows=GRID_ROWS, seed=None, initial_speed=INITIAL_SPEED):
+        self.num_envs = num_envs
+        self.cols = cols
+        self.rows = rows
+        self.size = cols * rows
+        self.initial_speed = initial_speed
+        self.rng = np.random.default_rng(seed)
+        self.index = np.arange(num_envs)
+
+        # Badge lookup: level -> bit (0 when the level has no badge)
+        self.badge_levels = np.array(sorted(BADGE_LEVELS))
+        self.badge_bit = np.zeros(max(BADGE_LEVELS) + 2, dtype=np.int64)
+        for bit, badge_level in enumerate(self.badge_levels):
+            self.badge_bit[badge_level] = 1 << bit
+
+        # Body ring buffers of flat cell indexes; the head sits at head_ptr
+        self.body = np.zeros((num_envs, self.size), dtype=np.int32)
+        self.head_ptr = np.zeros(num_envs, dtype=np.int64)
+        self.length = np.zeros(num_envs, dtype=np.int64)
+        self.occupied = np.zeros((num_envs, self.size), dtype=bool)
+        self.head_x = np.zeros(num_envs, dtype=np.int64)
+        self.head_y = np.zeros(num_envs, dtype=np.int64)
+        self.direction = np.zeros(num_envs, dtype=np.int64)
+        self.food = np.zeros(num_envs, dtype=np.int64)
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self.level = np.zeros(num_envs, dtype=np.int64)
+        self.speed = np.zeros(num_envs, dtype=np.int64)
+        self.badges = np.zeros(num_envs, dtype=np.int64)  # Bitmask over badge_levels
+        self.ticks = np.zeros(num_envs, dtype=np.int64)
+        self.reset()
+
+    def reset(self, mask=None):
+        if mask is None:
+            mask = np.ones(self.num_envs, dtype=bool)
+        envs = self.index[mask]
+        if not len(envs):
+            return
+
+        head_x, head_y = self.cols // 2, self.rows // 2
+        start = head_y * self.cols + head_x
+        self.occupied[envs] = False
+        self.body[envs, :3] = [start, start - 1, start - 2]
+        self.occupied[envs[:, None], [start, start - 1, start - 2]] = True
+        self.head_ptr[envs] = 0
+        self.length[envs] = 3
+        self.head_x[envs] = head_x
+        self.head_y[envs] = head_y
+        self.direction[envs] = RIGHT
+        self.score[envs] = 0
+        self.level[envs] = 1
+        self.speed[envs] = self.speed_for_level(1)
+        self.badges[envs] = 0
+        self.ticks[envs] = 0
+        self.food[envs] = self.sample_food(envs)
+
+    def speed_for_level(self, level):
+        return np.maximum(MIN_SPEED, self.initial_speed - (level - 1) * SPEED_STEP)
+
+    def sample_food(self, envs):
+        # Uniform free cell per game: the largest random key among free cells wins.
+        # Returns -1 for boards with no free cell left.
+        keys = self.rng.random((len(envs), self.size))
+        occupied = self.occupied[envs]
+        keys[occupied] = -1.0
+        food = keys.argmax(axis=1)
+        food[occupied.all(axis=1)] = -1
+        return food
+
+    def step(self, actions):
+        """Advance every game by one tick.
+
+        Returns a dict of per-game arrays: ``ate``, ``level_up``, ``badge``
+        (level of the badge awarded this tick, 0 for none), ``died``, ``won``,
+        ``done`` and the final ``score``/``level``/``ticks`` of games that just
+        finished (before they are reset).
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        turn = (actions >= 0) & (actions != OPPOSITE[self.direction])
+        self.direction = np.where(turn, actions, self.direction)
+        self.ticks += 1
+
+        new_x = self.head_x + DELTA_X[self.direction]
+        new_y = self.head_y + DELTA_Y[self.direction]
+        wall = (new_x < 0) | (new_x >= self.cols) | (new_y < 0) | (new_y >= self.rows)
+        new_cell = np.where(wall, 0, new_y * self.cols + new_x)
+        died = wall | self.occupied[self.index, new_cell]
+        moving = ~died
+        ate = moving & (new_cell == self.food)
+
+        # Pop the tail of games that move without eating
+        popping = self.index[moving & ~ate]
+        tail_slot = (self.head_ptr[popping] + self.length[popping] - 1) % self.size
+        self.occupied[popping, self.body[popping, tail_slot]] = False
+
+        # Push the new head
+        movers = self.index[moving]
+        self.head_ptr[movers] = (self.head_ptr[movers] - 1) % self.size
+        self.body[movers, self.head_ptr[movers]] = new_cell[movers]
+        self.occupied[movers, new_cell[movers]] = True
+        self.head_x[movers] = new_x[movers]
+        self.head_y[movers] = new_y[movers]
+
+        # Growth, levels and badges
+        self.length += ate
+        self.score += ate
+        new_level = self.score // LEVEL_THRESHOLD + 1
+        level_up = new_level > self.level
+        self.level = np.where(level_up, new_level, self.level)
+        self.speed = self.speed_for_level(self.level)
+        bit = self.badge_bit[np.minimum(self.level, len(self.badge_bit) - 1)]
+        new_badge = level_up & (bit != 0) & ((self.badges & bit) == 0)
+        self.badges |= np.where(new_badge, bit, 0)
+        badge = np.where(new_badge, self.level, 0)
+
+        # Respawn food; a full board means the game is won
+        eaters = self.index[ate]
+        won = np.zeros(self.num_envs, dtype=bool)
+        if len(eaters):
+            self.food[eaters] = self.sample_food(eaters)
+            won[eaters] = self.food[eaters] < 0
+
+        done = died | won
+        result = {
+            "ate": ate,
+            "level_up": level_up,
+            "badge": badge,
+            "died": died,
+            "won": won,
+            "done": done,
+            "score": self.score.copy(),
+            "level": self.level.copy(),
+            "ticks": self.ticks.copy(),
+        }
+        self.reset(done)
+        return result
+
+    def highest_badge(self):
+        # Level of the highest badge each game holds (0 for none)
+        held = (self.badges[:, None] >> np.arange(len(self.badge_levels))) & 1
+        levels = np.where(held == 1, self.badge_levels, 0)
+        return levels.max(axis=1)
+
+    def observation(self):
+        # (num_envs, rows, cols) int8 boards of EMPTY/BODY/HEAD/FOOD
+        boards = self.occupied.astype(np.int8)
+        boards[self.index, self.head_y * self.cols + self.head_x] = HEAD
+        has_food = self.food >= 0
+        boards[self.index[has_food], self.food[has_food]] = FOOD
+        return boards.reshape(self.num_envs, self.rows, self.cols)
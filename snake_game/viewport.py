@@ -0,0 +1,449 @@
+"""Scrolling renderer for boards larger than the window.
+
+Only cells inside the viewport have canvas items, so the cost of a frame
+depends on the window size, not on the board area:
+
+* A Camera keeps the head inside a dead zone in the middle of the view and
+  scrolls by whole cells, clamped to the board edges.
+* Body items are keyed by cell.  A move recycles the tail item as the neck;
+  when the camera scrolls, every body item is shifted with one canvas.move()
+  and only items that left the view and cells on the edges that entered it
+  are touched.
+* Each cell remembers the serial number of the move that occupied it, so the
+  gradient colour of a cell entering the view is found without walking the
+  body.  After a move only the segments at colour boundaries are recoloured.
+* Walls of a level pack get rectangles only while in view, recycled the
+  same way as body items; WALLS_MOVED events touch only the cells that
+  change.
+* The minimap shows the board downsampled into blocks: per-block occupancy
+  counts change by one per move, and only blocks that become empty or
+  occupied touch their item.
+
+Like BoardRenderer, it interpolates the head and tail end between moves and
+only needs a Tk-compatible canvas object.
+"""
+from array import array
+from functools import lru_cache
+
+from .config import BOX_SIZE, HEIGHT, WIDTH
+from .engine import FOOD_MOVED, HEAD_ADDED, TAIL_REMOVED, WALLS_MOVED
+from .palette import (
+    EYES,
+    FOOD_COLOR,
+    FOOD_OUTLINE,
+    FOOD_PULSE,
+    HEAD_COLOR,
+    OUTLINE_COLOR,
+    WALL_COLOR,
+    WALL_OUTLINE,
+    body_color,
+)
+from .render import GRID_COLOR, slide
+
+MINIMAP_SIZE = 120  # Pixels along the longer board side
+MINIMAP_MARGIN = 8
+MINIMAP_BODY = "#66BB6A"
+MINIMAP_VIEW = "#FFFFFF"
+
+
+def fade_color(index, length):
+    # Same fade as palette.body_colors()
+    return body_color(max(0.4, 1.0 - (index / length) * 0.5))
+
+
+@lru_cache(maxsize=8)
+def fade_steps(length):
+    # (index, colour) where the body colour changes, like render.gradient_steps();
+    # the fade is monotonic, so each boundary is found by bisection instead of
+    # colouring every segment of a long body
+    steps = []
+    index = 1
+    color = fade_color(index, length)
+    while fade_color(length - 1, length) != color:
+        low, high = index, length - 1  # color(low) == color, color(high) != color
+        while high - low > 1:
+            middle = (low + high) // 2
+            if fade_color(middle, length) == color:
+                low = middle
+            else:
+                high = middle
+        index = high
+        color = fade_color(index, length)
+        steps.append((index, color))
+    return tuple(steps)
+
+
+def edges(old, new, size):
+    # Ranges of columns (or rows) that leave and enter a view of this size
+    # when it moves from old to new
+    if new >= old:
+        return range(old, min(new, old + size)), range(max(new, old + size), new + size)
+    return range(max(new + size, old), old + size), range(new, min(old, new + size))
+
+
+class Camera:
+    """Top-left cell of a view_cols x view_rows window onto the board."""
+
+    def __init__(self, cols, rows, view_cols, view_rows):
+        self.cols = cols
+        self.rows = rows
+        self.view_cols = min(view_cols, cols)
+        self.view_rows = min(view_rows, rows)
+        self.margin_x = self.view_cols // 3  # Dead zone is the middle third
+        self.margin_y = self.view_rows // 3
+        self.x = 0
+        self.y = 0
+
+    def clamp(self):
+        self.x = max(0, min(self.x, self.cols - self.view_cols))
+        self.y = max(0, min(self.y, self.rows - self.view_rows))
+
+    def center(self, cell):
+        self.x = cell[0] - self.view_cols // 2
+        self.y = cell[1] - self.view_rows // 2
+        self.clamp()
+
+    def follow(self, cell):
+        # Scroll just enough to keep cell inside the dead zone; returns the shift
+        old_x, old_y = self.x, self.y
+        x, y = cell
+        self.x = min(max(self.x, x - self.view_cols + 1 + self.margin_x), x - self.margin_x)
+        self.y = min(max(self.y, y - self.view_rows + 1 + self.margin_y), y - self.margin_y)
+        self.clamp()
+        return self.x - old_x, self.y - old_y
+
+    def contains(self, cell):
+        return 0 <= cell[0] - self.x < self.view_cols and 0 <= cell[1] - self.y < self.view_rows
+
+
+class ViewportRenderer:
+    def __init__(self, canvas, cols, rows, width=WIDTH, height=HEIGHT, box_size=BOX_SIZE):
+        self.canvas = canvas
+        self.cols = cols
+        self.rows = rows
+        self.box = box_size
+        self.camera = Camera(cols, rows, width // box_size, height // box_size)
+        self.item_coords = {}  # Last coordinates of the head, eye and food items
+        self.item_fills = {}
+        self.items = {}  # Visible body cell -> item
+        self.spares = []  # Hidden body items
+        self.wall_items = {}  # Visible wall cell -> item
+        self.wall_spares = []
+        self.serial = array("I", bytes(4 * cols * rows))  # Move number that occupied each cell
+        self.head_serial = 0
+        self.length = 0
+        self.food_cell = None
+        self.food_frame = 0
+        self.previous_head = None
+        self.vacated = None
+
+        view_width = self.camera.view_cols * box_size
+        view_height = self.camera.view_rows * box_size
+        for i in range(0, view_width, box_size):
+            canvas.create_line(i, 0, i, view_height, fill=GRID_COLOR, width=1, tags=("board", "grid"))
+        for i in range(0, view_height, box_size):
+            canvas.create_line(0, i, view_width, i, fill=GRID_COLOR, width=1, tags=("board", "grid"))
+
+        self.tail_item = canvas.create_rectangle(0, 0, 0, 0, outline=OUTLINE_COLOR, width=1, tags="board")
+        self.food_item = canvas.create_oval(0, 0, 0, 0, fill=FOOD_COLOR, outline=FOOD_OUTLINE, width=2, tags="board")
+        self.head_item = canvas.create_rectangle(0, 0, 0, 0, fill=HEAD_COLOR, outline=OUTLINE_COLOR, width=2,
+                                                 tags="board")
+        self.eye_items = [
+            canvas.create_oval(0, 0, 0, 0, fill="white", tags="board"),
+            canvas.create_oval(0, 0, 0, 0, fill="white", tags="board")
+        ]
+        self.build_minimap(width, height)
+
+    # ---------------- ITEM HELPERS ----------------
+    def set_coords(self, item, *coords):
+        if self.item_coords.get(item) != coords:
+            self.item_coords[item] = coords
+            self.canvas.coords(item, *coords)
+
+    def set_fill(self, item, color):
+        if self.item_fills.get(item) != color:
+            self.item_fills[item] = color
+            self.canvas.itemconfig(item, fill=color)
+
+    def cell_coords(self, cell):
+        x = (cell[0] - self.camera.x) * self.box
+        y = (cell[1] - self.camera.y) * self.box
+        return x, y, x + self.box, y + self.box
+
+    def segment_color(self, cell):
+        index = self.head_serial - self.serial[cell[1] * self.cols + cell[0]]
+        return fade_color(index, self.length)
+
+    def show_cell(self, cell, item=None):
+        if item is None:
+            if self.spares:
+                item = self.spares.pop()
+                self.canvas.itemconfig(item, state="normal")
+            else:
+                item = self.canvas.create_rectangle(0, 0, 0, 0, outline=OUTLINE_COLOR, width=1,
+                                                    tags=("board", "cells"))
+                self.canvas.tag_lower(item, self.head_item)
+        self.canvas.coords(item, *self.cell_coords(cell))
+        self.set_fill(item, self.segment_color(cell))
+        self.items[cell] = item
+
+    def hide_cell(self, cell):
+        item = self.items.pop(cell, None)
+        if item is not None:
+            self.canvas.itemconfig(item, state="hidden")
+            self.spares.append(item)
+
+    def show_wall(self, cell):
+        if cell in self.wall_items or not self.camera.contains(cell):
+            return
+        if self.wall_spares:
+            item = self.wall_spares.pop()
+            self.canvas.itemconfig(item, state="normal")
+        else:
+            item = self.canvas.create_rectangle(0, 0, 0, 0, fill=WALL_COLOR, outline=WALL_OUTLINE, width=1,
+                                                tags=("board", "walls"))
+            self.canvas.tag_lower(item, self.tail_item)
+        self.canvas.coords(item, *self.cell_coords(cell))
+        self.wall_items[cell] = item
+
+    def hide_wall(self, cell):
+        item = self.wall_items.pop(cell, None)
+        if item is not None:
+            self.canvas.itemconfig(item, state="hidden")
+            self.wall_spares.append(item)
+
+    def place_head(self, head):
+        self.set_coords(self.head_item, *self.cell_coords(head))
+
+    # ---------------- FULL REPAINT ----------------
+    def redraw(self, engine, frame=0):
+        snake = engine.snake
+        self.length = len(snake)
+        self.head_serial = self.length
+        for i, (x, y) in enumerate(snake):
+            self.serial[y * self.cols + x] = self.length - i
+
+        self.camera.center(snake[0])
+        for cell in list(self.items):
+            self.hide_cell(cell)
+        for i, cell in enumerate(snake):
+            if i and self.camera.contains(cell):
+                self.show_cell(cell)
+        self.place_head(snake[0])
+        for cell in list(self.wall_items):
+            self.hide_wall(cell)
+        camera = self.camera
+        for y in range(camera.y, camera.y + camera.view_rows):
+            for x in range(camera.x, camera.x + camera.view_cols):
+                if engine.is_wall(y * self.cols + x):
+                    self.show_wall((x, y))
+
+        self.counts = array("I", bytes(4 * len(self.counts)))
+        for cell in list(self.blocks):
+            self.hide_block(cell)
+        for cell in snake:
+            self.add_to_block(cell)
+        self.update_minimap_view()
+        self.previous_head = self.vacated = None
+        self.move_food(engine.food)
+        self.animate(engine, frame)
+
+    # ---------------- INCREMENTAL UPDATES ----------------
+    def apply(self, events, engine):
+        head = tail = None
+        food_moved = False
+        for event, value in events:
+            if event == HEAD_ADDED:
+                head = value
+            elif event == TAIL_REMOVED:
+                tail = value
+            elif event == FOOD_MOVED:
+                food_moved = True
+            elif event == WALLS_MOVED:
+                leaving, entering = value
+                for cell in leaving:
+                    self.hide_wall(cell)
+                for cell in entering:
+                    self.show_wall(cell)
+        if head is None:
+            return
+
+        snake = engine.snake
+        grew = len(snake) != self.length
+        self.length = len(snake)
+        self.previous_head = snake[1]
+        self.vacated = tail
+        self.head_serial += 1
+        self.serial[head[1] * self.cols + head[0]] = self.head_serial
+        self.add_to_block(head)
+
+        # The old head cell becomes the neck, reusing the tail item when there is one
+        recycled = None
+        if tail is not None:
+            self.remove_from_block(tail)
+            recycled = self.items.pop(tail, None)
+        self.show_cell(snake[1], recycled)
+
+        dx, dy = self.camera.follow(head)
+        if dx or dy:
+            self.scroll(dx, dy, engine)
+        self.place_head(head)
+
+        if grew:
+            # The whole gradient is stretched
+            for cell, item in self.items.items():
+                self.set_fill(item, self.segment_color(cell))
+        else:
+            # Every segment moved one index down, so only boundary segments change colour
+            items = self.items
+            for index, color in fade_steps(self.length):
+                item = items.get(snake[index])
+                if item is not None:
+                    self.set_fill(item, color)
+        if food_moved:
+            self.move_food(engine.food)
+
+    def scroll(self, dx, dy, engine):
+        # Only the columns and rows on the edges of the old and new view are scanned
+        camera = self.camera
+        old_x, old_y = camera.x - dx, camera.y - dy
+        self.canvas.move("cells", -dx * self.box, -dy * self.box)
+        self.canvas.move("walls", -dx * self.box, -dy * self.box)
+        leaving_x, entering_x = edges(old_x, camera.x, camera.view_cols)
+        leaving_y, entering_y = edges(old_y, camera.y, camera.view_rows)
+
+        old_rows = range(old_y, old_y + camera.view_rows)
+        old_cols = range(old_x, old_x + camera.view_cols)
+        for cell in [(x, y) for x in leaving_x for y in old_rows] + [(x, y) for y in leaving_y for x in old_cols]:
+            if cell in self.items:
+                self.hide_cell(cell)
+            if cell in self.wall_items:
+                self.hide_wall(cell)
+
+        # Body and wall cells that just came into view
+        rows = range(camera.y, camera.y + camera.view_rows)
+        cols = range(camera.x, camera.x + camera.view_cols)
+        entering = [(x, y) for x in entering_x for y in rows] + [(x, y) for y in entering_y for x in cols]
+        occupied = engine.occupied
+        head = engine.snake[0]
+        for cell in entering:
+            index = cell[1] * self.cols + cell[0]
+            if occupied[index] == 1 and cell != head and cell not in self.items:
+                self.show_cell(cell)
+            if engine.is_wall(index):
+                self.show_wall(cell)
+        self.update_minimap_view()
+
+    def move_food(self, cell):
+        self.food_cell = cell
+        if cell is None:
+            self.set_coords(self.minimap_food, 0, 0, 0, 0)
+        else:
+            x, y = self.minimap_point(cell)
+            self.set_coords(self.minimap_food, x - 2, y - 2, x + 2, y + 2)
+        self.animate_food()
+
+    # ---------------- MINIMAP ----------------
+    def build_minimap(self, width, height):
+        canvas = self.canvas
+        # Cells per minimap block, so the minimap fits in MINIMAP_SIZE pixels
+        self.block = -(-max(self.cols, self.rows) * 2 // MINIMAP_SIZE)
+        self.blocks_x = -(-self.cols // self.block)
+        self.blocks_y = -(-self.rows // self.block)
+        self.scale = min(MINIMAP_SIZE / self.cols, MINIMAP_SIZE / self.rows)
+        self.minimap_x = width - MINIMAP_MARGIN - self.cols * self.scale
+        self.minimap_y = height - MINIMAP_MARGIN - self.rows * self.scale
+        self.counts = array("I", bytes(4 * self.blocks_x * self.blocks_y))
+        self.blocks = {}  # Occupied block -> item
+        self.block_spares = []
+
+        canvas.create_rectangle(self.minimap_x - 1, self.minimap_y - 1,
+                                self.minimap_x + self.cols * self.scale + 1,
+                                self.minimap_y + self.rows * self.scale + 1,
+                                fill="#000000", outline="#333333", tags=("board", "minimap"))
+        self.minimap_view = canvas.create_rectangle(0, 0, 0, 0, outline=MINIMAP_VIEW, tags=("board", "minimap"))
+        self.minimap_food = canvas.create_oval(0, 0, 0, 0, fill=FOOD_COLOR, outline="", tags=("board", "minimap"))
+
+    def minimap_point(self, cell):
+        return (self.minimap_x + (cell[0] + 0.5) * self.scale,
+                self.minimap_y + (cell[1] + 0.5) * self.scale)
+
+    def add_to_block(self, cell):
+        index = cell[1] // self.block * self.blocks_x + cell[0] // self.block
+        self.counts[index] += 1
+        if self.counts[index] == 1:
+            self.show_block(index)
+
+    def remove_from_block(self, cell):
+        index = cell[1] // self.block * self.blocks_x + cell[0] // self.block
+        self.counts[index] -= 1
+        if self.counts[index] == 0:
+            self.hide_block(index)
+
+    def show_block(self, index):
+        bx, by = index % self.blocks_x, index // self.blocks_x
+        x1 = self.minimap_x + bx * self.block * self.scale
+        y1 = self.minimap_y + by * self.block * self.scale
+        x2 = self.minimap_x + min(self.cols, (bx + 1) * self.block) * self.scale
+        y2 = self.minimap_y + min(self.rows, (by + 1) * self.block) * self.scale
+        if self.block_spares:
+            item = self.block_spares.pop()
+            self.canvas.itemconfig(item, state="normal")
+        else:
+            item = self.canvas.create_rectangle(0, 0, 0, 0, fill=MINIMAP_BODY, outline="", tags=("board", "minimap"))
+            self.canvas.tag_lower(item, self.minimap_view)
+        self.canvas.coords(item, x1, y1, x2, y2)
+        self.blocks[index] = item
+
+    def hide_block(self, index):
+        item = self.blocks.pop(index, None)
+        if item is not None:
+            self.canvas.itemconfig(item, state="hidden")
+            self.block_spares.append(item)
+
+    def update_minimap_view(self):
+        camera = self.camera
+        self.set_coords(self.minimap_view,
+                        self.minimap_x + camera.x * self.scale,
+                        self.minimap_y + camera.y * self.scale,
+                        self.minimap_x + (camera.x + camera.view_cols) * self.scale,
+                        self.minimap_y + (camera.y + camera.view_rows) * self.scale)
+
+    # ---------------- PER-FRAME ANIMATION ----------------
+    def pulse_food(self, frame):
+        self.food_frame = frame % len(FOOD_PULSE)
+        self.animate_food()
+
+    def animate_food(self):
+        # Food outside the view is only shown on the minimap
+        if self.food_cell is None or not self.camera.contains(self.food_cell):
+            self.set_coords(self.food_item, 0, 0, 0, 0)
+            return
+        fx, fy = self.cell_coords(self.food_cell)[:2]
+        x1, y1, x2, y2 = FOOD_PULSE[self.food_frame]
+        self.set_coords(self.food_item, fx + x1, fy + y1, fx + x2, fy + y2)
+
+    def animate(self, engine, frame, alpha=1.0):
+        self.animate_food()
+        snake = engine.snake
+        box = self.box
+
+        head = snake[0]
+        dx, dy = slide(head, self.previous_head, alpha, box)
+        x, y = self.cell_coords(head)[:2]
+        x, y = x + dx, y + dy
+        self.set_coords(self.head_item, x, y, x + box, y + box)
+
+        tail = snake[-1]
+        if self.vacated is not None and alpha < 1.0 and self.camera.contains(tail):
+            tail_dx, tail_dy = slide(tail, self.vacated, alpha, box)
+            tail_x, tail_y = self.cell_coords(tail)[:2]
+            tail_x, tail_y = tail_x + tail_dx, tail_y + tail_dy
+            self.set_coords(self.tail_item, tail_x, tail_y, tail_x + box, tail_y + box)
+            self.set_fill(self.tail_item, fade_color(self.length - 1, self.length))
+        else:
+            self.set_coords(self.tail_item, 0, 0, 0, 0)
+
+        eye_frames = EYES[engine.direction]
+        for eye, (x1, y1, x2, y2) in zip(self.eye_items, eye_frames[frame % len(eye_frames)]):
+            self.set_coords(eye, x + x1, y + y1, x + x2, y + y2)
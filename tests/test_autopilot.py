@@ -0,0 +1,47 @@
+import unittest
+
+from snake_game.autopilot import pathfinder
+from snake_game.engine import SnakeEngine
+
+
+def moves(engine, ticks):
+    played = []
+    while engine.alive and engine.ticks < ticks:
+        direction = pathfinder(engine)
+        played.append(direction)
+        engine.step(direction)
+    return played
+
+
+class PathfinderTest(unittest.TestCase):
+    def test_games_do_not_share_planner_state(self):
+        alone = moves(SnakeEngine(seed=3), 300)
+
+        # The same game after another one, and interleaved with a third
+        moves(SnakeEngine(seed=9), 200)
+        engine, other = SnakeEngine(seed=3), SnakeEngine(seed=4)
+        played = []
+        while engine.alive and engine.ticks < 300:
+            direction = pathfinder(engine)
+            played.append(direction)
+            engine.step(direction)
+            if other.alive:
+                other.step(pathfinder(other))
+        self.assertEqual(played, alone)
+
+
+    def test_keeps_scoring_in_mazes(self):
+        # These games used to circle their tails for thousands of ticks
+        for seed in (23, 25):
+            engine = SnakeEngine(seed=seed, pack="maze")
+            last_meal = score = 0
+            while engine.alive and engine.ticks < 3000:
+                engine.step(pathfinder(engine))
+                if engine.score != score:
+                    score, last_meal = engine.score, engine.ticks
+            if engine.alive:
+                self.assertLess(engine.ticks - last_meal, 1000, f"seed {seed}")
+            self.assertGreater(engine.score, 20, f"seed {seed}")
+
+if __name__ == "__main__":
+    unittest.main()
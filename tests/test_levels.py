@@ -0,0 +1,93 @@
+import random
+import unittest
+
+from snake_game.engine import DIED, DIRECTIONS, SnakeEngine
+from snake_game.levels import OBSTACLE, PACKS
+from snake_game.policies import greedy
+
+
+def on_stage(engine, stage):
+    engine.stage, engine.phase = stage, 0
+    engine.load_walls()
+    engine.set_body(list(engine.snake))
+    engine.create_food()
+
+
+class WallsTest(unittest.TestCase):
+    def assertConsistent(self, engine):
+        # Every cell is body (1), wall (OBSTACLE) or free (0), and the free
+        # cells are exactly the ones marked 0
+        body = {y * engine.cols + x for x, y in engine.snake}
+        walls = {y * engine.cols + x for x, y in engine.wall_cells()}
+        self.assertEqual(len(body), len(engine.snake))
+        for index, value in enumerate(engine.occupied):
+            if index in body:
+                expected = 1
+            elif index in walls:
+                expected = OBSTACLE
+            else:
+                expected = 0
+            self.assertEqual(value, expected, f"cell {index}")
+            self.assertEqual(index in engine.free_cells, value == 0, f"cell {index}")
+            self.assertEqual(bool(engine.is_wall(index)), index in walls, f"cell {index}")
+        self.assertEqual(len(engine.free_cells), engine.occupied.count(0))
+        if engine.food is not None:
+            food = engine.food[1] * engine.cols + engine.food[0]
+            self.assertEqual(engine.occupied[food], 0)
+
+    def test_hitting_a_wall_ends_the_game(self):
+        engine = SnakeEngine(seed=0, pack="arena")
+        on_stage(engine, 1)  # Border
+        engine.set_body([(1, 3), (2, 3), (3, 3)])
+        engine.direction = "Left"
+        events = engine.step()
+        self.assertFalse(engine.alive)
+        self.assertIn((DIED, None), events)
+        self.assertEqual(engine.snake[0], (1, 3))
+
+    def test_food_is_never_on_a_wall(self):
+        for pack in PACKS:
+            engine = SnakeEngine(seed=1, pack=pack)
+            for stage in range(len(PACKS[pack])):
+                on_stage(engine, stage)
+                walls = set(engine.wall_cells())
+                for _ in range(500):
+                    engine.create_food()
+                    self.assertNotIn(engine.food, walls)
+
+    def test_change_stage(self):
+        for pack in PACKS:
+            engine = SnakeEngine(seed=2, pack=pack)
+            self.assertConsistent(engine)
+            for level in (3, 5, 7, 9, 12, 2, 1):
+                engine.level = level
+                engine.change_stage([])
+                self.assertEqual(engine.stage, engine.maps.stage_for_level(level))
+                self.assertConsistent(engine)
+
+    def test_move_walls(self):
+        # Sweepers move every tick on the last arena stage and cross the body
+        engine = SnakeEngine(seed=3, pack="arena")
+        on_stage(engine, len(PACKS["arena"]) - 1)
+        self.assertTrue(engine.maps.stage(engine.stage).period)
+        for _ in range(200):
+            engine.move_walls([])
+            self.assertConsistent(engine)
+
+    def test_games_stay_consistent(self):
+        # Seeded games through stage changes and moving walls
+        rng = random.Random(4)
+        for pack in PACKS:
+            for seed in range(3):
+                engine = SnakeEngine(seed=seed, pack=pack)
+                while engine.alive and engine.ticks < 400:
+                    direction = greedy(engine)
+                    if rng.random() < 0.05:
+                        direction = rng.choice(list(DIRECTIONS))
+                    engine.step(direction)
+                    if engine.ticks % 10 == 0 or not engine.alive:
+                        self.assertConsistent(engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
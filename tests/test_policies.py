@@ -0,0 +1,42 @@
+import unittest
+
+from snake_game.engine import DIRECTIONS, SnakeEngine
+from snake_game.policies import greedy, is_safe
+
+
+def target(engine, direction):
+    dx, dy = DIRECTIONS[direction]
+    x, y = engine.snake[0]
+    return x + dx, y + dy
+
+
+class GreedyTest(unittest.TestCase):
+    def test_walls_are_not_safe(self):
+        # Pillars stage of the arena pack: a 2x2 block starts at (4, 4)
+        engine = SnakeEngine(seed=0, pack="arena")
+        engine.stage = 2
+        engine.load_walls()
+        engine.set_body([(3, 4), (2, 4), (1, 4)])
+        self.assertTrue(engine.is_wall(4 * engine.cols + 4))
+        self.assertFalse(is_safe(engine, "Right"))
+
+        # The food lies straight ahead, behind the pillar
+        engine.food = (10, 4)
+        self.assertIn(greedy(engine), ("Up", "Down"))
+
+    def test_never_turns_into_a_wall(self):
+        for pack in ("arena", "maze"):
+            for seed in range(20):
+                engine = SnakeEngine(seed=seed, pack=pack)
+                while engine.alive and engine.ticks < 500:
+                    direction = greedy(engine)
+                    if direction is not None:
+                        x, y = target(engine, direction)
+                        if 0 <= x < engine.cols and 0 <= y < engine.rows:
+                            self.assertFalse(engine.is_wall(y * engine.cols + x),
+                                             f"{pack} seed {seed} tick {engine.ticks}")
+                    engine.step(direction)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import random
+import unittest
+
+from snake_game import snapshot
+from snake_game.engine import DIRECTIONS, SnakeEngine
+from snake_game.replay import Recorder, Replay, ReplayError, ReplayPlayer
+
+
+def record_game(engine, recorder, ticks, seed=0):
+    # Queues up to three turns at a time, so keyframes are taken with turns pending
+    rng = random.Random(seed)
+    states = {engine.ticks: snapshot.dumps(engine)}
+    while engine.alive and engine.ticks < ticks:
+        if rng.random() < 0.3:
+            for _ in range(rng.randint(1, 3)):
+                engine.change_direction(rng.choice(list(DIRECTIONS)))
+        engine.step()
+        recorder.record()
+        states[engine.ticks] = snapshot.dumps(engine)
+    return Replay(recorder.to_bytes()), states
+
+
+def played_state(engine):
+    # The game state without the queued turns, which a replay never has
+    engine = engine.clone()
+    engine.pending.clear()
+    return snapshot.dumps(engine)
+
+
+class SeekTest(unittest.TestCase):
+    def check_seek(self, replay, states):
+        straight = ReplayPlayer(replay)
+        for tick in range(replay.start_tick, replay.ticks + 1):
+            straight.seek(tick)
+            self.assertEqual(straight.engine.ticks, tick)
+            seeked = ReplayPlayer(replay).seek(tick)
+            self.assertEqual(snapshot.dumps(seeked), snapshot.dumps(straight.engine), f"tick {tick}")
+            original = snapshot.loads(states[tick])[0]
+            self.assertEqual(snapshot.dumps(seeked), played_state(original), f"tick {tick}")
+
+    def test_seek_matches_playback_with_queued_turns(self):
+        for seed in range(5):
+            engine = SnakeEngine(seed=seed)
+            replay, states = record_game(engine, Recorder(engine, seed, keyframe_interval=4), 300, seed)
+            self.assertTrue(len(replay.keyframes) > 1)
+            self.check_seek(replay, states)
+
+    def test_backward_seek(self):
+        engine = SnakeEngine(seed=7)
+        replay, states = record_game(engine, Recorder(engine, 7, keyframe_interval=4), 200, 7)
+        player = ReplayPlayer(replay)
+        for tick in (replay.ticks, 9, replay.ticks // 2, 3, 0):
+            self.assertEqual(snapshot.dumps(player.seek(tick)),
+                             played_state(snapshot.loads(states[tick])[0]))
+
+    def test_resumed_before_first_step(self):
+        # A game saved at tick 0 replays from its own state, not from seed 0
+        engine = SnakeEngine(seed=12345)
+        engine.change_direction("Up")
+        resumed = snapshot.loads(snapshot.dumps(engine))[0]
+        replay, states = record_game(resumed, Recorder(resumed), 200, 3)
+        self.assertEqual(replay.keyframes[0][0], 0)
+        self.check_seek(replay, states)
+
+    def test_resumed_mid_game(self):
+        engine = SnakeEngine(seed=5)
+        for _ in range(5):
+            engine.step()
+        resumed = snapshot.loads(snapshot.dumps(engine))[0]
+        replay, states = record_game(resumed, Recorder(resumed, keyframe_interval=4), 200, 5)
+        self.assertEqual(replay.start_tick, 5)
+        self.check_seek(replay, states)
+
+
+class ParseTest(unittest.TestCase):
+    def test_truncated_replay(self):
+        engine = SnakeEngine(seed=1)
+        recorder = Recorder(engine, 1, keyframe_interval=4)
+        record_game(engine, recorder, 100, 1)
+        data = recorder.to_bytes()
+        Replay(data)
+        for end in range(len(data)):
+            with self.assertRaises(ReplayError):
+                Replay(data[:end])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import random
+import unittest
+
+from snake_game import snapshot
+from snake_game.engine import SnakeEngine
+from snake_game.snapshot import SnapshotError
+
+
+def played_engine(pack=None, ticks=50):
+    engine = SnakeEngine(seed=0, pack=pack)
+    for _ in range(ticks):
+        if not engine.alive:
+            break
+        engine.step()
+    return engine
+
+
+class SnapshotTest(unittest.TestCase):
+    def test_round_trip(self):
+        for pack in (None, "arena", "maze"):
+            engine = played_engine(pack, 10)
+            data = snapshot.dumps(engine, frame=7)
+            restored, frame = snapshot.loads(data)
+            self.assertEqual(frame, 7)
+            self.assertEqual(snapshot.dumps(restored, frame=7), data)
+
+    def test_corrupted_input(self):
+        # Damaged data either loads or raises SnapshotError, never anything else
+        rng = random.Random(0)
+        for pack in (None, "arena"):
+            for compress in (False, True):
+                data = snapshot.dumps(played_engine(pack), compress=compress)
+                for _ in range(1000):
+                    damaged = bytearray(data)
+                    for _ in range(rng.randint(1, 4)):
+                        # Mostly the header, where every field is read
+                        limit = snapshot.HEADER.size if rng.random() < 0.7 else len(damaged)
+                        damaged[rng.randrange(limit)] = rng.randrange(256)
+                    try:
+                        snapshot.loads(bytes(damaged))
+                    except SnapshotError:
+                        pass
+
+    def test_truncated_input(self):
+        data = snapshot.dumps(played_engine(), compress=True)
+        for end in range(len(data)):
+            with self.assertRaises(SnapshotError):
+                snapshot.loads(data[:end])
+
+
+if __name__ == "__main__":
+    unittest.main()